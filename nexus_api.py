@@ -40,6 +40,7 @@ from prometheus_client import (
 )
 
 # Local imports from your Nexus stack
+from nexus_cache import get_cache_manager, register_cache_metrics
 from nexus_config import ConfigManager
 from nexus_widgets import Widget  # noqa: F401  # Ensure Widget is imported/registered
 
@@ -120,6 +121,9 @@ UP_GAUGE = Gauge(
 # Mark service as up on import
 UP_GAUGE.set(1.0)
 
+# Cache hit/miss/eviction counters, memory gauges and get/put latency
+register_cache_metrics(get_cache_manager())
+
 
 # ---------------------------------------------------------------------------
 # Data models
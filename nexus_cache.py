@@ -29,15 +29,466 @@ NEXUSPRO CACHE ENGINE v9.0
 Enterprise-Grade Caching with LRU, Object Pooling, TTL, and Memory Management
 """
 
+import os
+import sys
+import math
 import time
+import zlib
+import pickle
+import sqlite3
+import asyncio
 import threading
 import hashlib
+import heapq
+import struct
+import tempfile
 from collections import OrderedDict
-from typing import Any, Optional, Dict, List, Callable, Tuple
+from typing import (Any, Optional, Dict, List, Callable, Tuple, Iterable, Union,
+                    Generic, Hashable, Iterator, TypeVar)
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from functools import wraps
 import json
 
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # Python < 3.8
+    shared_memory = None
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+try:
+    import prometheus_client
+    from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+except ImportError:
+    prometheus_client = None
+
+# Callback receiving (operation, seconds) for every timed get/put
+LatencyObserver = Callable[[str, float], None]
+
+EVICTION_REASONS = ('size', 'memory', 'ttl')
+
+
+# Sentinel distinguishing "not cached" from a cached ``None`` result
+_MISSING = object()
+
+
+class _Negative:
+    """Marker returned for keys remembered as absent (see put_negative)"""
+    
+    def __repr__(self) -> str:
+        return 'NEGATIVE'
+    
+    def __reduce__(self):
+        # Unpickle to the module singleton so identity checks survive the
+        # shared-memory and disk tiers
+        return 'NEGATIVE'
+
+
+NEGATIVE = _Negative()
+
+# Nominal memory charge of a negative entry
+NEGATIVE_ENTRY_SIZE = 64
+
+
+# ============================================================================
+# SIZERS
+# ============================================================================
+
+# A sizer maps a cached value to an approximate byte cost used for eviction.
+# Sizers must not walk or stringify the value: put() calls them under the
+# cache lock, so their cost has to stay independent of the value's size.
+Sizer = Callable[[Any], int]
+
+
+def shallow_sizer(value: Any) -> int:
+    """Shallow size via sys.getsizeof (does not follow references)"""
+    try:
+        return sys.getsizeof(value)
+    except TypeError:
+        return 100  # Default estimate
+
+
+def bytes_sizer(value: Any) -> int:
+    """Size of bytes, bytearray or memoryview buffers"""
+    if isinstance(value, memoryview):
+        return value.nbytes
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    return shallow_sizer(value)
+
+
+def frame_sizer(value: Any) -> int:
+    """Size of a rendered frame (List[str]): list header plus each line"""
+    if isinstance(value, (list, tuple)):
+        getsizeof = sys.getsizeof
+        return getsizeof(value) + sum(getsizeof(line) for line in value)
+    return shallow_sizer(value)
+
+
+def deep_sizer(value: Any) -> int:
+    """Recursive size estimate (legacy behaviour, O(size) per call)"""
+    try:
+        if isinstance(value, (str, bytes)):
+            return len(value)
+        elif isinstance(value, (list, tuple)):
+            return sum(deep_sizer(item) for item in value)
+        elif isinstance(value, dict):
+            return sum(deep_sizer(k) + deep_sizer(v)
+                      for k, v in value.items())
+        else:
+            return len(str(value))
+    except Exception:
+        return 100  # Default estimate
+
+
+# ============================================================================
+# EVICTION POLICIES
+# ============================================================================
+
+class EvictionPolicy:
+    """Decides which resident key a cache evicts next.
+
+    The cache reports every insert, hit and removal; ``victim()`` picks a
+    resident key and forgets it (the cache then drops the entry). Before
+    making room for a new key the cache calls ``before_insert(key)``, so
+    policies whose victim depends on the incoming key can see it. Policies
+    are not thread-safe on their own and are always called under the
+    owning cache's lock.
+    """
+    
+    name = "base"
+    
+    def __init__(self, capacity: int):
+        self.capacity = max(1, capacity)
+    
+    def before_insert(self, key: Any):
+        """Called before any victim() made to admit key"""
+    
+    def on_insert(self, key: Any):
+        raise NotImplementedError
+    
+    def on_hit(self, key: Any):
+        raise NotImplementedError
+    
+    def on_remove(self, key: Any):
+        raise NotImplementedError
+    
+    def victim(self) -> Any:
+        raise NotImplementedError
+    
+    def clear(self):
+        raise NotImplementedError
+
+
+class LRUPolicy(EvictionPolicy):
+    """Least recently used"""
+    
+    name = "lru"
+    
+    def __init__(self, capacity: int):
+        super().__init__(capacity)
+        self.order: OrderedDict = OrderedDict()
+    
+    def on_insert(self, key: Any):
+        self.order[key] = None
+    
+    def on_hit(self, key: Any):
+        self.order.move_to_end(key)
+    
+    def on_remove(self, key: Any):
+        self.order.pop(key, None)
+    
+    def victim(self) -> Any:
+        return self.order.popitem(last=False)[0]
+    
+    def clear(self):
+        self.order.clear()
+
+
+class LFUPolicy(EvictionPolicy):
+    """Least frequently used, LRU among equal counts, O(1) per operation"""
+    
+    name = "lfu"
+    
+    def __init__(self, capacity: int):
+        super().__init__(capacity)
+        self.freq: Dict[Any, int] = {}
+        self.buckets: Dict[int, OrderedDict] = {}
+        self.min_freq = 0
+    
+    def _unlink(self, key: Any, count: int):
+        bucket = self.buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self.buckets[count]
+            if self.min_freq == count:
+                self.min_freq = count + 1
+    
+    def on_insert(self, key: Any):
+        self.freq[key] = 1
+        self.buckets.setdefault(1, OrderedDict())[key] = None
+        self.min_freq = 1
+    
+    def on_hit(self, key: Any):
+        count = self.freq[key]
+        self._unlink(key, count)
+        self.freq[key] = count + 1
+        self.buckets.setdefault(count + 1, OrderedDict())[key] = None
+    
+    def on_remove(self, key: Any):
+        count = self.freq.pop(key, None)
+        if count is not None:
+            self._unlink(key, count)
+            if self.freq and self.min_freq not in self.buckets:
+                self.min_freq = min(self.buckets)
+    
+    def victim(self) -> Any:
+        if self.min_freq not in self.buckets:
+            self.min_freq = min(self.buckets)
+        key = next(iter(self.buckets[self.min_freq]))
+        self.on_remove(key)
+        return key
+    
+    def clear(self):
+        self.freq.clear()
+        self.buckets.clear()
+        self.min_freq = 0
+
+
+class ARCPolicy(EvictionPolicy):
+    """Adaptive Replacement Cache (Megiddo & Modha)
+
+    T1 holds keys seen once recently, T2 keys seen at least twice. Ghost
+    lists B1/B2 remember keys recently evicted from each, and hits on a
+    ghost shift the target size ``p`` of T1 towards whichever list would
+    have kept it. A one-off scan only ever fills T1, so it cannot flush
+    the frequently used keys in T2.
+
+    The directory keeps the paper's bounds: |T1| + |B1| <= c and
+    |T1| + |T2| + |B1| + |B2| <= 2c, and victim() follows its REPLACE rule.
+    """
+    
+    name = "arc"
+    
+    def __init__(self, capacity: int):
+        super().__init__(capacity)
+        self.p = 0.0
+        self.t1: OrderedDict = OrderedDict()
+        self.t2: OrderedDict = OrderedDict()
+        self.b1: OrderedDict = OrderedDict()
+        self.b2: OrderedDict = OrderedDict()
+        # Ghost list the key being admitted came from ('b1', 'b2' or None)
+        self._admitting: Optional[str] = None
+    
+    def before_insert(self, key: Any):
+        """Adapt p on a ghost hit, or make directory room for a new key"""
+        if key in self.b1:
+            self.p = min(self.capacity, self.p + max(len(self.b2) / len(self.b1), 1))
+            del self.b1[key]
+            self._admitting = 'b1'
+        elif key in self.b2:
+            self.p = max(0.0, self.p - max(len(self.b1) / len(self.b2), 1))
+            del self.b2[key]
+            self._admitting = 'b2'
+        else:
+            self._admitting = None
+            if len(self.t1) + len(self.b1) >= self.capacity:
+                # With B1 empty, T1 alone fills the cache; the ghost its
+                # victim leaves behind is trimmed again on insert
+                if self.b1:
+                    self.b1.popitem(last=False)
+            elif self._directory_size() >= 2 * self.capacity:
+                self.b2.popitem(last=False)
+    
+    def _directory_size(self) -> int:
+        return len(self.t1) + len(self.t2) + len(self.b1) + len(self.b2)
+    
+    def _trim_ghosts(self):
+        """Restore |T1| + |B1| <= c and a directory of at most 2c keys"""
+        while self.b1 and len(self.t1) + len(self.b1) > self.capacity:
+            self.b1.popitem(last=False)
+        while self._directory_size() > 2 * self.capacity and (self.b1 or self.b2):
+            (self.b2 or self.b1).popitem(last=False)
+    
+    def on_insert(self, key: Any):
+        if self._admitting is None and (key in self.b1 or key in self.b2):
+            self.before_insert(key)  # Caller skipped before_insert
+        if self._admitting is not None:
+            self.t2[key] = None
+        else:
+            self.t1[key] = None
+        self._admitting = None
+        self._trim_ghosts()
+    
+    def on_hit(self, key: Any):
+        if key in self.t1:
+            del self.t1[key]
+        else:
+            del self.t2[key]
+        self.t2[key] = None
+    
+    def on_remove(self, key: Any):
+        self.t1.pop(key, None)
+        self.t2.pop(key, None)
+    
+    def victim(self) -> Any:
+        # REPLACE: take T1's LRU while T1 exceeds its target p (or meets it
+        # when the incoming key is a B2 ghost hit), otherwise T2's LRU
+        if self.t1 and (len(self.t1) > self.p or not self.t2 or
+                        (self._admitting == 'b2' and len(self.t1) == self.p)):
+            key, ghosts = self.t1.popitem(last=False)[0], self.b1
+        else:
+            key, ghosts = self.t2.popitem(last=False)[0], self.b2
+        ghosts[key] = None
+        self._trim_ghosts()
+        return key
+    
+    def clear(self):
+        self.p = 0.0
+        self._admitting = None
+        for lst in (self.t1, self.t2, self.b1, self.b2):
+            lst.clear()
+
+
+class CountMinSketch:
+    """4-bit count-min frequency sketch with periodic aging"""
+    
+    DEPTH = 4
+    MAX_COUNT = 15
+    _SEEDS = (0x9E3779B1, 0x85EBCA77, 0xC2B2AE3D, 0x27D4EB2F)
+    
+    def __init__(self, capacity: int):
+        width = 16
+        while width < capacity:
+            width <<= 1
+        self.mask = width - 1
+        self.rows = [bytearray(width) for _ in range(self.DEPTH)]
+        self.sample_size = 10 * max(1, capacity)
+        self.additions = 0
+    
+    def _indexes(self, key: Any):
+        h = hash(key)
+        return [((h ^ seed) * 0x9E3779B97F4A7C15 >> 17) & self.mask for seed in self._SEEDS]
+    
+    def increment(self, key: Any):
+        for row, i in zip(self.rows, self._indexes(key)):
+            if row[i] < self.MAX_COUNT:
+                row[i] += 1
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self._age()
+    
+    def estimate(self, key: Any) -> int:
+        return min(row[i] for row, i in zip(self.rows, self._indexes(key)))
+    
+    def _age(self):
+        """Halve every counter so old popularity decays"""
+        self.rows = [bytearray(c >> 1 for c in row) for row in self.rows]
+        self.additions //= 2
+    
+    def clear(self):
+        for row in self.rows:
+            row[:] = bytes(len(row))
+        self.additions = 0
+
+
+class TinyLFUPolicy(EvictionPolicy):
+    """W-TinyLFU (Einziger, Friedman & Manes)
+
+    New keys enter a small LRU window (1% of capacity). A key pushed out
+    of a full window only joins the segmented-LRU main region if the
+    count-min sketch says it is used more often than the main region's
+    own eviction candidate; otherwise the newcomer is the one evicted.
+    Scans therefore churn through the window without touching the hot set.
+    """
+    
+    name = "tinylfu"
+    
+    def __init__(self, capacity: int):
+        super().__init__(capacity)
+        self.window_cap = max(1, self.capacity // 100)
+        main_cap = max(1, self.capacity - self.window_cap)
+        self.protected_cap = max(1, int(main_cap * 0.8))
+        self.sketch = CountMinSketch(self.capacity)
+        self.window: OrderedDict = OrderedDict()
+        self.probation: OrderedDict = OrderedDict()
+        self.protected: OrderedDict = OrderedDict()
+    
+    def on_insert(self, key: Any):
+        self.sketch.increment(key)
+        self.window[key] = None
+        # Below capacity the main region has room, so overflow moves over
+        # without competing
+        while len(self.window) > self.window_cap:
+            self.probation[self.window.popitem(last=False)[0]] = None
+    
+    def on_hit(self, key: Any):
+        self.sketch.increment(key)
+        if key in self.window:
+            self.window.move_to_end(key)
+        elif key in self.probation:
+            del self.probation[key]
+            self.protected[key] = None
+            if len(self.protected) > self.protected_cap:
+                self.probation[self.protected.popitem(last=False)[0]] = None
+        else:
+            self.protected.move_to_end(key)
+    
+    def on_remove(self, key: Any):
+        for segment in (self.window, self.probation, self.protected):
+            if segment.pop(key, _MISSING) is not _MISSING:
+                return
+    
+    def _main_victim(self) -> Any:
+        for segment in (self.probation, self.protected):
+            if segment:
+                return next(iter(segment))
+        return _MISSING
+    
+    def victim(self) -> Any:
+        main_victim = self._main_victim()
+        if self.window and (len(self.window) >= self.window_cap or main_victim is _MISSING):
+            candidate = next(iter(self.window))
+            if (main_victim is not _MISSING and
+                    self.sketch.estimate(candidate) > self.sketch.estimate(main_victim)):
+                # Candidate wins admission: it takes the main victim's place
+                del self.window[candidate]
+                self.on_remove(main_victim)
+                self.probation[candidate] = None
+                return main_victim
+            del self.window[candidate]
+            return candidate
+        self.on_remove(main_victim)
+        return main_victim
+    
+    def clear(self):
+        self.sketch.clear()
+        self.window.clear()
+        self.probation.clear()
+        self.protected.clear()
+
+
+EVICTION_POLICIES: Dict[str, Callable[[int], EvictionPolicy]] = {
+    'lru': LRUPolicy,
+    'lfu': LFUPolicy,
+    'arc': ARCPolicy,
+    'tinylfu': TinyLFUPolicy,
+}
+
+
+def make_policy(policy: Union[str, EvictionPolicy], capacity: int) -> EvictionPolicy:
+    """Resolve a policy name (see EVICTION_POLICIES) or pass an instance through"""
+    if isinstance(policy, EvictionPolicy):
+        return policy
+    try:
+        return EVICTION_POLICIES[policy](capacity)
+    except KeyError:
+        raise ValueError(f"Unknown eviction policy: {policy}") from None
+
 
 # ============================================================================
 # LRU CACHE WITH TTL
@@ -50,120 +501,396 @@ class CacheEntry:
     timestamp: float
     access_count: int = 0
     size_bytes: int = 0
+    expires_at: Optional[float] = None
 
 
 class LRUCache:
-    """Thread-safe LRU cache with TTL and size management"""
+    """Thread-safe LRU cache with TTL and size management
+
+    Eviction order comes from a pluggable EvictionPolicy (``policy`` is a
+    name from EVICTION_POLICIES or an instance); LRU is the default.
+
+    Expiring entries are also tracked in a min-heap ordered by deadline.
+    Every get/put pops whatever has already expired off the top of the
+    heap, so expired entries release their memory without having to be
+    read again; each heap item is pushed and popped once, which keeps the
+    extra work amortized O(1) per operation.
+
+    put_negative() remembers that a key has no value for ``negative_ttl``
+    seconds; get() then returns NEGATIVE so callers can skip the backing
+    store. get_many()/put_many() take the lock once per batch.
+    """
     
     def __init__(self, max_size: int = 100, ttl_seconds: Optional[float] = None, 
-                 max_memory_mb: float = 10.0):
+                 max_memory_mb: float = 10.0, sizer: Optional[Sizer] = None,
+                 l2: Optional["DiskCache"] = None,
+                 policy: Union[str, EvictionPolicy] = "lru",
+                 negative_ttl: float = 5.0):
         self.max_size = max_size
         self.ttl = ttl_seconds
+        self.negative_ttl = negative_ttl
         self.max_memory = max_memory_mb * 1024 * 1024  # Convert to bytes
-        self.cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        self.sizer: Sizer = sizer or shallow_sizer
+        self.l2 = l2
+        self.l2_hits = 0
+        self.policy = make_policy(policy, max_size)
+        self.cache: Dict[str, CacheEntry] = {}
         self.lock = threading.RLock()
         self.hits = 0
         self.misses = 0
         self.evictions = 0
+        self.expirations = 0
+        self.evictions_by_reason: Dict[str, int] = dict.fromkeys(EVICTION_REASONS, 0)
+        self.negative_hits = 0
         self.current_memory = 0
+        self.observe: Optional[LatencyObserver] = None
+        self._expiry_heap: List[Tuple[float, int, str]] = []
+        self._expiry_seq = 0
+        # Bumped by invalidate()/clear(); a disk read that raced one of them
+        # must not be promoted back into memory
+        self._invalidations = 0
+        self._reaper: Optional["TTLReaper"] = None
     
     def _estimate_size(self, value: Any) -> int:
-        """Estimate memory size of value"""
+        """Estimate memory size of value with the configured sizer"""
         try:
-            if isinstance(value, (str, bytes)):
-                return len(value)
-            elif isinstance(value, (list, tuple)):
-                return sum(self._estimate_size(item) for item in value)
-            elif isinstance(value, dict):
-                return sum(self._estimate_size(k) + self._estimate_size(v) 
-                          for k, v in value.items())
-            else:
-                return len(str(value))
-        except:
+            return self.sizer(value)
+        except Exception:
             return 100  # Default estimate
     
-    def _is_expired(self, entry: CacheEntry) -> bool:
+    def _is_expired(self, entry: CacheEntry, now: Optional[float] = None) -> bool:
         """Check if cache entry has expired"""
-        if self.ttl is None:
+        if entry.expires_at is None:
             return False
-        return (time.time() - entry.timestamp) > self.ttl
+        return (now if now is not None else time.time()) >= entry.expires_at
+    
+    def _remove(self, key: str) -> Optional[CacheEntry]:
+        """Remove entry and release its memory charge"""
+        entry = self.cache.pop(key, None)
+        if entry is not None:
+            self.current_memory -= entry.size_bytes
+            self.policy.on_remove(key)
+        return entry
+    
+    def _schedule_expiry(self, key: str, expires_at: float):
+        """Add entry deadline to the expiry heap"""
+        self._expiry_seq += 1
+        heapq.heappush(self._expiry_heap, (expires_at, self._expiry_seq, key))
+        # Overwritten or evicted keys leave stale heap items behind; rebuild
+        # once they dominate so the heap stays proportional to live entries.
+        if len(self._expiry_heap) > 2 * len(self.cache) + 64:
+            live = [(entry.expires_at, k) for k, entry in self.cache.items()
+                    if entry.expires_at is not None]
+            seq = self._expiry_seq
+            self._expiry_heap = [(expires_at, seq + i, k)
+                                 for i, (expires_at, k) in enumerate(live, 1)]
+            self._expiry_seq = seq + len(live)
+            heapq.heapify(self._expiry_heap)
     
-    def _evict_lru(self):
-        """Evict least recently used item"""
+    def _reap_expired(self, now: float) -> int:
+        """Drop every entry whose deadline has passed"""
+        heap = self._expiry_heap
+        reclaimed = 0
+        while heap and heap[0][0] <= now:
+            expires_at, _, key = heapq.heappop(heap)
+            entry = self.cache.get(key)
+            # Skip stale heap items for keys that were re-put or evicted
+            if entry is not None and entry.expires_at == expires_at:
+                self._remove(key)
+                self.expirations += 1
+                self.evictions_by_reason['ttl'] += 1
+                reclaimed += 1
+        return reclaimed
+    
+    def expire(self) -> int:
+        """Reclaim all expired entries now, returning how many were dropped"""
+        with self.lock:
+            return self._reap_expired(time.time())
+    
+    def start_reaper(self, interval: float = 1.0) -> "TTLReaper":
+        """Start a background thread that calls expire() every interval"""
+        with self.lock:
+            if self._reaper is None or not self._reaper.is_alive():
+                self._reaper = TTLReaper(self.expire, interval=interval)
+                self._reaper.start()
+            return self._reaper
+    
+    def stop_reaper(self):
+        """Stop the background reaper thread if running"""
+        reaper, self._reaper = self._reaper, None
+        if reaper is not None:
+            reaper.stop()
+    
+    def _evict_one(self, reason: str = 'size'):
+        """Evict the entry chosen by the eviction policy"""
         if not self.cache:
             return
         
         with self.lock:
-            key, entry = self.cache.popitem(last=False)
+            entry = self.cache.pop(self.policy.victim())
             self.current_memory -= entry.size_bytes
             self.evictions += 1
+            self.evictions_by_reason[reason] += 1
     
     def _evict_to_fit(self, size_needed: int):
         """Evict items until we have enough memory"""
         while self.current_memory + size_needed > self.max_memory and self.cache:
-            self._evict_lru()
+            self._evict_one('memory')
+    
+    def set_latency_observer(self, observe: Optional[LatencyObserver]):
+        """Time every get/put and report it to observe (None disables)"""
+        self.observe = observe
     
-    def get(self, key: str) -> Optional[Any]:
-        """Get value from cache"""
+    def get(self, key: str, default: Any = None) -> Optional[Any]:
+        """Get value from cache, or default on a miss"""
+        if self.observe is None:
+            return self._get(key, default)
+        start = time.perf_counter()
+        try:
+            return self._get(key, default)
+        finally:
+            self.observe('get', time.perf_counter() - start)
+    
+    def _get(self, key: str, default: Any) -> Optional[Any]:
         with self.lock:
-            if key not in self.cache:
-                self.misses += 1
-                return None
+            now = time.time()
+            self._reap_expired(now)
             
-            entry = self.cache[key]
+            entry = self.cache.get(key)
+            if entry is not None:
+                return self._hit(key, entry)
             
-            # Check if expired
-            if self._is_expired(entry):
-                self.cache.pop(key)
-                self.current_memory -= entry.size_bytes
+            if self.l2 is None:
                 self.misses += 1
-                return None
-            
-            # Move to end (most recently used)
-            self.cache.move_to_end(key)
-            entry.access_count += 1
+                return default
+            invalidations = self._invalidations
+        
+        # Fall through to the disk tier outside the lock
+        value, expires_at = self.l2.get_with_expiry(key, _MISSING)
+        if value is _MISSING:
+            with self.lock:
+                self.misses += 1
+            return default
+        size = self._estimate_size(value)
+        with self.lock:
+            return self._promote(key, value, size, expires_at, invalidations)
+    
+    def _promote(self, key: str, value: Any, size: int, expires_at: Optional[float],
+                 invalidations: int) -> Any:
+        """Move a disk hit into memory (lock held), returning the live value
+        
+        A put() that landed while the disk was read wins over the older
+        disk value, and nothing is promoted if the cache was invalidated
+        meanwhile. The entry keeps the disk record's remaining TTL.
+        """
+        now = time.time()
+        self._reap_expired(now)
+        entry = self.cache.get(key)
+        if entry is not None:
+            return self._hit(key, entry)
+        self.hits += 1
+        self.l2_hits += 1
+        if invalidations == self._invalidations:
+            ttl = None if expires_at is None else max(0.0, expires_at - now)
+            self._store_locked(key, value, size, ttl, now)
+        return value
+    
+    def _hit(self, key: str, entry: CacheEntry) -> Any:
+        """Record a hit on a live entry (lock held)"""
+        self.policy.on_hit(key)
+        entry.access_count += 1
+        if entry.value is NEGATIVE:
+            self.negative_hits += 1
+        else:
             self.hits += 1
-            return entry.value
+        return entry.value
     
-    def put(self, key: str, value: Any):
-        """Put value in cache"""
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Look up a batch of keys under a single lock acquisition
+
+        Returns a dict holding only the keys that were found; keys
+        remembered by put_negative() map to NEGATIVE. Misses fall through
+        to the disk tier, if any, after the lock is released.
+        """
+        if self.observe is None:
+            return self._get_many(keys)
+        start = time.perf_counter()
+        try:
+            return self._get_many(keys)
+        finally:
+            self.observe('get', time.perf_counter() - start)
+    
+    def _get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        found: Dict[str, Any] = {}
+        missed: List[str] = []
         with self.lock:
-            # Calculate size
+            self._reap_expired(time.time())
+            for key in keys:
+                entry = self.cache.get(key)
+                if entry is not None:
+                    found[key] = self._hit(key, entry)
+                else:
+                    missed.append(key)
+            if self.l2 is None:
+                self.misses += len(missed)
+                return found
+            invalidations = self._invalidations
+        
+        promoted: List[Tuple[str, Any, int, Optional[float]]] = []
+        for key in missed:
+            value, expires_at = self.l2.get_with_expiry(key, _MISSING)
+            if value is not _MISSING:
+                promoted.append((key, value, self._estimate_size(value), expires_at))
+        with self.lock:
+            self.misses += len(missed) - len(promoted)
+            for key, value, size, expires_at in promoted:
+                found[key] = self._promote(key, value, size, expires_at, invalidations)
+        return found
+    
+    def put(self, key: str, value: Any, size: Optional[int] = None,
+            ttl: Optional[float] = None):
+        """Put value in cache
+
+        ``size`` is an optional caller-supplied byte cost; when given the
+        sizer is skipped entirely. ``ttl`` overrides the cache-wide TTL for
+        this entry.
+        """
+        if self.observe is None:
+            return self._put(key, value, size, ttl)
+        start = time.perf_counter()
+        try:
+            return self._put(key, value, size, ttl)
+        finally:
+            self.observe('put', time.perf_counter() - start)
+    
+    def _put(self, key: str, value: Any, size: Optional[int], ttl: Optional[float]):
+        # Calculate size outside the lock
+        if size is None:
             size = self._estimate_size(value)
-            
-            # Remove old entry if exists
-            if key in self.cache:
-                old_entry = self.cache.pop(key)
-                self.current_memory -= old_entry.size_bytes
-            
-            # Evict to fit new entry
-            self._evict_to_fit(size)
-            
-            # Evict if over max size
-            while len(self.cache) >= self.max_size:
-                self._evict_lru()
-            
-            # Add new entry
-            entry = CacheEntry(
-                value=value,
-                timestamp=time.time(),
-                size_bytes=size
-            )
-            self.cache[key] = entry
-            self.current_memory += size
+        
+        self._store(key, value, size, ttl)
+        if self.l2 is not None:
+            self.l2.put(key, value, ttl=self.ttl if ttl is None else ttl)
+    
+    def put_many(self, items: Union[Dict[str, Any], Iterable[Tuple[str, Any]]],
+                 ttl: Optional[float] = None):
+        """Insert a batch of (key, value) pairs under a single lock acquisition"""
+        if self.observe is None:
+            return self._put_many(items, ttl)
+        start = time.perf_counter()
+        try:
+            return self._put_many(items, ttl)
+        finally:
+            self.observe('put', time.perf_counter() - start)
+    
+    def _put_many(self, items: Union[Dict[str, Any], Iterable[Tuple[str, Any]]],
+                  ttl: Optional[float]):
+        pairs = list(items.items() if isinstance(items, dict) else items)
+        # Size every value before taking the lock
+        sized = [(key, value, self._estimate_size(value)) for key, value in pairs]
+        with self.lock:
+            now = time.time()
+            self._reap_expired(now)
+            for key, value, size in sized:
+                self._store_locked(key, value, size, ttl, now)
+        if self.l2 is not None:
+            self.l2.put_many(pairs, ttl=self.ttl if ttl is None else ttl)
+    
+    def put_negative(self, key: str, ttl: Optional[float] = None):
+        """Remember that key has no value for ttl (default negative_ttl) seconds
+
+        Negative entries live only in memory and are replaced by the next
+        put() of the key. Any disk copy is deleted, so an old value cannot
+        resurface once the negative entry expires.
+        """
+        if self.l2 is not None:
+            self.l2.delete(key)
+        self._store(key, NEGATIVE, NEGATIVE_ENTRY_SIZE,
+                    self.negative_ttl if ttl is None else ttl)
+    
+    def put_negative_many(self, keys: Iterable[str], ttl: Optional[float] = None):
+        """Remember a batch of absent keys under a single lock acquisition"""
+        ttl = self.negative_ttl if ttl is None else ttl
+        keys = list(keys)
+        if self.l2 is not None:
+            self.l2.delete_many(keys)
+        with self.lock:
+            now = time.time()
+            self._reap_expired(now)
+            for key in keys:
+                self._store_locked(key, NEGATIVE, NEGATIVE_ENTRY_SIZE, ttl, now)
+    
+    def invalidate(self, key: str):
+        """Drop key from every tier (positive or negative entry)"""
+        # Disk first: a concurrent get() that still read the old record
+        # sees the bumped counter and does not promote it
+        if self.l2 is not None:
+            self.l2.delete(key)
+        with self.lock:
+            self._invalidations += 1
+            self._remove(key)
+    
+    def _store(self, key: str, value: Any, size: int, ttl: Optional[float]):
+        """Insert entry into the in-memory tier"""
+        with self.lock:
+            now = time.time()
+            self._reap_expired(now)
+            self._store_locked(key, value, size, ttl, now)
+    
+    def _store_locked(self, key: str, value: Any, size: int, ttl: Optional[float],
+                      now: float):
+        """Insert entry into the in-memory tier (lock held, heap reaped)"""
+        # Remove old entry if exists
+        self._remove(key)
+        self.policy.before_insert(key)
+        
+        # Evict to fit new entry
+        self._evict_to_fit(size)
+        
+        # Evict if over max size
+        while len(self.cache) >= self.max_size:
+            self._evict_one()
+        
+        # Add new entry
+        ttl = self.ttl if ttl is None else ttl
+        entry = CacheEntry(
+            value=value,
+            timestamp=now,
+            size_bytes=size,
+            expires_at=(now + ttl) if ttl is not None else None
+        )
+        self.cache[key] = entry
+        self.policy.on_insert(key)
+        self.current_memory += size
+        if entry.expires_at is not None:
+            self._schedule_expiry(key, entry.expires_at)
     
     def clear(self):
-        """Clear all cache entries"""
+        """Clear all cache entries, including the disk tier"""
+        if self.l2 is not None:
+            self.l2.clear()
+        self._clear_memory()
+    
+    def _clear_memory(self):
+        """Clear the in-memory tier and reset counters"""
         with self.lock:
+            self._invalidations += 1
             self.cache.clear()
+            self.policy.clear()
+            self._expiry_heap.clear()
             self.current_memory = 0
             self.hits = 0
             self.misses = 0
             self.evictions = 0
+            self.expirations = 0
+            self.evictions_by_reason = dict.fromkeys(EVICTION_REASONS, 0)
+            self.negative_hits = 0
+            self.l2_hits = 0
     
     def stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
         with self.lock:
+            self._reap_expired(time.time())
             total_requests = self.hits + self.misses
             hit_rate = (self.hits / total_requests * 100) if total_requests > 0 else 0
             
@@ -172,38 +899,1081 @@ class LRUCache:
                 'max_size': self.max_size,
                 'memory_mb': self.current_memory / (1024 * 1024),
                 'max_memory_mb': self.max_memory / (1024 * 1024),
+                'memory_bytes': self.current_memory,
                 'hits': self.hits,
                 'misses': self.misses,
                 'hit_rate_percent': round(hit_rate, 2),
                 'evictions': self.evictions,
+                'evictions_by_reason': dict(self.evictions_by_reason),
+                'expirations': self.expirations,
+                'negative_hits': self.negative_hits,
+                'l2_hits': self.l2_hits,
+                'policy': self.policy.name,
                 'ttl_seconds': self.ttl
             }
 
 
+class TTLReaper(threading.Thread):
+    """Daemon thread that periodically reclaims expired cache entries"""
+    
+    def __init__(self, expire: Callable[[], int], interval: float = 1.0):
+        super().__init__(name="nexus-cache-reaper", daemon=True)
+        self.expire = expire
+        self.interval = interval
+        self.reclaimed = 0
+        self._stop_event = threading.Event()
+    
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            self.reclaimed += self.expire()
+    
+    def stop(self, timeout: Optional[float] = None):
+        """Signal the thread to exit and wait for it"""
+        self._stop_event.set()
+        if self is not threading.current_thread():
+            self.join(timeout)
+
+
+# ============================================================================
+# PERSISTENT L2 CACHE (DISK)
+# ============================================================================
+
+DEFAULT_CACHE_DIR = "~/.nexus/cache"
+
+
+class DiskCache:
+    """Persistent second-tier cache stored in a local SQLite file
+
+    Values are pickled and stored with a CRC32 checksum; records that fail
+    verification are dropped and reported as misses. Several caches can
+    share one file through ``namespace``. Once the namespace grows past
+    ``max_disk_mb`` the least recently accessed records are compacted away.
+    Disk errors never propagate: the tier degrades to a miss instead.
+    """
+    
+    def __init__(self, namespace: str = "default", cache_dir: str = DEFAULT_CACHE_DIR,
+                 max_disk_mb: float = 64.0, compact_every: int = 256,
+                 filename: str = "l2.sqlite3"):
+        self.namespace = namespace
+        self.cache_dir = os.path.expanduser(cache_dir)
+        self.db_path = os.path.join(self.cache_dir, filename)
+        self.max_disk = max_disk_mb * 1024 * 1024
+        self.compact_every = compact_every
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.corrupt = 0
+        self.errors = 0
+        self.compactions = 0
+        self._writes_since_compact = 0
+        
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path, timeout=5.0, check_same_thread=False)
+        with self.lock:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS cache_entries (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value BLOB NOT NULL,
+                    checksum INTEGER NOT NULL,
+                    size_bytes INTEGER NOT NULL,
+                    expires_at REAL,
+                    accessed_at REAL NOT NULL,
+                    PRIMARY KEY (namespace, key)
+                )
+            """)
+            self.conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_cache_entries_accessed
+                ON cache_entries(namespace, accessed_at)
+            """)
+            self.conn.commit()
+    
+    @staticmethod
+    def _key_text(key: Any) -> str:
+        return key if isinstance(key, str) else repr(key)
+    
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Read and verify a record, or return default"""
+        return self.get_with_expiry(key, default)[0]
+    
+    def get_with_expiry(self, key: Any, default: Any = None) -> Tuple[Any, Optional[float]]:
+        """Read and verify a record as (value, expires_at), or (default, None)"""
+        key_text = self._key_text(key)
+        now = time.time()
+        with self.lock:
+            try:
+                row = self.conn.execute(
+                    "SELECT value, checksum, expires_at FROM cache_entries "
+                    "WHERE namespace = ? AND key = ?",
+                    (self.namespace, key_text)
+                ).fetchone()
+                if row is None:
+                    self.misses += 1
+                    return default, None
+                
+                blob, checksum, expires_at = row
+                if expires_at is not None and now >= expires_at:
+                    self._delete(key_text)
+                    self.misses += 1
+                    return default, None
+                if zlib.crc32(blob) != checksum:
+                    self._delete(key_text)
+                    self.corrupt += 1
+                    self.misses += 1
+                    return default, None
+                
+                value = pickle.loads(blob)
+                self.conn.execute(
+                    "UPDATE cache_entries SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                    (now, self.namespace, key_text)
+                )
+                self.conn.commit()
+                self.hits += 1
+                return value, expires_at
+            except (sqlite3.Error, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+                self.errors += 1
+                self.misses += 1
+                return default, None
+    
+    def put(self, key: Any, value: Any, ttl: Optional[float] = None):
+        """Write a checksummed record"""
+        try:
+            blob = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            self.errors += 1
+            return
+        now = time.time()
+        with self.lock:
+            try:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO cache_entries "
+                    "(namespace, key, value, checksum, size_bytes, expires_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (self.namespace, self._key_text(key), blob, zlib.crc32(blob), len(blob),
+                     (now + ttl) if ttl is not None else None, now)
+                )
+                self.conn.commit()
+            except sqlite3.Error:
+                self.errors += 1
+                return
+            self._writes_since_compact += 1
+            if self._writes_since_compact >= self.compact_every:
+                self._compact(now)
+    
+    def put_many(self, items: Iterable[Tuple[Any, Any]], ttl: Optional[float] = None):
+        """Write a batch of checksummed records in one transaction"""
+        now = time.time()
+        expires_at = (now + ttl) if ttl is not None else None
+        rows = []
+        for key, value in items:
+            try:
+                blob = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+            except Exception:
+                self.errors += 1
+                continue
+            rows.append((self.namespace, self._key_text(key), blob, zlib.crc32(blob),
+                         len(blob), expires_at, now))
+        if not rows:
+            return
+        with self.lock:
+            try:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO cache_entries "
+                    "(namespace, key, value, checksum, size_bytes, expires_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+                self.conn.commit()
+            except sqlite3.Error:
+                self.errors += 1
+                return
+            self._writes_since_compact += len(rows)
+            if self._writes_since_compact >= self.compact_every:
+                self._compact(now)
+    
+    def _delete(self, key_text: str):
+        self.conn.execute(
+            "DELETE FROM cache_entries WHERE namespace = ? AND key = ?",
+            (self.namespace, key_text)
+        )
+        self.conn.commit()
+    
+    def _compact(self, now: float):
+        """Drop expired records, then the coldest ones until under budget"""
+        self._writes_since_compact = 0
+        self.compactions += 1
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "DELETE FROM cache_entries WHERE namespace = ? AND expires_at IS NOT NULL "
+            "AND expires_at <= ?",
+            (self.namespace, now)
+        )
+        total = cursor.execute(
+            "SELECT COALESCE(SUM(size_bytes), 0) FROM cache_entries WHERE namespace = ?",
+            (self.namespace,)
+        ).fetchone()[0]
+        if total > self.max_disk:
+            # Trim to 90% of the budget so compaction is not re-triggered
+            # by the very next write
+            target = total - self.max_disk * 0.9
+            freed = 0
+            doomed: List[str] = []
+            for key_text, size in cursor.execute(
+                "SELECT key, size_bytes FROM cache_entries WHERE namespace = ? "
+                "ORDER BY accessed_at",
+                (self.namespace,)
+            ).fetchall():
+                if freed >= target:
+                    break
+                doomed.append(key_text)
+                freed += size
+            cursor.executemany(
+                "DELETE FROM cache_entries WHERE namespace = ? AND key = ?",
+                [(self.namespace, k) for k in doomed]
+            )
+        self.conn.commit()
+    
+    def compact(self):
+        """Run size-bounded compaction now"""
+        with self.lock:
+            try:
+                self._compact(time.time())
+            except sqlite3.Error:
+                self.errors += 1
+    
+    def delete(self, key: Any):
+        """Remove a record"""
+        with self.lock:
+            try:
+                self._delete(self._key_text(key))
+            except sqlite3.Error:
+                self.errors += 1
+    
+    def delete_many(self, keys: Iterable[Any]):
+        """Remove a batch of records in one transaction"""
+        rows = [(self.namespace, self._key_text(key)) for key in keys]
+        if not rows:
+            return
+        with self.lock:
+            try:
+                self.conn.executemany(
+                    "DELETE FROM cache_entries WHERE namespace = ? AND key = ?", rows
+                )
+                self.conn.commit()
+            except sqlite3.Error:
+                self.errors += 1
+    
+    def clear(self):
+        """Remove all records in this namespace"""
+        with self.lock:
+            try:
+                self.conn.execute("DELETE FROM cache_entries WHERE namespace = ?",
+                                  (self.namespace,))
+                self.conn.commit()
+            except sqlite3.Error:
+                self.errors += 1
+            self.hits = 0
+            self.misses = 0
+    
+    def close(self):
+        with self.lock:
+            self.conn.close()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get disk tier statistics"""
+        with self.lock:
+            try:
+                count, size = self.conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM cache_entries "
+                    "WHERE namespace = ?",
+                    (self.namespace,)
+                ).fetchone()
+            except sqlite3.Error:
+                count, size = 0, 0
+            return {
+                'path': self.db_path,
+                'namespace': self.namespace,
+                'size': count,
+                'disk_mb': size / (1024 * 1024),
+                'max_disk_mb': self.max_disk / (1024 * 1024),
+                'hits': self.hits,
+                'misses': self.misses,
+                'corrupt': self.corrupt,
+                'errors': self.errors,
+                'compactions': self.compactions
+            }
+
+
+# ============================================================================
+# SHARDED (LOCK-STRIPED) LRU CACHE
+# ============================================================================
+
+# make_cache only shards a cache when every segment gets this many entries;
+# smaller caches lose too much capacity to uneven hashing
+MIN_SHARD_SIZE = 128
+
+
+def shard_capacity(max_size: int, num_shards: int) -> int:
+    """Entry limit of one segment: its even share plus three standard
+    deviations of the binomial key spread, so uneven hashing rarely
+    evicts before the cache as a whole is full."""
+    share = max_size / num_shards
+    return min(max_size, max(1, math.ceil(share + 3 * math.sqrt(share))))
+
+
+class ShardedLRUCache:
+    """LRU cache split into independent segments, each with its own lock.
+
+    Keys are hashed to one of ``num_shards`` LRUCache segments so concurrent
+    readers and writers only contend when they hit the same segment. Each
+    segment gets its share of the entry and memory budgets plus slack for
+    uneven hashing (see shard_capacity), so the total may exceed
+    ``max_size`` by that slack.
+    """
+    
+    def __init__(self, max_size: int = 100, ttl_seconds: Optional[float] = None,
+                 max_memory_mb: float = 10.0, num_shards: int = 16,
+                 sizer: Optional[Sizer] = None, l2: Optional[DiskCache] = None,
+                 policy: str = "lru", negative_ttl: float = 5.0):
+        if num_shards < 1:
+            raise ValueError("num_shards must be >= 1")
+        self.num_shards = num_shards
+        self.max_size = max_size
+        self.ttl = ttl_seconds
+        self.max_memory = max_memory_mb * 1024 * 1024
+        self.l2 = l2
+        shard_size = shard_capacity(max_size, num_shards)
+        shard_memory_mb = max_memory_mb * shard_size / max(1, max_size)
+        self.shards: List[LRUCache] = [
+            LRUCache(max_size=shard_size,
+                     ttl_seconds=ttl_seconds, max_memory_mb=shard_memory_mb,
+                     sizer=sizer, l2=l2, policy=policy, negative_ttl=negative_ttl)
+            for _ in range(num_shards)
+        ]
+        self._reaper: Optional[TTLReaper] = None
+    
+    def _shard_for(self, key: str) -> LRUCache:
+        """Select the segment responsible for key"""
+        return self.shards[hash(key) % self.num_shards]
+    
+    def set_latency_observer(self, observe: Optional[LatencyObserver]):
+        """Time every get/put on all segments"""
+        for shard in self.shards:
+            shard.set_latency_observer(observe)
+    
+    def get(self, key: str, default: Any = None) -> Optional[Any]:
+        """Get value from cache, or default on a miss"""
+        return self._shard_for(key).get(key, default)
+    
+    def put(self, key: str, value: Any, size: Optional[int] = None,
+            ttl: Optional[float] = None):
+        """Put value in cache"""
+        self._shard_for(key).put(key, value, size=size, ttl=ttl)
+    
+    def _group_by_shard(self, items: Iterable[Any], key_of: Callable[[Any], str]
+                        ) -> Dict[int, List[Any]]:
+        """Bucket items by the index of the segment owning their key"""
+        groups: Dict[int, List[Any]] = {}
+        for item in items:
+            groups.setdefault(hash(key_of(item)) % self.num_shards, []).append(item)
+        return groups
+    
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Look up a batch of keys, locking each touched segment once"""
+        found: Dict[str, Any] = {}
+        for index, shard_keys in self._group_by_shard(keys, lambda k: k).items():
+            found.update(self.shards[index].get_many(shard_keys))
+        return found
+    
+    def put_many(self, items: Union[Dict[str, Any], Iterable[Tuple[str, Any]]],
+                 ttl: Optional[float] = None):
+        """Insert a batch of pairs, locking each touched segment once"""
+        pairs = items.items() if isinstance(items, dict) else items
+        for index, shard_items in self._group_by_shard(pairs, lambda kv: kv[0]).items():
+            self.shards[index].put_many(shard_items, ttl=ttl)
+    
+    def put_negative(self, key: str, ttl: Optional[float] = None):
+        """Remember that key has no value (see LRUCache.put_negative)"""
+        self._shard_for(key).put_negative(key, ttl=ttl)
+    
+    def put_negative_many(self, keys: Iterable[str], ttl: Optional[float] = None):
+        """Remember a batch of absent keys, locking each touched segment once"""
+        for index, shard_keys in self._group_by_shard(keys, lambda k: k).items():
+            self.shards[index].put_negative_many(shard_keys, ttl=ttl)
+    
+    def invalidate(self, key: str):
+        """Drop key from its segment"""
+        self._shard_for(key).invalidate(key)
+    
+    def clear(self):
+        """Clear all segments"""
+        if self.l2 is not None:
+            self.l2.clear()
+        for shard in self.shards:
+            shard._clear_memory()
+    
+    def expire(self) -> int:
+        """Reclaim expired entries in every segment"""
+        return sum(shard.expire() for shard in self.shards)
+    
+    def start_reaper(self, interval: float = 1.0) -> TTLReaper:
+        """Start one background thread reaping all segments"""
+        if self._reaper is None or not self._reaper.is_alive():
+            self._reaper = TTLReaper(self.expire, interval=interval)
+            self._reaper.start()
+        return self._reaper
+    
+    def stop_reaper(self):
+        """Stop the background reaper thread if running"""
+        reaper, self._reaper = self._reaper, None
+        if reaper is not None:
+            reaper.stop()
+    
+    def __len__(self) -> int:
+        return sum(len(shard.cache) for shard in self.shards)
+    
+    def shard_stats(self) -> List[Dict[str, Any]]:
+        """Get per-segment statistics"""
+        return [shard.stats() for shard in self.shards]
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get statistics aggregated across all segments"""
+        per_shard = self.shard_stats()
+        hits = sum(s['hits'] for s in per_shard)
+        misses = sum(s['misses'] for s in per_shard)
+        total_requests = hits + misses
+        hit_rate = (hits / total_requests * 100) if total_requests > 0 else 0
+        sizes = [s['size'] for s in per_shard]
+        
+        return {
+            'size': sum(sizes),
+            'max_size': self.max_size,
+            'memory_mb': sum(s['memory_mb'] for s in per_shard),
+            'max_memory_mb': self.max_memory / (1024 * 1024),
+            'memory_bytes': sum(s['memory_bytes'] for s in per_shard),
+            'hits': hits,
+            'misses': misses,
+            'hit_rate_percent': round(hit_rate, 2),
+            'evictions': sum(s['evictions'] for s in per_shard),
+            'evictions_by_reason': {
+                reason: sum(s['evictions_by_reason'][reason] for s in per_shard)
+                for reason in EVICTION_REASONS
+            },
+            'expirations': sum(s['expirations'] for s in per_shard),
+            'negative_hits': sum(s['negative_hits'] for s in per_shard),
+            'l2_hits': sum(s['l2_hits'] for s in per_shard),
+            'policy': per_shard[0]['policy'],
+            'ttl_seconds': self.ttl,
+            'shards': self.num_shards,
+            'max_shard_size': max(sizes) if sizes else 0
+        }
+
+
+# ============================================================================
+# CROSS-PROCESS SHARED-MEMORY CACHE
+# ============================================================================
+
+class SharedMemoryCache:
+    """Cache shared by every process on a host via multiprocessing.shared_memory
+
+    The segment holds a header followed by ``num_slots`` fixed-size slots.
+    A key lives in one of ``PROBE_WINDOW`` consecutive slots starting at
+    its (process-independent) hash, so the slot table doubles as an
+    open-addressing index. Readers never lock: each slot carries a sequence
+    counter that writers make odd while they modify it, and a reader
+    retries whenever it sees an odd or changed counter (seqlock). Writers
+    serialize on an flock'd lock file. When a key's window is full the
+    victim is picked with CLOCK: slots with their reference bit set get a
+    second chance.
+
+    Values are pickled; anything larger than a slot's payload is not
+    cached. Segments outlive the processes that use them, call unlink()
+    to remove one.
+    """
+    
+    MAGIC = b'NXSC'
+    VERSION = 1
+    PROBE_WINDOW = 8
+    MAX_READ_RETRIES = 16
+    
+    # magic, version, num_slots, slot_size, clock hand, evictions, puts
+    _HEADER = struct.Struct('<4sIIIIQQ')
+    _HEADER_SIZE = 64
+    # seq, state, ref bit, key hash, key length, value length, expires_at
+    _SLOT = struct.Struct('<IBBxxQHxxId')
+    _SLOT_EMPTY = 0
+    _SLOT_USED = 1
+    _NO_EXPIRY = 0.0
+    
+    def __init__(self, name: str = "nexus_cache", num_slots: int = 1024,
+                 slot_size: int = 4096, ttl_seconds: Optional[float] = None,
+                 negative_ttl: float = 5.0):
+        if shared_memory is None:
+            raise RuntimeError("SharedMemoryCache requires Python 3.8+")
+        if slot_size <= self._SLOT.size:
+            raise ValueError(f"slot_size must exceed {self._SLOT.size} bytes")
+        self.name = name
+        self.ttl = ttl_seconds
+        self.negative_ttl = negative_ttl
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.negative_hits = 0
+        self.oversize = 0
+        self.observe: Optional[LatencyObserver] = None
+        self._reaper: Optional[TTLReaper] = None
+        
+        total = self._HEADER_SIZE + num_slots * slot_size
+        try:
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=total)
+            self.buf = self.shm.buf
+            self._HEADER.pack_into(self.buf, 0, b'\0\0\0\0', self.VERSION,
+                                   num_slots, slot_size, 0, 0, 0)
+            # Publish the magic last so attaching processes never see a
+            # half-initialized header
+            self.buf[0:4] = self.MAGIC
+        except FileExistsError:
+            self.shm = shared_memory.SharedMemory(name=name, create=False)
+            self.buf = self.shm.buf
+            deadline = time.time() + 2.0
+            while bytes(self.buf[0:4]) != self.MAGIC:
+                if time.time() > deadline:
+                    raise RuntimeError(f"shared cache {name!r} was never initialized")
+                time.sleep(0.001)
+        self._untrack()
+        
+        _, _, self.num_slots, self.slot_size, _, _, _ = self._HEADER.unpack_from(self.buf, 0)
+        self.payload_size = self.slot_size - self._SLOT.size
+        self.window = min(self.PROBE_WINDOW, self.num_slots)
+        self._lock_path = os.path.join(tempfile.gettempdir(), f"{name}.lock")
+        self._lock_file = open(self._lock_path, 'a+b')
+    
+    def _untrack(self):
+        """Stop this process's resource tracker from unlinking the segment
+        when the process exits; the segment belongs to all workers."""
+        try:
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(self.shm._name, 'shared_memory')
+        except Exception:
+            pass
+    
+    # -- low level slot access -------------------------------------------------
+    
+    @staticmethod
+    def _encode_key(key: Any) -> bytes:
+        return (key if isinstance(key, str) else repr(key)).encode('utf-8')
+    
+    @staticmethod
+    def _hash(key_bytes: bytes) -> int:
+        return int.from_bytes(hashlib.blake2b(key_bytes, digest_size=8).digest(), 'little')
+    
+    def _offset(self, slot: int) -> int:
+        return self._HEADER_SIZE + slot * self.slot_size
+    
+    def _window(self, key_hash: int):
+        start = key_hash % self.num_slots
+        return [(start + i) % self.num_slots for i in range(self.window)]
+    
+    def _read_slot(self, slot: int, key_hash: int, key_bytes: bytes) -> Any:
+        """Seqlock read of one slot; returns the pickled value or _MISSING"""
+        offset = self._offset(slot)
+        for _ in range(self.MAX_READ_RETRIES):
+            seq1 = struct.unpack_from('<I', self.buf, offset)[0]
+            if seq1 & 1:
+                continue  # Writer in progress
+            _, state, _, slot_hash, key_len, value_len, expires_at = \
+                self._SLOT.unpack_from(self.buf, offset)
+            if state != self._SLOT_USED or slot_hash != key_hash:
+                payload = None
+            else:
+                start = offset + self._SLOT.size
+                payload = bytes(self.buf[start:start + key_len + value_len])
+            if struct.unpack_from('<I', self.buf, offset)[0] != seq1:
+                continue  # Torn read, retry
+            if payload is None or payload[:key_len] != key_bytes:
+                return _MISSING
+            if expires_at != self._NO_EXPIRY and time.time() >= expires_at:
+                return _MISSING
+            # CLOCK reference bit; a racy single-byte store is harmless
+            self.buf[offset + 5] = 1
+            return payload[key_len:]
+        return _MISSING
+    
+    def _write_slot(self, slot: int, state: int, key_hash: int = 0,
+                    key_bytes: bytes = b'', blob: bytes = b'',
+                    expires_at: float = _NO_EXPIRY):
+        """Rewrite one slot under the seqlock (caller holds the write lock)"""
+        offset = self._offset(slot)
+        seq = struct.unpack_from('<I', self.buf, offset)[0]
+        struct.pack_into('<I', self.buf, offset, (seq + 1) & 0xFFFFFFFF)
+        self._SLOT.pack_into(self.buf, offset, (seq + 1) & 0xFFFFFFFF, state, 0,
+                             key_hash, len(key_bytes), len(blob), expires_at)
+        if state == self._SLOT_USED:
+            start = offset + self._SLOT.size
+            self.buf[start:start + len(key_bytes)] = key_bytes
+            start += len(key_bytes)
+            self.buf[start:start + len(blob)] = blob
+        struct.pack_into('<I', self.buf, offset, (seq + 2) & 0xFFFFFFFF)
+    
+    def _slot_meta(self, slot: int) -> Tuple[int, int, int, float]:
+        """(state, ref bit, key hash, expires_at) read under the write lock"""
+        _, state, ref, key_hash, _, _, expires_at = \
+            self._SLOT.unpack_from(self.buf, self._offset(slot))
+        return state, ref, key_hash, expires_at
+    
+    def _slot_key(self, slot: int) -> bytes:
+        offset = self._offset(slot)
+        key_len = self._SLOT.unpack_from(self.buf, offset)[4]
+        start = offset + self._SLOT.size
+        return bytes(self.buf[start:start + key_len])
+    
+    def _write_locked(self):
+        return _FileLock(self.lock, self._lock_file)
+    
+    def _bump_header(self, field_index: int, delta: int = 1):
+        values = list(self._HEADER.unpack_from(self.buf, 0))
+        values[field_index] += delta
+        self._HEADER.pack_into(self.buf, 0, *values)
+    
+    # -- cache interface -------------------------------------------------------
+    
+    def set_latency_observer(self, observe: Optional[LatencyObserver]):
+        """Time every get/put and report it to observe (None disables)"""
+        self.observe = observe
+    
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Get value from the shared cache, or default on a miss"""
+        if self.observe is None:
+            return self._get(key, default)
+        start = time.perf_counter()
+        try:
+            return self._get(key, default)
+        finally:
+            self.observe('get', time.perf_counter() - start)
+    
+    def _get(self, key: Any, default: Any) -> Any:
+        key_bytes = self._encode_key(key)
+        key_hash = self._hash(key_bytes)
+        for slot in self._window(key_hash):
+            blob = self._read_slot(slot, key_hash, key_bytes)
+            if blob is _MISSING:
+                continue
+            try:
+                value = pickle.loads(blob)
+            except Exception:
+                continue
+            if value is NEGATIVE:
+                self.negative_hits += 1
+            else:
+                self.hits += 1
+            return value
+        self.misses += 1
+        return default
+    
+    def get_many(self, keys: Iterable[Any]) -> Dict[Any, Any]:
+        """Look up a batch of keys; only found keys appear in the result"""
+        found: Dict[Any, Any] = {}
+        for key in keys:
+            value = self.get(key, _MISSING)
+            if value is not _MISSING:
+                found[key] = value
+        return found
+    
+    def put(self, key: Any, value: Any, size: Optional[int] = None,
+            ttl: Optional[float] = None):
+        """Put value in the shared cache (size is ignored: slots are fixed)"""
+        if self.observe is None:
+            return self._put(key, value, ttl)
+        start = time.perf_counter()
+        try:
+            return self._put(key, value, ttl)
+        finally:
+            self.observe('put', time.perf_counter() - start)
+    
+    def _put(self, key: Any, value: Any, ttl: Optional[float]):
+        record = self._encode_record(key, value, ttl)
+        if record is None:
+            return
+        with self._write_locked():
+            self._write_record_locked(*record)
+    
+    def put_many(self, items: Union[Dict[Any, Any], Iterable[Tuple[Any, Any]]],
+                 ttl: Optional[float] = None):
+        """Insert a batch of (key, value) pairs under one write lock"""
+        pairs = items.items() if isinstance(items, dict) else items
+        records = [r for r in (self._encode_record(k, v, ttl) for k, v in pairs)
+                   if r is not None]
+        if not records:
+            return
+        with self._write_locked():
+            for record in records:
+                self._write_record_locked(*record)
+    
+    def put_negative(self, key: Any, ttl: Optional[float] = None):
+        """Remember that key has no value for ttl (default negative_ttl) seconds"""
+        self.put(key, NEGATIVE, ttl=self.negative_ttl if ttl is None else ttl)
+    
+    def put_negative_many(self, keys: Iterable[Any], ttl: Optional[float] = None):
+        """Remember a batch of absent keys under one write lock"""
+        ttl = self.negative_ttl if ttl is None else ttl
+        self.put_many(((key, NEGATIVE) for key in keys), ttl=ttl)
+    
+    def invalidate(self, key: Any):
+        """Drop key from the shared cache"""
+        self.delete(key)
+    
+    def _encode_record(self, key: Any, value: Any, ttl: Optional[float]
+                       ) -> Optional[Tuple[int, bytes, bytes, float]]:
+        """Serialize a pair outside the lock; None if it cannot be stored"""
+        key_bytes = self._encode_key(key)
+        try:
+            blob = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            self.oversize += 1
+            return None
+        if len(key_bytes) + len(blob) > self.payload_size or len(key_bytes) > 0xFFFF:
+            self.oversize += 1
+            return None
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.time() + ttl if ttl is not None else self._NO_EXPIRY
+        return self._hash(key_bytes), key_bytes, blob, expires_at
+    
+    def _write_record_locked(self, key_hash: int, key_bytes: bytes, blob: bytes,
+                             expires_at: float):
+        """Place a record in its probe window (caller holds the write lock)"""
+        window = self._window(key_hash)
+        now = time.time()
+        target = None
+        free = None
+        for slot in window:
+            state, _, slot_hash, slot_expiry = self._slot_meta(slot)
+            if state == self._SLOT_USED:
+                if slot_hash == key_hash and self._slot_key(slot) == key_bytes:
+                    target = slot
+                    break
+                if slot_expiry != self._NO_EXPIRY and now >= slot_expiry and free is None:
+                    free = slot
+            elif free is None:
+                free = slot
+        if target is None:
+            target = free if free is not None else self._clock_victim(window)
+        self._write_slot(target, self._SLOT_USED, key_hash, key_bytes, blob, expires_at)
+        self._bump_header(6)
+    
+    def _clock_victim(self, window: List[int]) -> int:
+        """Second-chance sweep over the key's window using the shared hand"""
+        hand = self._HEADER.unpack_from(self.buf, 0)[4]
+        for step in range(2 * len(window)):
+            slot = window[(hand + step) % len(window)]
+            offset = self._offset(slot)
+            if self.buf[offset + 5]:
+                self.buf[offset + 5] = 0
+                continue
+            self._bump_header(4, step + 1)
+            self._bump_header(5)
+            return slot
+        self._bump_header(5)
+        return window[hand % len(window)]
+    
+    def delete(self, key: Any) -> bool:
+        """Remove key from the shared cache"""
+        key_bytes = self._encode_key(key)
+        key_hash = self._hash(key_bytes)
+        with self._write_locked():
+            for slot in self._window(key_hash):
+                state, _, slot_hash, _ = self._slot_meta(slot)
+                if (state == self._SLOT_USED and slot_hash == key_hash
+                        and self._slot_key(slot) == key_bytes):
+                    self._write_slot(slot, self._SLOT_EMPTY)
+                    return True
+        return False
+    
+    def expire(self) -> int:
+        """Empty every slot whose entry has expired"""
+        reclaimed = 0
+        now = time.time()
+        with self._write_locked():
+            for slot in range(self.num_slots):
+                state, _, _, expires_at = self._slot_meta(slot)
+                if (state == self._SLOT_USED and expires_at != self._NO_EXPIRY
+                        and now >= expires_at):
+                    self._write_slot(slot, self._SLOT_EMPTY)
+                    reclaimed += 1
+        return reclaimed
+    
+    def start_reaper(self, interval: float = 1.0) -> TTLReaper:
+        """Start a background thread that calls expire() every interval"""
+        if self._reaper is None or not self._reaper.is_alive():
+            self._reaper = TTLReaper(self.expire, interval=interval)
+            self._reaper.start()
+        return self._reaper
+    
+    def stop_reaper(self):
+        """Stop the background reaper thread if running"""
+        reaper, self._reaper = self._reaper, None
+        if reaper is not None:
+            reaper.stop()
+    
+    def clear(self):
+        """Empty every slot (affects all attached processes)"""
+        with self._write_locked():
+            for slot in range(self.num_slots):
+                if self._slot_meta(slot)[0] != self._SLOT_EMPTY:
+                    self._write_slot(slot, self._SLOT_EMPTY)
+        self.hits = 0
+        self.misses = 0
+        self.negative_hits = 0
+    
+    def close(self):
+        """Detach this process from the segment"""
+        self.stop_reaper()
+        self.buf = None
+        self.shm.close()
+        self._lock_file.close()
+    
+    def unlink(self):
+        """Destroy the segment for every process"""
+        try:
+            # unlink() unregisters from the resource tracker; re-register
+            # first since __init__ already unregistered the segment
+            from multiprocessing import resource_tracker
+            resource_tracker.register(self.shm._name, 'shared_memory')
+        except Exception:
+            pass
+        self.shm.unlink()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get statistics (hits/misses are per process, the rest host-wide)"""
+        used = 0
+        used_bytes = 0
+        for slot in range(self.num_slots):
+            _, state, _, _, key_len, value_len, _ = \
+                self._SLOT.unpack_from(self.buf, self._offset(slot))
+            if state == self._SLOT_USED:
+                used += 1
+                used_bytes += key_len + value_len
+        _, _, _, _, _, evictions, puts = self._HEADER.unpack_from(self.buf, 0)
+        total_requests = self.hits + self.misses
+        hit_rate = (self.hits / total_requests * 100) if total_requests > 0 else 0
+        
+        return {
+            'backend': 'shared',
+            'name': self.name,
+            'size': used,
+            'max_size': self.num_slots,
+            'memory_mb': used_bytes / (1024 * 1024),
+            'max_memory_mb': self.num_slots * self.slot_size / (1024 * 1024),
+            'memory_bytes': used_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'negative_hits': self.negative_hits,
+            'hit_rate_percent': round(hit_rate, 2),
+            'evictions': evictions,
+            'evictions_by_reason': {'size': evictions, 'memory': 0, 'ttl': 0},
+            'puts': puts,
+            'oversize': self.oversize,
+            'ttl_seconds': self.ttl
+        }
+
+
+class _FileLock:
+    """Thread lock plus an exclusive flock for cross-process writers"""
+    
+    def __init__(self, thread_lock: threading.Lock, lock_file):
+        self.thread_lock = thread_lock
+        self.lock_file = lock_file
+    
+    def __enter__(self):
+        self.thread_lock.acquire()
+        if fcntl is not None:
+            fcntl.flock(self.lock_file.fileno(), fcntl.LOCK_EX)
+        return self
+    
+    def __exit__(self, *exc):
+        if fcntl is not None:
+            fcntl.flock(self.lock_file.fileno(), fcntl.LOCK_UN)
+        self.thread_lock.release()
+        return False
+
+
+def make_cache(max_size: int = 100, ttl_seconds: Optional[float] = None,
+               max_memory_mb: float = 10.0, num_shards: int = 1,
+               sizer: Optional[Sizer] = None, l2: Optional[DiskCache] = None,
+               backend: str = "memory", name: str = "general", policy: str = "lru",
+               negative_ttl: float = 5.0):
+    """Create a cache for the selected backend
+
+    ``backend="memory"`` gives a plain LRUCache, or a ShardedLRUCache when
+    num_shards > 1; the shard count is capped so every segment holds at
+    least MIN_SHARD_SIZE entries, so small caches stay unsharded.
+    ``backend="shared"`` gives a SharedMemoryCache named
+    ``nexus_<name>`` with one slot per entry, each slot getting an equal
+    share of the memory budget (the shared backend always uses CLOCK, so
+    ``policy`` only applies to the memory backend).
+    """
+    if backend == "shared":
+        slot_size = max(1024, int(max_memory_mb * 1024 * 1024 / max(1, max_size)))
+        return SharedMemoryCache(name=f"nexus_{name}", num_slots=max_size,
+                                 slot_size=slot_size, ttl_seconds=ttl_seconds,
+                                 negative_ttl=negative_ttl)
+    if backend != "memory":
+        raise ValueError(f"Unknown cache backend: {backend}")
+    num_shards = min(num_shards, max_size // MIN_SHARD_SIZE)
+    if num_shards > 1:
+        return ShardedLRUCache(max_size=max_size, ttl_seconds=ttl_seconds,
+                               max_memory_mb=max_memory_mb, num_shards=num_shards,
+                               sizer=sizer, l2=l2, policy=policy,
+                               negative_ttl=negative_ttl)
+    return LRUCache(max_size=max_size, ttl_seconds=ttl_seconds,
+                    max_memory_mb=max_memory_mb, sizer=sizer, l2=l2, policy=policy,
+                    negative_ttl=negative_ttl)
+
+
 # ============================================================================
 # FUNCTION CACHE DECORATOR
 # ============================================================================
 
+# Separates positional from keyword arguments inside tuple keys
+_KWD_MARK = (object(),)
+
+
+def _make_call_key(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+    """Build a cache key for a call, or return _MISSING if none can be built.
+
+    Hashable arguments are used directly as a tuple key, so no string
+    formatting or digesting happens on the fast path. Unhashable arguments
+    (lists, dicts) fall back to their pickled bytes, which unlike ``str()``
+    cannot collide for distinct values with identical reprs.
+    """
+    key: Any = args
+    if kwargs:
+        key = args + _KWD_MARK + tuple(sorted(kwargs.items()))
+    try:
+        hash(key)
+        return key
+    except TypeError:
+        pass
+    try:
+        return pickle.dumps((args, sorted(kwargs.items())), pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return _MISSING
+
+
+class _Call:
+    """In-flight computation shared by concurrent callers of one key"""
+    __slots__ = ('event', 'result', 'error')
+    
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Collapse concurrent calls for the same key into one execution"""
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls: Dict[Any, _Call] = {}
+    
+    def do(self, key: Any, fn: Callable[[], Any]) -> Any:
+        """Run fn for key, or wait for the caller already running it"""
+        with self.lock:
+            call = self.calls.get(key)
+            leader = call is None
+            if leader:
+                call = self.calls[key] = _Call()
+        
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self.lock:
+                del self.calls[key]
+            call.event.set()
+
+
 def cache_result(max_size: int = 128, ttl_seconds: Optional[float] = None):
-    """Decorator for caching function results"""
+    """Decorator for caching function results
+
+    Works on both plain functions and ``async def`` coroutines. ``None``
+    results are cached like any other value, and concurrent misses on the
+    same arguments run the function only once (single-flight); the other
+    callers wait for and share that result. A coroutine runs as its own
+    task, so cancelling one waiting caller never cancels the others.
+    """
     cache = LRUCache(max_size=max_size, ttl_seconds=ttl_seconds)
     
     def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            # Create cache key from function name and arguments
-            key_data = f"{func.__name__}:{str(args)}:{str(sorted(kwargs.items()))}"
-            cache_key = hashlib.md5(key_data.encode()).hexdigest()
+        if asyncio.iscoroutinefunction(func):
+            in_flight: Dict[Any, "asyncio.Task[Any]"] = {}
+            
+            async def compute(cache_key, args, kwargs):
+                try:
+                    result = await func(*args, **kwargs)
+                    cache.put(cache_key, result)
+                    return result
+                finally:
+                    del in_flight[cache_key]
+            
+            def retrieve(task: "asyncio.Task[Any]"):
+                # Mark a failure retrieved in case every caller was cancelled
+                if not task.cancelled():
+                    task.exception()
+            
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                cache_key = _make_call_key(args, kwargs)
+                if cache_key is _MISSING:
+                    return await func(*args, **kwargs)
+                
+                cached_value = cache.get(cache_key, _MISSING)
+                if cached_value is not _MISSING:
+                    return cached_value
+                
+                # Join a computation already running for this key
+                task = in_flight.get(cache_key)
+                if task is None:
+                    task = asyncio.ensure_future(compute(cache_key, args, kwargs))
+                    task.add_done_callback(retrieve)
+                    in_flight[cache_key] = task
+                # Shielded so one cancelled caller doesn't cancel the shared call
+                return await asyncio.shield(task)
+            
+            wrapper = async_wrapper
+        else:
+            flight = SingleFlight()
             
-            # Try to get from cache
-            cached_value = cache.get(cache_key)
-            if cached_value is not None:
-                return cached_value
+            @wraps(func)
+            def sync_wrapper(*args, **kwargs):
+                cache_key = _make_call_key(args, kwargs)
+                if cache_key is _MISSING:
+                    return func(*args, **kwargs)
+                
+                # Try to get from cache
+                cached_value = cache.get(cache_key, _MISSING)
+                if cached_value is not _MISSING:
+                    return cached_value
+                
+                def compute():
+                    result = func(*args, **kwargs)
+                    cache.put(cache_key, result)
+                    return result
+                
+                return flight.do(cache_key, compute)
             
-            # Compute and cache result
-            result = func(*args, **kwargs)
-            cache.put(cache_key, result)
-            return result
+            wrapper = sync_wrapper
         
         # Attach cache stats method
         wrapper.cache_stats = cache.stats
@@ -217,35 +1987,78 @@ def cache_result(max_size: int = 128, ttl_seconds: Optional[float] = None):
 # OBJECT POOL
 # ============================================================================
 
-class ObjectPool:
-    """Object pool for reusing expensive objects"""
+T = TypeVar('T')
+
+
+class ObjectPool(Generic[T]):
+    """Object pool for reusing expensive objects
+
+    ``reset`` is called on every object returned to the pool so the next
+    borrower gets it clean; ``preallocate`` objects are built up front.
+    Prefer ``with pool.lease() as obj:`` over acquire/release so objects
+    are returned even when the caller raises; ``outstanding`` in stats()
+    counts objects acquired but not yet released.
+    """
     
-    def __init__(self, factory: Callable, max_size: int = 20):
+    def __init__(self, factory: Callable[..., T], max_size: int = 20,
+                 reset: Optional[Callable[[T], Any]] = None, preallocate: int = 0):
         self.factory = factory
         self.max_size = max_size
-        self.pool: List[Any] = []
+        self.reset = reset
+        self.pool: List[T] = []
         self.lock = threading.Lock()
         self.created = 0
         self.reused = 0
+        self.outstanding = 0
+        if preallocate:
+            self.warm(preallocate)
     
-    def acquire(self, *args, **kwargs) -> Any:
+    def warm(self, count: int, *args, **kwargs):
+        """Preallocate objects until the pool holds count (capped at max_size)"""
+        with self.lock:
+            needed = min(count, self.max_size) - len(self.pool)
+        fresh = [self.factory(*args, **kwargs) for _ in range(max(0, needed))]
+        with self.lock:
+            self.created += len(fresh)
+            self.pool.extend(fresh[:self.max_size - len(self.pool)])
+    
+    def acquire(self, *args, **kwargs) -> T:
         """Get object from pool or create new one"""
         with self.lock:
+            self.outstanding += 1
             if self.pool:
                 obj = self.pool.pop()
                 self.reused += 1
                 return obj
-            else:
-                obj = self.factory(*args, **kwargs)
-                self.created += 1
-                return obj
+            self.created += 1
+        return self.factory(*args, **kwargs)
     
-    def release(self, obj: Any):
+    def release(self, obj: T):
         """Return object to pool"""
+        with self.lock:
+            self.outstanding -= 1
+            if len(self.pool) >= self.max_size:
+                return
+        if self.reset is not None:
+            self.reset(obj)
         with self.lock:
             if len(self.pool) < self.max_size:
                 self.pool.append(obj)
     
+    @contextmanager
+    def lease(self, *args, **kwargs) -> Iterator[T]:
+        """Borrow an object for the duration of a with-block"""
+        obj = self.acquire(*args, **kwargs)
+        try:
+            yield obj
+        finally:
+            self.release(obj)
+    
+    def clear(self):
+        """Drop all pooled objects"""
+        with self.lock:
+            self.pool.clear()
+    
     def stats(self) -> Dict[str, Any]:
         """Get pool statistics"""
         with self.lock:
@@ -257,10 +2070,103 @@ class ObjectPool:
                 'max_size': self.max_size,
                 'created': self.created,
                 'reused': self.reused,
+                'outstanding': self.outstanding,
                 'reuse_rate_percent': round(reuse_rate, 2)
             }
 
 
+class KeyedObjectPool(Generic[T]):
+    """Object pools partitioned by key, e.g. canvas shape (width, height)
+
+    ``factory`` and ``reset`` receive the key's components as arguments,
+    so ``lease(80, 24)`` borrows from the (80, 24) sub-pool.
+    """
+    
+    def __init__(self, factory: Callable[..., T], max_size_per_key: int = 4,
+                 reset: Optional[Callable[..., Any]] = None):
+        self.factory = factory
+        self.max_size_per_key = max_size_per_key
+        self.reset = reset
+        self.pools: Dict[Hashable, ObjectPool[T]] = {}
+        self.lock = threading.Lock()
+    
+    def _pool_for(self, key: Tuple[Any, ...]) -> ObjectPool[T]:
+        pool = self.pools.get(key)
+        if pool is None:
+            with self.lock:
+                pool = self.pools.get(key)
+                if pool is None:
+                    reset = self.reset
+                    pool = ObjectPool(
+                        factory=lambda: self.factory(*key),
+                        max_size=self.max_size_per_key,
+                        reset=(lambda obj: reset(obj, *key)) if reset else None
+                    )
+                    self.pools[key] = pool
+        return pool
+    
+    def warm(self, count: int, *key):
+        """Preallocate count objects for one key"""
+        self._pool_for(key).warm(count)
+    
+    def acquire(self, *key) -> T:
+        return self._pool_for(key).acquire()
+    
+    def release(self, obj: T, *key):
+        self._pool_for(key).release(obj)
+    
+    @contextmanager
+    def lease(self, *key) -> Iterator[T]:
+        """Borrow an object of the given key for the duration of a with-block"""
+        pool = self._pool_for(key)
+        with pool.lease() as obj:
+            yield obj
+    
+    def clear(self):
+        with self.lock:
+            for pool in self.pools.values():
+                pool.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get statistics summed over sub-pools, plus per-key detail"""
+        with self.lock:
+            per_key = {key: pool.stats() for key, pool in self.pools.items()}
+        created = sum(st['created'] for st in per_key.values())
+        reused = sum(st['reused'] for st in per_key.values())
+        total = created + reused
+        return {
+            'pool_size': sum(st['pool_size'] for st in per_key.values()),
+            'max_size': self.max_size_per_key * len(per_key),
+            'created': created,
+            'reused': reused,
+            'outstanding': sum(st['outstanding'] for st in per_key.values()),
+            'reuse_rate_percent': round(reused / total * 100, 2) if total > 0 else 0,
+            'keys': len(per_key)
+        }
+
+
+def _new_canvas(width: int, height: int, fill: str = ' ') -> List[List[str]]:
+    return [[fill] * width for _ in range(height)]
+
+
+def _blank_canvas(canvas: List[List[str]], width: int, height: int, fill: str = ' '):
+    blank = [fill] * width
+    for row in canvas:
+        row[:] = blank
+
+
+class CanvasPool(KeyedObjectPool[List[List[str]]]):
+    """Pool of 2D character canvases keyed by (width, height)
+
+    Leased canvases are always blank; they are wiped in place on release
+    instead of being reallocated every frame.
+    """
+    
+    def __init__(self, max_size_per_key: int = 4):
+        super().__init__(factory=_new_canvas, max_size_per_key=max_size_per_key,
+                         reset=_blank_canvas)
+
+
 # ============================================================================
 # RENDER FRAME CACHE
 # ============================================================================
@@ -268,8 +2174,12 @@ class ObjectPool:
 class FrameCache:
     """Specialized cache for rendered frames"""
     
-    def __init__(self, max_frames: int = 60, max_memory_mb: float = 5.0):
-        self.cache = LRUCache(max_size=max_frames, max_memory_mb=max_memory_mb)
+    def __init__(self, max_frames: int = 60, max_memory_mb: float = 5.0,
+                 num_shards: int = 1, l2: Optional[DiskCache] = None,
+                 backend: str = "memory", policy: str = "lru"):
+        self.cache = make_cache(max_size=max_frames, max_memory_mb=max_memory_mb,
+                                num_shards=num_shards, sizer=frame_sizer, l2=l2,
+                                backend=backend, name="frames", policy=policy)
         self.frame_sequence: List[str] = []
         self.lock = threading.Lock()
     
@@ -281,11 +2191,11 @@ class FrameCache:
         return self.cache.get(cache_key)
     
     def store_frame(self, object_id: str, rotation: Tuple[float, float, float], 
-                   frame_lines: List[str]):
+                   frame_lines: List[str], size: Optional[int] = None):
         """Store rendered frame"""
         rounded_rotation = tuple(round(r, 2) for r in rotation)
         cache_key = f"{object_id}:{rounded_rotation}"
-        self.cache.put(cache_key, frame_lines)
+        self.cache.put(cache_key, frame_lines, size=size)
     
     def clear(self):
         """Clear frame cache"""
@@ -305,8 +2215,12 @@ class FrameCache:
 class GradientCache:
     """Specialized cache for color gradients"""
     
-    def __init__(self, max_gradients: int = 200):
-        self.cache = LRUCache(max_size=max_gradients, ttl_seconds=300)  # 5 min TTL
+    def __init__(self, max_gradients: int = 200, num_shards: int = 1,
+                 l2: Optional[DiskCache] = None, backend: str = "memory",
+                 policy: str = "lru"):
+        self.cache = make_cache(max_size=max_gradients, ttl_seconds=300,  # 5 min TTL
+                                num_shards=num_shards, l2=l2,
+                                backend=backend, name="gradients", policy=policy)
     
     @staticmethod
     def _make_key(palette: str, length: int, style: str) -> str:
@@ -318,10 +2232,11 @@ class GradientCache:
         key = self._make_key(palette, length, style)
         return self.cache.get(key)
     
-    def store_gradient(self, palette: str, length: int, style: str, sequence: List[Any]):
+    def store_gradient(self, palette: str, length: int, style: str, sequence: List[Any],
+                       ttl: Optional[float] = None):
         """Store gradient sequence"""
         key = self._make_key(palette, length, style)
-        self.cache.put(key, sequence)
+        self.cache.put(key, sequence, ttl=ttl)
     
     def clear(self):
         """Clear gradient cache"""
@@ -337,17 +2252,71 @@ class GradientCache:
 # ============================================================================
 
 class CacheManager:
-    """Global cache manager for coordinating all caches"""
+    """Global cache manager for coordinating all caches
+
+    With ``persistent=True`` the frame and gradient caches are backed by a
+    DiskCache under ``cache_dir`` so new processes start warm. With
+    ``backend="shared"`` every cache lives in shared memory and is shared
+    by all worker processes on the host. ``policies`` maps cache names
+    ('frames', 'gradients', 'general') to eviction policy names.
+    """
     
-    def __init__(self):
-        self.frame_cache = FrameCache(max_frames=60, max_memory_mb=5.0)
-        self.gradient_cache = GradientCache(max_gradients=200)
-        self.object_pools: Dict[str, ObjectPool] = {}
-        self.general_cache = LRUCache(max_size=500, max_memory_mb=10.0)
+    def __init__(self, num_shards: int = 8, persistent: bool = False,
+                 cache_dir: str = DEFAULT_CACHE_DIR, backend: str = "memory",
+                 policies: Optional[Dict[str, str]] = None):
+        self.num_shards = num_shards
+        self.backend = backend
+        self.policies = {'frames': 'lru', 'gradients': 'lru', 'general': 'lru',
+                         **(policies or {})}
+        self.disk_caches: Dict[str, DiskCache] = {}
+        if persistent:
+            for name in ('frames', 'gradients'):
+                try:
+                    self.disk_caches[name] = DiskCache(namespace=name, cache_dir=cache_dir)
+                except (OSError, sqlite3.Error):
+                    pass  # Fall back to memory-only caching
+        self.frame_cache = FrameCache(max_frames=60, max_memory_mb=5.0,
+                                      num_shards=num_shards,
+                                      l2=self.disk_caches.get('frames'),
+                                      backend=backend, policy=self.policies['frames'])
+        self.gradient_cache = GradientCache(max_gradients=200, num_shards=num_shards,
+                                            l2=self.disk_caches.get('gradients'),
+                                            backend=backend,
+                                            policy=self.policies['gradients'])
+        self.canvas_pool = CanvasPool()
+        self.object_pools: Dict[str, Union[ObjectPool, KeyedObjectPool]] = {
+            'canvas': self.canvas_pool
+        }
+        self.general_cache = make_cache(max_size=500, max_memory_mb=10.0,
+                                        num_shards=num_shards, backend=backend,
+                                        name="general", policy=self.policies['general'])
+        self.named_caches: Dict[str, Any] = {
+            'frames': self.frame_cache.cache,
+            'gradients': self.gradient_cache.cache,
+            'general': self.general_cache,
+        }
+        self._reaper: Optional[TTLReaper] = None
+        self._latency_observer_factory: Optional[Callable[[str], LatencyObserver]] = None
+    
+    def register_cache(self, name: str, cache: Any) -> Any:
+        """Track an additional named cache (stats, reaping and metrics)"""
+        self.named_caches[name] = cache
+        if self._latency_observer_factory is not None:
+            cache.set_latency_observer(self._latency_observer_factory(name))
+        return cache
+    
+    def set_latency_observers(self, factory: Optional[Callable[[str], LatencyObserver]]):
+        """Attach factory(cache_name) as latency observer on every named cache"""
+        self._latency_observer_factory = factory
+        for name, cache in self.named_caches.items():
+            cache.set_latency_observer(factory(name) if factory else None)
     
-    def create_object_pool(self, name: str, factory: Callable, max_size: int = 20) -> ObjectPool:
+    def create_object_pool(self, name: str, factory: Callable, max_size: int = 20,
+                           reset: Optional[Callable[[Any], Any]] = None,
+                           preallocate: int = 0) -> ObjectPool:
         """Create named object pool"""
-        pool = ObjectPool(factory=factory, max_size=max_size)
+        pool = ObjectPool(factory=factory, max_size=max_size, reset=reset,
+                          preallocate=preallocate)
         self.object_pools[name] = pool
         return pool
     
@@ -355,13 +2324,33 @@ class CacheManager:
         """Get object pool by name"""
         return self.object_pools.get(name)
     
+    def expire_all(self) -> int:
+        """Reclaim expired entries across all caches"""
+        return sum(cache.expire() for cache in self.named_caches.values())
+    
+    def start_reaper(self, interval: float = 1.0) -> TTLReaper:
+        """Start a background thread reaping expired entries in all caches"""
+        if self._reaper is None or not self._reaper.is_alive():
+            self._reaper = TTLReaper(self.expire_all, interval=interval)
+            self._reaper.start()
+        return self._reaper
+    
+    def stop_reaper(self):
+        """Stop the background reaper thread if running"""
+        reaper, self._reaper = self._reaper, None
+        if reaper is not None:
+            reaper.stop()
+    
     def clear_all(self):
         """Clear all caches"""
         self.frame_cache.clear()
         self.gradient_cache.clear()
         self.general_cache.clear()
+        for name, cache in self.named_caches.items():
+            if name not in ('frames', 'gradients', 'general'):
+                cache.clear()
         for pool in self.object_pools.values():
-            pool.pool.clear()
+            pool.clear()
     
     def stats(self) -> Dict[str, Any]:
         """Get statistics for all caches"""
@@ -369,6 +2358,15 @@ class CacheManager:
             'frame_cache': self.frame_cache.stats(),
             'gradient_cache': self.gradient_cache.stats(),
             'general_cache': self.general_cache.stats(),
+            'named_caches': {
+                name: cache.stats()
+                for name, cache in self.named_caches.items()
+                if name not in ('frames', 'gradients', 'general')
+            },
+            'disk_caches': {
+                name: disk.stats()
+                for name, disk in self.disk_caches.items()
+            },
             'object_pools': {
                 name: pool.stats() 
                 for name, pool in self.object_pools.items()
@@ -395,6 +2393,20 @@ class CacheManager:
         for key, value in stats['general_cache'].items():
             print(f"  {key}: {value}")
         
+        if stats['named_caches']:
+            print("\n🗂️ NAMED CACHES:")
+            for cache_name, cache_stats in stats['named_caches'].items():
+                print(f"  {cache_name}:")
+                for key, value in cache_stats.items():
+                    print(f"    {key}: {value}")
+        
+        if stats['disk_caches']:
+            print("\n🗄️ DISK CACHES:")
+            for disk_name, disk_stats in stats['disk_caches'].items():
+                print(f"  {disk_name}:")
+                for key, value in disk_stats.items():
+                    print(f"    {key}: {value}")
+        
         if stats['object_pools']:
             print("\n🔄 OBJECT POOLS:")
             for pool_name, pool_stats in stats['object_pools'].items():
@@ -409,8 +2421,15 @@ class CacheManager:
 # GLOBAL INSTANCE
 # ============================================================================
 
-# Create global cache manager instance
-_global_cache_manager = CacheManager()
+# Create global cache manager instance; set NEXUS_CACHE_PERSIST=1 to back
+# frames and gradients with the on-disk tier (NEXUS_CACHE_DIR overrides
+# the location), and NEXUS_CACHE_BACKEND=shared to share caches between
+# uvicorn/gunicorn workers on one host
+_global_cache_manager = CacheManager(
+    persistent=os.environ.get('NEXUS_CACHE_PERSIST', '').lower() in ('1', 'true', 'yes'),
+    cache_dir=os.environ.get('NEXUS_CACHE_DIR', DEFAULT_CACHE_DIR),
+    backend=os.environ.get('NEXUS_CACHE_BACKEND', 'memory')
+)
 
 
 def get_cache_manager() -> CacheManager:
@@ -418,6 +2437,165 @@ def get_cache_manager() -> CacheManager:
     return _global_cache_manager
 
 
+# ============================================================================
+# PROMETHEUS EXPORT
+# ============================================================================
+
+# Sub-millisecond buckets: cache operations are far faster than requests
+CACHE_LATENCY_BUCKETS = (1e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4,
+                         5e-4, 1e-3, 5e-3, 1e-2, 5e-2)
+
+
+class CacheMetricsCollector:
+    """Prometheus collector reading CacheManager stats at scrape time
+
+    Counters and gauges are derived from stats() on every scrape, so the
+    cache hot paths carry no metrics cost beyond the latency timers.
+    """
+    
+    def __init__(self, manager: CacheManager):
+        self.manager = manager
+    
+    def collect(self):
+        hits = CounterMetricFamily('nexus_cache_hits', 'Cache hits', labels=['cache'])
+        misses = CounterMetricFamily('nexus_cache_misses', 'Cache misses', labels=['cache'])
+        evictions = CounterMetricFamily('nexus_cache_evictions', 'Cache evictions',
+                                        labels=['cache', 'reason'])
+        entries = GaugeMetricFamily('nexus_cache_entries', 'Entries currently cached',
+                                    labels=['cache'])
+        bytes_used = GaugeMetricFamily('nexus_cache_bytes', 'Bytes charged to cached entries',
+                                       labels=['cache'])
+        bytes_limit = GaugeMetricFamily('nexus_cache_max_bytes', 'Cache memory budget',
+                                        labels=['cache'])
+        for name, cache in list(self.manager.named_caches.items()):
+            stats = cache.stats()
+            hits.add_metric([name], stats['hits'])
+            misses.add_metric([name], stats['misses'])
+            for reason, count in stats['evictions_by_reason'].items():
+                evictions.add_metric([name, reason], count)
+            entries.add_metric([name], stats['size'])
+            bytes_used.add_metric([name], stats['memory_bytes'])
+            bytes_limit.add_metric([name], stats['max_memory_mb'] * 1024 * 1024)
+        yield from (hits, misses, evictions, entries, bytes_used, bytes_limit)
+        
+        created = CounterMetricFamily('nexus_pool_created', 'Objects created by pool',
+                                      labels=['pool'])
+        reused = CounterMetricFamily('nexus_pool_reused', 'Objects reused from pool',
+                                     labels=['pool'])
+        idle = GaugeMetricFamily('nexus_pool_idle', 'Objects idle in pool', labels=['pool'])
+        outstanding = GaugeMetricFamily('nexus_pool_outstanding',
+                                        'Objects acquired and not yet released',
+                                        labels=['pool'])
+        for name, pool in list(self.manager.object_pools.items()):
+            stats = pool.stats()
+            created.add_metric([name], stats['created'])
+            reused.add_metric([name], stats['reused'])
+            idle.add_metric([name], stats['pool_size'])
+            outstanding.add_metric([name], stats['outstanding'])
+        yield from (created, reused, idle, outstanding)
+
+
+_registered_metrics: Dict[int, Any] = {}
+
+
+def register_cache_metrics(manager: Optional[CacheManager] = None, registry: Any = None) -> bool:
+    """Publish every named cache and object pool of manager to Prometheus
+
+    Registers a CacheMetricsCollector plus a get/put latency histogram
+    with ``registry`` (the default prometheus_client registry if omitted),
+    so they are served by the existing /metrics endpoint. Safe to call
+    more than once; returns False if prometheus_client is not installed.
+    """
+    if prometheus_client is None:
+        return False
+    manager = manager or get_cache_manager()
+    registry = registry or prometheus_client.REGISTRY
+    key = id(registry)
+    if key in _registered_metrics:
+        return True
+    
+    latency = prometheus_client.Histogram(
+        'nexus_cache_operation_latency_seconds',
+        'Latency of cache get/put operations',
+        ['cache', 'op'],
+        buckets=CACHE_LATENCY_BUCKETS,
+        registry=registry,
+    )
+    
+    def observer_for(cache_name: str) -> LatencyObserver:
+        children = {op: latency.labels(cache=cache_name, op=op) for op in ('get', 'put')}
+        return lambda op, seconds: children[op].observe(seconds)
+    
+    registry.register(CacheMetricsCollector(manager))
+    manager.set_latency_observers(observer_for)
+    _registered_metrics[key] = latency
+    return True
+
+
+# ============================================================================
+# BENCHMARKS
+# ============================================================================
+
+def benchmark_put_latency(value_sizes: Tuple[int, ...] = (10, 100, 1_000, 10_000, 100_000),
+                          iterations: int = 2_000,
+                          sizer: Optional[Sizer] = None) -> Dict[int, float]:
+    """Measure mean LRUCache.put latency (microseconds) per value size.
+
+    Values are nested frames (list of str rows) with ``value_size`` rows, so
+    a sizer that walks the value shows latency growing with size while the
+    default shallow sizer stays flat.
+    """
+    results: Dict[int, float] = {}
+    for value_size in value_sizes:
+        cache = LRUCache(max_size=64, max_memory_mb=1024.0, sizer=sizer)
+        value = ["#" * 80 for _ in range(value_size)]
+        keys = [f"k{i % 64}" for i in range(iterations)]
+        start = time.perf_counter()
+        for key in keys:
+            cache.put(key, value)
+        elapsed = time.perf_counter() - start
+        results[value_size] = elapsed / iterations * 1_000_000
+    return results
+
+
+def load_access_trace(path: str) -> List[str]:
+    """Load a recorded access log: one cache key per line (blank lines skipped)"""
+    with open(path) as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def synthetic_access_trace(length: int = 50_000, hot_keys: int = 200,
+                           scan_keys: int = 5_000, scan_every: int = 10_000,
+                           seed: int = 7) -> List[str]:
+    """Zipf-like hot set interrupted by periodic full scans (e.g. GET /registry)"""
+    import random
+    rng = random.Random(seed)
+    weights = [1.0 / (rank + 1) for rank in range(hot_keys)]
+    trace: List[str] = []
+    while len(trace) < length:
+        trace.extend(f"hot:{i}" for i in rng.choices(range(hot_keys), weights, k=scan_every))
+        trace.extend(f"scan:{i}" for i in range(scan_keys))
+    return trace[:length]
+
+
+def benchmark_policies(trace: Iterable[Any], capacity: int = 100,
+                       policies: Iterable[str] = tuple(EVICTION_POLICIES)) -> Dict[str, float]:
+    """Replay an access trace through each policy and report hit ratio (%)
+
+    Every access is a get(); misses are followed by a put(), as a
+    read-through cache would do.
+    """
+    trace = list(trace)
+    results: Dict[str, float] = {}
+    for policy in policies:
+        cache = LRUCache(max_size=capacity, max_memory_mb=1024.0, policy=policy)
+        for key in trace:
+            if cache.get(key, _MISSING) is _MISSING:
+                cache.put(key, True, size=1)
+        results[policy] = cache.stats()['hit_rate_percent']
+    return results
+
+
 # ============================================================================
 # EXAMPLE USAGE
 # ============================================================================
@@ -456,9 +2634,8 @@ if __name__ == "__main__":
     
     # Create and reuse objects
     for i in range(10):
-        obj = pool.acquire()
-        # Use object...
-        pool.release(obj)
+        with pool.lease() as obj:
+            pass  # Use object...
     
     print(f"Pool stats: {pool.stats()}")
     
@@ -473,6 +2650,21 @@ if __name__ == "__main__":
     retrieved = frame_cache.get_frame("cube_1", (0.0, 0.0, 0.0))
     print(f"Frame retrieved: {retrieved == test_frame}")
     
+    # Example: put latency vs. value size
+    print("\n\nBenchmarking put latency (µs/op)...")
+    shallow = benchmark_put_latency()
+    deep = benchmark_put_latency(iterations=200, sizer=deep_sizer)
+    for value_size in shallow:
+        print(f"  rows={value_size:>7}: shallow={shallow[value_size]:8.2f}  "
+              f"deep={deep[value_size]:10.2f}")
+    
+    # Example: eviction policy hit ratios on a scan-polluted trace
+    print("\n\nReplaying access trace through eviction policies (hit %)...")
+    trace_path = sys.argv[1] if len(sys.argv) > 1 else None
+    trace = load_access_trace(trace_path) if trace_path else synthetic_access_trace()
+    for policy_name, hit_ratio in benchmark_policies(trace).items():
+        print(f"  {policy_name:>8}: {hit_ratio:6.2f}")
+    
     # Print all stats
     print("\n")
     manager.print_stats()
@@ -497,6 +2689,7 @@ if __name__ == "__main__":
 # │                                                                                │ #
 # │  Primary Classes:                                                              │ #
 # │    • LRUCache - Least-Recently-Used caching with TTL support                 │ #
+# │    • ShardedLRUCache - Lock-striped LRU segments for multi-threaded use      │ #
 # │    • ObjectPool - Efficient object reuse and pooling                          │ #
 # │    • CacheManager - Unified cache management interface                        │ #
 # │    • FrameCache - Specialized cache for rendering frames                      │ #
@@ -21,6 +21,7 @@ import base64
 import shutil
 import textwrap
 import itertools
+import contextlib
 
 # Import advanced cache and error handling
 try:
@@ -35,6 +36,12 @@ except ImportError:
     import warnings
     warnings.warn("Advanced cache/error handling not available - using fallback mode")
 
+def _lease_canvas(width: int, height: int):
+    """Borrow a blank width x height canvas from the shared canvas pool"""
+    if ADVANCED_FEATURES:
+        return get_cache_manager().canvas_pool.lease(width, height)
+    return contextlib.nullcontext([[' ' for _ in range(width)] for _ in range(height)])
+
 # Setup logger
 if ADVANCED_FEATURES:
     _logger = setup_logger("nexus_visuals", LogLevel.INFO)
@@ -426,9 +433,18 @@ class WireframeObject:
     
     def render(self, width: int, height: int) -> List[str]:
         """Render object to terminal"""
-        # Create empty canvas
-        canvas = [[' ' for _ in range(width)] for _ in range(height)]
+        with _lease_canvas(width, height) as canvas:
+            lines = self._draw(canvas, width, height)
+        
+        # Add color
+        colored_lines = []
+        for line in lines:
+            colored_lines.append(self.color_engine.gradient_text(line, "quantum"))
         
+        return colored_lines
+    
+    def _draw(self, canvas: List[List[str]], width: int, height: int) -> List[str]:
+        """Rasterize edges onto a blank canvas and return its lines"""
         # Transform vertices
         transformed = []
         for v in self.vertices:
@@ -462,14 +478,7 @@ class WireframeObject:
                     canvas[y][x] = '█'
         
         # Convert canvas to strings
-        lines = [''.join(row) for row in canvas]
-        
-        # Add color
-        colored_lines = []
-        for line in lines:
-            colored_lines.append(self.color_engine.gradient_text(line, "quantum"))
-        
-        return colored_lines
+        return [''.join(row) for row in canvas]
     
     def _bresenham_line(self, x1: int, y1: int, x2: int, y2: int) -> List[Tuple[int, int]]:
         """Bresenham's line algorithm"""
@@ -605,26 +614,25 @@ class NexusVisualsEngine:
             for obj in self.wireframe_objects:
                 obj.rotate(0.01, 0.02, 0.005)
         
-        # Create canvas
-        canvas = [[' ' for _ in range(self.width)] for _ in range(self.height)]
-        
-        # Add 3D objects
-        for obj in self.wireframe_objects:
-            obj_lines = obj.render(self.width, self.height)
-            for y, line in enumerate(obj_lines):
-                if y >= self.height:
-                    break
-                for x, char in enumerate(line):
-                    if x >= self.width:
+        # Compose objects onto a pooled canvas
+        with _lease_canvas(self.width, self.height) as canvas:
+            # Add 3D objects
+            for obj in self.wireframe_objects:
+                obj_lines = obj.render(self.width, self.height)
+                for y, line in enumerate(obj_lines):
+                    if y >= self.height:
                         break
-                    if char != ' ':
-                        canvas[y][x] = char
+                    for x, char in enumerate(line):
+                        if x >= self.width:
+                            break
+                        if char != ' ':
+                            canvas[y][x] = char
+            
+            rows = [''.join(row) for row in canvas]
         
         # Convert to lines
         lines = []
-        for y, row in enumerate(canvas):
-            line = ''.join(row)
-            
+        for y, line in enumerate(rows):
             # Apply effects
             if self.gradient_enabled and y % 3 == 0:
                 line = self.color_engine.gradient_text(line, "quantum", y)
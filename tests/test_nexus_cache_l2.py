@@ -0,0 +1,148 @@
+import sqlite3
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT))
+
+import nexus_cache
+from nexus_cache import CacheManager, DiskCache, LRUCache, ShardedLRUCache
+
+
+class DiskTierTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.disk = DiskCache(namespace="test", cache_dir=self.tmp.name)
+        self.addCleanup(self.disk.close)
+
+    def raw(self, sql, *params):
+        conn = sqlite3.connect(self.disk.db_path)
+        conn.execute(sql, params)
+        conn.commit()
+        conn.close()
+
+    def test_new_process_starts_warm(self):
+        LRUCache(max_size=10, l2=self.disk).put("a", [1, 2])
+        cold = LRUCache(max_size=10, l2=DiskCache(namespace="test", cache_dir=self.tmp.name))
+        self.assertEqual(cold.get("a"), [1, 2])
+        self.assertEqual(cold.stats()['l2_hits'], 1)
+        self.assertIn("a", cold.cache)
+
+    def test_bad_checksum_is_a_miss(self):
+        cache = LRUCache(max_size=10, l2=self.disk)
+        cache.put("a", [1, 2])
+        cache.put("b", "fine")
+        self.raw("UPDATE cache_entries SET checksum = checksum + 1 WHERE key = 'a'")
+        cache._clear_memory()
+
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("b"), "fine")
+        self.assertEqual(self.disk.stats()['corrupt'], 1)
+        self.assertEqual(self.disk.stats()['size'], 1)
+
+    def test_undecodable_record_is_a_miss(self):
+        cache = LRUCache(max_size=10, l2=self.disk)
+        cache.put("a", [1, 2])
+        blob = b"\x80\x05not a pickle"
+        self.raw("UPDATE cache_entries SET value = ?, checksum = ? WHERE key = 'a'",
+                 blob, nexus_cache.zlib.crc32(blob))
+        cache._clear_memory()
+
+        self.assertEqual(cache.get("a", "fallback"), "fallback")
+        self.assertEqual(self.disk.stats()['errors'], 1)
+
+    def test_unreadable_database_degrades_to_memory(self):
+        cache = LRUCache(max_size=10, l2=self.disk)
+        cache.put("a", 1)
+        self.raw("DROP TABLE cache_entries")
+        cache.put("b", 2)
+        cache._clear_memory()
+
+        self.assertIsNone(cache.get("a"))
+        cache.put("c", 3)
+        self.assertEqual(cache.get("c"), 3)
+        self.assertGreater(self.disk.stats()['errors'], 0)
+
+    def test_corrupt_file_falls_back_to_memory_only(self):
+        Path(self.tmp.name, "broken").mkdir()
+        Path(self.tmp.name, "broken", "l2.sqlite3").write_bytes(b"not a database" * 100)
+        manager = CacheManager(num_shards=1, persistent=True,
+                               cache_dir=str(Path(self.tmp.name, "broken")))
+        self.assertEqual(manager.disk_caches, {})
+        manager.frame_cache.store_frame("cube", (0.0, 0.0, 0.0), ["x"])
+        self.assertEqual(manager.frame_cache.get_frame("cube", (0.0, 0.0, 0.0)), ["x"])
+
+    def test_invalidate_drops_the_disk_copy(self):
+        cache = LRUCache(max_size=10, l2=self.disk)
+        cache.put("a", [1, 2])
+        cache.invalidate("a")
+        self.assertIsNone(cache.get("a"))
+        self.assertIsNone(self.disk.get("a"))
+
+        sharded = ShardedLRUCache(max_size=10, num_shards=2, l2=self.disk)
+        sharded.put("b", 1)
+        sharded.invalidate("b")
+        self.assertIsNone(sharded.get("b"))
+
+    def test_promotion_keeps_remaining_ttl(self):
+        now = [1000.0]
+        with mock.patch.object(nexus_cache.time, "time", lambda: now[0]):
+            LRUCache(max_size=10, l2=self.disk).put("a", 1, ttl=10)
+            now[0] += 8
+            cache = LRUCache(max_size=10, ttl_seconds=60, l2=self.disk)
+            self.assertEqual(cache.get("a"), 1)
+            self.assertEqual(cache.cache["a"].expires_at, 1010.0)
+            now[0] += 3
+            self.assertIsNone(cache.get("a"))
+
+    def test_put_during_disk_read_is_not_overwritten(self):
+        cache = LRUCache(max_size=10, l2=self.disk)
+        cache.put("a", "old")
+        cache._clear_memory()
+        read = self.disk.get_with_expiry
+
+        def racing_read(key, default=None):
+            result = read(key, default)
+            # A writer lands between the disk read and the promotion
+            thread = threading.Thread(target=cache.put, args=("a", "new"))
+            thread.start()
+            thread.join()
+            return result
+
+        with mock.patch.object(self.disk, "get_with_expiry", racing_read):
+            self.assertEqual(cache.get("a"), "new")
+        self.assertEqual(cache.get("a"), "new")
+
+    def test_invalidate_during_disk_read_is_not_undone(self):
+        cache = LRUCache(max_size=10, l2=self.disk)
+        cache.put("a", "old")
+        cache._clear_memory()
+        read = self.disk.get_with_expiry
+
+        def racing_read(key, default=None):
+            result = read(key, default)
+            cache.invalidate("a")
+            return result
+
+        with mock.patch.object(self.disk, "get_with_expiry", racing_read):
+            cache.get("a")
+        self.assertNotIn("a", cache.cache)
+        self.assertIsNone(cache.get("a"))
+
+    def test_get_many_promotes_disk_hits(self):
+        cache = LRUCache(max_size=10, l2=self.disk)
+        cache.put_many({"a": 1, "b": 2})
+        cache._clear_memory()
+        self.assertEqual(cache.get_many(["a", "b", "c"]), {"a": 1, "b": 2})
+        self.assertEqual(set(cache.cache), {"a", "b"})
+        stats = cache.stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['l2_hits']), (2, 1, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT))
+
+import nexus_cache
+from nexus_cache import CacheManager, LRUCache, register_cache_metrics
+
+try:
+    from prometheus_client import CollectorRegistry
+except ImportError:
+    CollectorRegistry = None
+
+
+def make_manager():
+    manager = CacheManager(num_shards=2)
+    manager.general_cache.put("a", 1, size=100)
+    manager.general_cache.get("a")
+    manager.general_cache.get("missing")
+    manager.register_cache("small", LRUCache(max_size=2))
+    for key in "xyz":
+        manager.named_caches["small"].put(key, key, size=10)
+    pool = manager.create_object_pool("buffers", list, max_size=4)
+    with pool.lease():
+        pass
+    with pool.lease():
+        pass
+    return manager
+
+
+class LatencyObserverTests(unittest.TestCase):
+    def test_observers_see_every_named_cache(self):
+        manager = CacheManager(num_shards=2)
+        calls = []
+        manager.set_latency_observers(lambda name: lambda op, s: calls.append((name, op)))
+        manager.register_cache("extra", LRUCache(max_size=4))
+        manager.general_cache.put("a", 1)
+        manager.general_cache.get("a")
+        manager.named_caches["extra"].get("b")
+        self.assertEqual(calls, [("general", "put"), ("general", "get"), ("extra", "get")])
+
+        manager.set_latency_observers(None)
+        manager.general_cache.get("a")
+        self.assertEqual(len(calls), 3)
+
+    def test_register_without_prometheus_is_a_no_op(self):
+        with mock.patch.object(nexus_cache, "prometheus_client", None):
+            self.assertFalse(register_cache_metrics(CacheManager(num_shards=1)))
+
+
+@unittest.skipIf(CollectorRegistry is None, "prometheus_client not installed")
+class CollectorOutputTests(unittest.TestCase):
+    def setUp(self):
+        self.manager = make_manager()
+        self.registry = CollectorRegistry()
+        self.assertTrue(register_cache_metrics(self.manager, self.registry))
+
+    def sample(self, name, **labels):
+        return self.registry.get_sample_value(name, labels)
+
+    def test_cache_counters_and_gauges(self):
+        self.assertEqual(self.sample("nexus_cache_hits_total", cache="general"), 1)
+        self.assertEqual(self.sample("nexus_cache_misses_total", cache="general"), 1)
+        self.assertEqual(self.sample("nexus_cache_entries", cache="general"), 1)
+        self.assertEqual(self.sample("nexus_cache_bytes", cache="general"), 100)
+        self.assertEqual(self.sample("nexus_cache_max_bytes", cache="general"),
+                         10 * 1024 * 1024)
+        self.assertEqual(
+            self.sample("nexus_cache_evictions_total", cache="small", reason="size"), 1
+        )
+        self.assertEqual(
+            self.sample("nexus_cache_evictions_total", cache="small", reason="ttl"), 0
+        )
+        for name in ("frames", "gradients"):
+            self.assertEqual(self.sample("nexus_cache_entries", cache=name), 0)
+
+    def test_pool_metrics(self):
+        self.assertEqual(self.sample("nexus_pool_created_total", pool="buffers"), 1)
+        self.assertEqual(self.sample("nexus_pool_reused_total", pool="buffers"), 1)
+        self.assertEqual(self.sample("nexus_pool_idle", pool="buffers"), 1)
+        self.assertEqual(self.sample("nexus_pool_outstanding", pool="buffers"), 0)
+        self.assertIsNotNone(self.sample("nexus_pool_idle", pool="canvas"))
+
+    def test_latency_histogram_and_idempotent_registration(self):
+        self.manager.general_cache.get("a")
+        self.manager.general_cache.put("b", 2)
+        count = self.sample("nexus_cache_operation_latency_seconds_count",
+                            cache="general", op="get")
+        self.assertEqual(count, 1)
+        self.assertEqual(self.sample("nexus_cache_operation_latency_seconds_count",
+                                     cache="general", op="put"), 1)
+        self.assertTrue(register_cache_metrics(self.manager, self.registry))
+        self.assertEqual(self.sample("nexus_cache_operation_latency_seconds_count",
+                                     cache="general", op="get"), count)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import pickle
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT))
+
+import nexus_cache
+from nexus_cache import NEGATIVE, DiskCache, LRUCache, ShardedLRUCache
+
+
+class NegativeCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.now = 1000.0
+        patcher = mock.patch.object(nexus_cache.time, "time", lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_negative_entry_expires_and_is_replaced(self):
+        cache = LRUCache(max_size=10, negative_ttl=5)
+        cache.put_negative("gone")
+        self.assertIs(cache.get("gone"), NEGATIVE)
+        self.assertEqual(cache.stats()['negative_hits'], 1)
+        self.assertEqual(cache.stats()['hits'], 0)
+
+        cache.put("gone", "back")
+        self.assertEqual(cache.get("gone"), "back")
+
+        cache.put_negative("gone", ttl=1)
+        self.now += 2
+        self.assertIsNone(cache.get("gone"))
+
+    def test_batches_and_shards(self):
+        cache = ShardedLRUCache(max_size=64, num_shards=4, negative_ttl=5)
+        cache.put_many({"a": 1, "b": 2})
+        cache.put_negative_many(["b", "c", "d"])
+        self.assertEqual(cache.get_many(["a", "b", "c", "e"]),
+                         {"a": 1, "b": NEGATIVE, "c": NEGATIVE})
+        self.assertEqual(cache.stats()['negative_hits'], 2)
+
+    def test_marker_survives_pickling(self):
+        self.assertIs(pickle.loads(pickle.dumps(NEGATIVE)), NEGATIVE)
+
+
+class NegativeDiskTierTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.disk = DiskCache(namespace="neg", cache_dir=self.tmp.name)
+        self.addCleanup(self.disk.close)
+
+    def test_expired_negative_does_not_resurrect_disk_value(self):
+        cache = LRUCache(max_size=10, l2=self.disk, negative_ttl=0)
+        cache.put("a", "stale")
+        cache.put_negative("a")
+        self.assertIsNone(self.disk.get("a"))
+        self.assertIsNone(cache.get("a"))
+
+    def test_batch_negatives_clear_disk_copies(self):
+        cache = ShardedLRUCache(max_size=10, num_shards=2, l2=self.disk, negative_ttl=0)
+        cache.put_many({"a": 1, "b": 2, "c": 3})
+        cache.put_negative_many(["a", "b"])
+        self.assertEqual(cache.get_many(["a", "b", "c"]), {"c": 3})
+        self.assertEqual(self.disk.stats()['size'], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
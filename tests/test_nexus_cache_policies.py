@@ -0,0 +1,167 @@
+import random
+import sys
+import unittest
+from collections import OrderedDict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT))
+
+from nexus_cache import (
+    EVICTION_POLICIES,
+    ARCPolicy,
+    LFUPolicy,
+    LRUCache,
+    LRUPolicy,
+    TinyLFUPolicy,
+    make_policy,
+)
+
+
+def resident_keys(policy):
+    if isinstance(policy, LRUPolicy):
+        return set(policy.order)
+    if isinstance(policy, LFUPolicy):
+        return set(policy.freq)
+    if isinstance(policy, ARCPolicy):
+        return set(policy.t1) | set(policy.t2)
+    if isinstance(policy, TinyLFUPolicy):
+        return set(policy.window) | set(policy.probation) | set(policy.protected)
+    raise TypeError(policy)
+
+
+def reference_arc(trace, c):
+    """Hit count and final lists of ARC exactly as published (Megiddo & Modha)"""
+    t1, t2, b1, b2 = OrderedDict(), OrderedDict(), OrderedDict(), OrderedDict()
+    p, hits = 0.0, 0
+
+    def replace(x):
+        if t1 and (len(t1) > p or (x in b2 and len(t1) == p)):
+            b1[t1.popitem(last=False)[0]] = None
+        else:
+            b2[t2.popitem(last=False)[0]] = None
+
+    for x in trace:
+        if x in t1 or x in t2:
+            t1.pop(x, None)
+            t2.pop(x, None)
+            t2[x] = None
+            hits += 1
+        elif x in b1:
+            p = min(c, p + max(len(b2) / len(b1), 1))
+            replace(x)
+            del b1[x]
+            t2[x] = None
+        elif x in b2:
+            p = max(0.0, p - max(len(b1) / len(b2), 1))
+            replace(x)
+            del b2[x]
+            t2[x] = None
+        else:
+            if len(t1) + len(b1) == c:
+                if len(t1) < c:
+                    b1.popitem(last=False)
+                    replace(x)
+                else:
+                    t1.popitem(last=False)
+            else:
+                total = len(t1) + len(t2) + len(b1) + len(b2)
+                if total >= c:
+                    if total == 2 * c:
+                        b2.popitem(last=False)
+                    replace(x)
+            t1[x] = None
+    return hits, (list(t1), list(t2), list(b1), list(b2))
+
+
+class PolicyInvariantTests(unittest.TestCase):
+    def check(self, cache):
+        self.assertLessEqual(len(cache.cache), cache.max_size)
+        self.assertEqual(cache.current_memory, sum(e.size_bytes for e in cache.cache.values()))
+        self.assertLessEqual(cache.current_memory, cache.max_memory)
+        self.assertEqual(resident_keys(cache.policy), set(cache.cache))
+        policy = cache.policy
+        if isinstance(policy, ARCPolicy):
+            c = policy.capacity
+            self.assertLessEqual(len(policy.t1) + len(policy.b1), c)
+            self.assertLessEqual(
+                len(policy.t1) + len(policy.t2) + len(policy.b1) + len(policy.b2), 2 * c
+            )
+            self.assertTrue(0 <= policy.p <= c)
+            self.assertFalse((set(policy.b1) | set(policy.b2)) & set(cache.cache))
+            self.assertFalse(set(policy.b1) & set(policy.b2))
+
+    def test_random_operations_keep_size_and_memory_bounds(self):
+        for name in EVICTION_POLICIES:
+            with self.subTest(policy=name):
+                rng = random.Random(11)
+                cache = LRUCache(max_size=32, max_memory_mb=2000 / (1024 * 1024), policy=name)
+                for _ in range(5000):
+                    key = f"k{int(rng.paretovariate(1.2)) % 120}"
+                    op = rng.random()
+                    if op < 0.55:
+                        if cache.get(key) is None:
+                            cache.put(key, key, size=rng.randint(10, 120))
+                    elif op < 0.85:
+                        cache.put(key, key, size=rng.randint(10, 120))
+                    elif op < 0.95:
+                        cache.invalidate(key)
+                    else:
+                        cache.put_negative(key)
+                    self.check(cache)
+                stats = cache.stats()
+                self.assertGreater(stats['evictions_by_reason']['memory'], 0)
+                self.assertGreater(stats['evictions_by_reason']['size'], 0)
+
+    def test_arc_matches_the_published_algorithm(self):
+        rng = random.Random(5)
+        trace = [rng.choice(range(60)) if rng.random() < 0.7 else rng.randrange(1000)
+                 for _ in range(20_000)]
+        cache = LRUCache(max_size=25, max_memory_mb=1024.0, policy="arc")
+        for key in trace:
+            if cache.get(key) is None:
+                cache.put(key, True, size=1)
+
+        hits, lists = reference_arc(trace, 25)
+        policy = cache.policy
+        self.assertEqual(cache.stats()['hits'], hits)
+        self.assertEqual((list(policy.t1), list(policy.t2), list(policy.b1), list(policy.b2)),
+                         lists)
+
+    def test_scan_does_not_flush_frequent_keys(self):
+        hot = [f"hot{i}" for i in range(20)]
+        for name in ("arc", "tinylfu", "lfu"):
+            with self.subTest(policy=name):
+                cache = LRUCache(max_size=40, max_memory_mb=1024.0, policy=name)
+                for _ in range(5):
+                    for key in hot:
+                        if cache.get(key) is None:
+                            cache.put(key, True, size=1)
+                for i in range(400):
+                    cache.put(f"scan{i}", True, size=1)
+                self.assertGreaterEqual(sum(key in cache.cache for key in hot), 16)
+
+        cache = LRUCache(max_size=40, max_memory_mb=1024.0, policy="lru")
+        for key in hot:
+            cache.put(key, True, size=1)
+        for i in range(400):
+            cache.put(f"scan{i}", True, size=1)
+        self.assertFalse(any(key in cache.cache for key in hot))
+
+    def test_lfu_evicts_least_frequent(self):
+        policy = make_policy("lfu", 3)
+        for key in "abc":
+            policy.on_insert(key)
+        policy.on_hit("a")
+        policy.on_hit("a")
+        policy.on_hit("c")
+        self.assertEqual(policy.victim(), "b")
+        self.assertEqual(policy.victim(), "c")
+
+    def test_unknown_policy_rejected(self):
+        with self.assertRaises(ValueError):
+            make_policy("mru", 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
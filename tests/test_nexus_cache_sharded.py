@@ -0,0 +1,102 @@
+import sys
+import threading
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT))
+
+from nexus_cache import (EVICTION_REASONS, MIN_SHARD_SIZE, CacheManager, LRUCache,
+                         ShardedLRUCache, make_cache, shard_capacity)
+
+
+class ShardedStatsTests(unittest.TestCase):
+    def test_stats_sum_the_segments(self):
+        cache = ShardedLRUCache(max_size=64, num_shards=4)
+        for i in range(40):
+            cache.put(f"k{i}", i, size=10)
+        for i in range(50):
+            cache.get(f"k{i}")
+
+        stats = cache.stats()
+        per_shard = cache.shard_stats()
+        self.assertEqual(len(per_shard), 4)
+        self.assertEqual(stats['size'], 40)
+        self.assertEqual(stats['size'], sum(s['size'] for s in per_shard))
+        self.assertEqual(len(cache), 40)
+        self.assertEqual((stats['hits'], stats['misses']), (40, 10))
+        self.assertEqual(stats['hit_rate_percent'], 80.0)
+        self.assertEqual(stats['memory_bytes'], 400)
+        self.assertEqual(stats['max_shard_size'], max(s['size'] for s in per_shard))
+        self.assertEqual(stats['shards'], 4)
+
+    def test_evictions_are_aggregated_by_reason(self):
+        cache = ShardedLRUCache(max_size=8, num_shards=4)
+        for i in range(20):
+            cache.put(f"k{i}", i, size=1)
+
+        stats = cache.stats()
+        self.assertLessEqual(stats['size'], sum(shard.max_size for shard in cache.shards))
+        self.assertEqual(stats['evictions'], 20 - stats['size'])
+        self.assertEqual(stats['evictions_by_reason']['size'], stats['evictions'])
+        self.assertEqual(set(stats['evictions_by_reason']), set(EVICTION_REASONS))
+
+    def test_batches_span_segments(self):
+        cache = ShardedLRUCache(max_size=64, num_shards=4)
+        cache.put_many({f"k{i}": i for i in range(10)})
+        found = cache.get_many([f"k{i}" for i in range(12)])
+        self.assertEqual(found, {f"k{i}": i for i in range(10)})
+        self.assertEqual((cache.stats()['hits'], cache.stats()['misses']), (10, 2))
+
+    def test_concurrent_access_keeps_counts_consistent(self):
+        cache = ShardedLRUCache(max_size=256, num_shards=8)
+        threads, rounds = 8, 500
+
+        def worker(index):
+            for i in range(rounds):
+                key = f"t{index}:{i % 50}"
+                if cache.get(key) is None:
+                    cache.put(key, i, size=1)
+
+        pool = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+        for thread in pool:
+            thread.start()
+        for thread in pool:
+            thread.join()
+
+        stats = cache.stats()
+        self.assertEqual(stats['hits'] + stats['misses'], threads * rounds)
+        self.assertLessEqual(stats['size'], sum(shard.max_size for shard in cache.shards))
+        self.assertEqual(stats['size'], len(cache))
+        self.assertEqual(stats['memory_bytes'], stats['size'])
+
+
+
+class ShardSizingTests(unittest.TestCase):
+    def test_segments_get_slack_over_their_share(self):
+        cache = ShardedLRUCache(max_size=64, num_shards=4, max_memory_mb=4.0)
+        self.assertEqual([shard.max_size for shard in cache.shards], [28] * 4)
+        self.assertAlmostEqual(cache.shards[0].max_memory, 4.0 * 1024 * 1024 * 28 / 64)
+        self.assertEqual(shard_capacity(10, 1), 10)
+        self.assertEqual(shard_capacity(3, 8), 3)
+
+    def test_small_caches_stay_unsharded(self):
+        self.assertIsInstance(make_cache(max_size=MIN_SHARD_SIZE * 2 - 1, num_shards=8), LRUCache)
+        sharded = make_cache(max_size=MIN_SHARD_SIZE * 3, num_shards=8)
+        self.assertIsInstance(sharded, ShardedLRUCache)
+        self.assertEqual(sharded.num_shards, 3)
+
+    def test_frame_loop_stays_resident_in_the_default_manager(self):
+        manager = CacheManager()
+        frames = manager.frame_cache
+        rotations = [(0.0, step * 6.0, 0.0) for step in range(60)]
+        for rotation in rotations:
+            frames.store_frame("cube", rotation, ["#"], size=1)
+        for rotation in rotations:
+            self.assertIsNotNone(frames.get_frame("cube", rotation))
+        self.assertEqual(frames.stats()['size'], 60)
+        self.assertEqual(frames.stats()['hit_rate_percent'], 100.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+import multiprocessing
+import sys
+import time
+import unittest
+import uuid
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT))
+
+from nexus_cache import NEGATIVE, SharedMemoryCache, shared_memory
+
+
+def child_round_trip(name, results):
+    cache = SharedMemoryCache(name=name, num_slots=64, slot_size=512)
+    results.put(cache.get("parent"))
+    cache.put("child", [1, 2, 3])
+    cache.put_negative("absent", ttl=60)
+    cache.close()
+
+
+def child_writer(name, prefix, count):
+    cache = SharedMemoryCache(name=name, num_slots=1024, slot_size=256)
+    cache.put_many({f"{prefix}:{i}": (prefix, i) for i in range(count)})
+    cache.close()
+
+
+def child_reader(name, rounds, results):
+    cache = SharedMemoryCache(name=name, num_slots=16, slot_size=512)
+    torn = 0
+    for _ in range(rounds):
+        value = cache.get("hot")
+        if value is not None and value[1] != value[0] * 2:
+            torn += 1
+    cache.close()
+    results.put(torn)
+
+
+@unittest.skipIf(shared_memory is None, "multiprocessing.shared_memory unavailable")
+class SharedMemoryCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.name = f"nexus_test_{uuid.uuid4().hex[:12]}"
+        self.ctx = multiprocessing.get_context("spawn")
+
+    def open(self, **kwargs):
+        cache = SharedMemoryCache(name=self.name, **kwargs)
+
+        def cleanup():
+            cache.close()
+            try:
+                cache.unlink()
+            except FileNotFoundError:
+                pass
+            Path(cache._lock_path).unlink(missing_ok=True)
+
+        self.addCleanup(cleanup)
+        return cache
+
+    def run_child(self, target, *args):
+        process = self.ctx.Process(target=target, args=(self.name, *args))
+        process.start()
+        return process
+
+    def test_second_process_reads_and_writes(self):
+        cache = self.open(num_slots=64, slot_size=512)
+        cache.put("parent", {"x": 1})
+        results = self.ctx.Queue()
+
+        process = self.run_child(child_round_trip, results)
+        self.assertEqual(results.get(timeout=30), {"x": 1})
+        process.join(30)
+
+        self.assertEqual(process.exitcode, 0)
+        self.assertEqual(cache.get("child"), [1, 2, 3])
+        self.assertIs(cache.get("absent"), NEGATIVE)
+        self.assertEqual(cache.stats()['puts'], 3)
+
+    def test_concurrent_writers_from_several_processes(self):
+        cache = self.open(num_slots=1024, slot_size=256)
+        processes = [self.run_child(child_writer, prefix, 100) for prefix in ("a", "b")]
+        for process in processes:
+            process.join(30)
+            self.assertEqual(process.exitcode, 0)
+
+        found = cache.get_many([f"{p}:{i}" for p in ("a", "b") for i in range(100)])
+        self.assertTrue(all(found[key] == (key[0], int(key[2:])) for key in found))
+        self.assertEqual(cache.stats()['puts'], 200)
+        self.assertGreater(len(found), 150)
+
+    def test_readers_never_see_torn_values(self):
+        cache = self.open(num_slots=16, slot_size=512)
+        cache.put("hot", (0, 0))
+        results = self.ctx.Queue()
+        process = self.run_child(child_reader, 20_000, results)
+        i = 0
+        while process.is_alive():
+            i += 1
+            cache.put("hot", (i, i * 2))
+        self.assertEqual(results.get(timeout=30), 0)
+        process.join(30)
+
+    def test_full_window_evicts_with_clock(self):
+        cache = self.open(num_slots=8, slot_size=256)
+        for i in range(20):
+            cache.put(f"k{i}", i)
+        stats = cache.stats()
+        self.assertEqual(stats['size'], 8)
+        self.assertEqual(stats['evictions'], 12)
+        self.assertEqual(stats['puts'], 20)
+        self.assertEqual(cache.get("k19"), 19)
+
+    def test_expiry_oversize_and_delete(self):
+        cache = self.open(num_slots=8, slot_size=128)
+        cache.put("short", 1, ttl=0.01)
+        cache.put("big", "x" * 1000)
+        cache.put("keep", 2)
+        time.sleep(0.02)
+
+        self.assertIsNone(cache.get("short"))
+        self.assertIsNone(cache.get("big"))
+        self.assertEqual(cache.stats()['oversize'], 1)
+        self.assertEqual(cache.expire(), 1)
+        self.assertTrue(cache.delete("keep"))
+        self.assertEqual(cache.stats()['size'], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+import asyncio
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT))
+
+from nexus_cache import SingleFlight, cache_result
+
+
+class SingleFlightTests(unittest.TestCase):
+    def run_threads(self, count, target):
+        barrier = threading.Barrier(count)
+        results, errors = [], []
+
+        def worker():
+            barrier.wait()
+            try:
+                results.append(target())
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results, errors
+
+    def test_one_loader_call_per_key_under_contention(self):
+        calls = []
+
+        @cache_result(max_size=8)
+        def load(key):
+            calls.append(key)
+            time.sleep(0.05)
+            return {"key": key}
+
+        results, errors = self.run_threads(16, lambda: load("a"))
+        self.assertEqual(errors, [])
+        self.assertEqual(calls, ["a"])
+        self.assertEqual(results, [{"key": "a"}] * 16)
+        self.assertEqual(load("a"), {"key": "a"})
+        self.assertEqual(calls, ["a"])
+
+    def test_error_reaches_every_waiter_and_is_not_cached(self):
+        flight = SingleFlight()
+        calls = []
+
+        def fail():
+            calls.append(1)
+            time.sleep(0.05)
+            raise KeyError("boom")
+
+        results, errors = self.run_threads(8, lambda: flight.do("k", fail))
+        self.assertEqual(results, [])
+        self.assertEqual(len(errors), 8)
+        self.assertTrue(all(isinstance(e, KeyError) for e in errors))
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flight.calls, {})
+        self.assertEqual(flight.do("k", lambda: 42), 42)
+
+    def test_none_results_are_cached(self):
+        calls = []
+
+        @cache_result()
+        def lookup(key):
+            calls.append(key)
+            return None
+
+        self.assertIsNone(lookup("x"))
+        self.assertIsNone(lookup("x"))
+        self.assertEqual(calls, ["x"])
+
+
+class AsyncSingleFlightTests(unittest.TestCase):
+    def test_concurrent_coroutines_share_one_call(self):
+        calls = []
+
+        @cache_result(max_size=8)
+        async def load(key):
+            calls.append(key)
+            await asyncio.sleep(0.02)
+            return key.upper()
+
+        async def main():
+            return await asyncio.gather(*(load(k) for k in ["a", "b", "a", "a", "b"]))
+
+        self.assertEqual(asyncio.run(main()), ["A", "B", "A", "A", "B"])
+        self.assertEqual(sorted(calls), ["a", "b"])
+
+    def test_failure_propagates_and_retries(self):
+        attempts = []
+
+        @cache_result()
+        async def flaky(key):
+            attempts.append(key)
+            await asyncio.sleep(0.01)
+            if len(attempts) == 1:
+                raise ValueError("first attempt fails")
+            return key
+
+        async def main():
+            first = await asyncio.gather(flaky("k"), flaky("k"), return_exceptions=True)
+            return first, await flaky("k")
+
+        first, retried = asyncio.run(main())
+        self.assertTrue(all(isinstance(r, ValueError) for r in first))
+        self.assertEqual(retried, "k")
+        self.assertEqual(attempts, ["k", "k"])
+
+    def test_cancelling_the_first_caller_spares_the_others(self):
+        calls = []
+
+        @cache_result()
+        async def load(key):
+            calls.append(key)
+            await asyncio.sleep(0.02)
+            return key.upper()
+
+        async def main():
+            leader = asyncio.ensure_future(load("k"))
+            await asyncio.sleep(0)
+            follower = asyncio.ensure_future(load("k"))
+            await asyncio.sleep(0)
+            leader.cancel()
+            result = await follower
+            with self.assertRaises(asyncio.CancelledError):
+                await leader
+            return result, await load("k")
+
+        self.assertEqual(asyncio.run(main()), ("K", "K"))
+        self.assertEqual(calls, ["k"])
+
+
+if __name__ == "__main__":
+    unittest.main()
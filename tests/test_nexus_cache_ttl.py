@@ -0,0 +1,88 @@
+import sys
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT))
+
+import nexus_cache
+from nexus_cache import LRUCache, ShardedLRUCache
+
+
+def wait_for(predicate, timeout=2.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return predicate()
+
+
+class ExpiryHeapTests(unittest.TestCase):
+    def setUp(self):
+        self.now = 1000.0
+        patcher = mock.patch.object(nexus_cache.time, "time", lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_expire_reclaims_only_due_entries(self):
+        cache = LRUCache(max_size=10)
+        cache.put("short", 1, size=10, ttl=5)
+        cache.put("long", 2, size=10, ttl=50)
+        cache.put("forever", 3, size=10)
+
+        self.now += 10
+        self.assertEqual(cache.expire(), 1)
+        self.assertEqual(set(cache.cache), {"long", "forever"})
+        self.assertEqual(cache.current_memory, 20)
+        self.assertEqual(cache.stats()['evictions_by_reason']['ttl'], 1)
+
+    def test_reput_outlives_stale_deadline(self):
+        cache = LRUCache(max_size=10)
+        cache.put("k", "old", ttl=5)
+        cache.put("k", "new", ttl=50)
+        self.now += 10
+        self.assertEqual(cache.expire(), 0)
+        self.assertEqual(cache.get("k"), "new")
+
+    def test_overwrites_keep_heap_bounded(self):
+        cache = LRUCache(max_size=10)
+        for i in range(5000):
+            cache.put(f"k{i % 5}", i, ttl=60)
+        self.assertLessEqual(len(cache._expiry_heap), 2 * len(cache.cache) + 65)
+
+
+class ReaperTests(unittest.TestCase):
+    def test_reaper_reclaims_without_reads(self):
+        cache = LRUCache(max_size=100)
+        for i in range(20):
+            cache.put(f"k{i}", i, size=100, ttl=0.05)
+        reaper = cache.start_reaper(interval=0.01)
+        self.addCleanup(cache.stop_reaper)
+
+        self.assertIs(cache.start_reaper(interval=0.01), reaper)
+        self.assertTrue(wait_for(lambda: not cache.cache))
+        self.assertEqual(cache.current_memory, 0)
+        self.assertEqual(reaper.reclaimed, 20)
+        self.assertEqual(cache.expirations, 20)
+
+        cache.stop_reaper()
+        self.assertFalse(reaper.is_alive())
+
+    def test_one_reaper_covers_every_segment(self):
+        cache = ShardedLRUCache(max_size=64, num_shards=4, ttl_seconds=0.05)
+        for i in range(32):
+            cache.put(f"k{i}", i)
+        self.assertGreater(sum(1 for shard in cache.shards if shard.cache), 1)
+        reaper = cache.start_reaper(interval=0.01)
+        self.addCleanup(cache.stop_reaper)
+
+        self.assertTrue(wait_for(lambda: len(cache) == 0))
+        self.assertEqual(reaper.reclaimed, 32)
+        self.assertEqual(cache.stats()['expirations'], 32)
+
+
+if __name__ == "__main__":
+    unittest.main()
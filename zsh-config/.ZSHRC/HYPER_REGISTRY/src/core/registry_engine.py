@@ -11,22 +11,68 @@
 ╚═══════════════════════════════════════════════════════════════════════════════════════════════════════════════════════════════════════════════════════════╝
 """
 
+import os
+import re
+import copy
+import gzip
+import math
 import json
 import time
+import struct
+import zlib
+import asyncio
+import queue
+import base64
+import bisect
+import heapq
 import hashlib
+import logging
+import functools
 import threading
-from typing import Dict, List, Any, Optional, Callable
-from dataclasses import dataclass, field, asdict
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
+from contextlib import ExitStack, contextmanager
+from typing import (
+    Dict, List, Any, Optional, AsyncIterator, Callable, FrozenSet, Iterable, Iterator,
+    Set, Tuple, Union
+)
+from dataclasses import dataclass, field, asdict, replace
 from enum import Enum
 from pathlib import Path
 import sqlite3
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+
+logger = logging.getLogger("hyper_registry")
+
+# Optional snapshot codecs; gzip and JSON records are the fallbacks
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # 📊 GEFS SCORING SYSTEM - GENERATIVE ENSEMBLE FUSION SCORING
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Score dimensions in storage/vector order, and their weights in overall
+GEFS_DIMENSIONS = (
+    "quality", "reliability", "performance", "security", "compatibility", "documentation",
+)
+GEFS_WEIGHTS = (0.25, 0.20, 0.20, 0.15, 0.10, 0.10)
+
+
 @dataclass
 class GEFSScore:
     """Generative Ensemble Fusion Score metrics"""
@@ -40,22 +86,14 @@ class GEFSScore:
     @property
     def overall(self) -> float:
         """Calculate overall GEFS score"""
-        weights = {
-            'quality': 0.25,
-            'reliability': 0.20,
-            'performance': 0.20,
-            'security': 0.15,
-            'compatibility': 0.10,
-            'documentation': 0.10
-        }
-        return sum([
-            self.quality * weights['quality'],
-            self.reliability * weights['reliability'],
-            self.performance * weights['performance'],
-            self.security * weights['security'],
-            self.compatibility * weights['compatibility'],
-            self.documentation * weights['documentation']
-        ])
+        return sum(value * weight for value, weight in zip(self.vector(), GEFS_WEIGHTS))
+
+    def vector(self) -> Tuple[float, ...]:
+        """Dimension values in GEFS_DIMENSIONS order"""
+        return (
+            self.quality, self.reliability, self.performance,
+            self.security, self.compatibility, self.documentation,
+        )
     
     @property
     def grade(self) -> str:
@@ -72,13 +110,56 @@ class GEFSScore:
         else: return "F"
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return dict(vars(self))  # Flat floats; asdict's deep copy is slow in bulk paths
+
+
+def gefs_weight_vector(weights: Any = None) -> Tuple[float, ...]:
+    """Normalize weights to a GEFS_DIMENSIONS-ordered tuple.
+
+    Accepts a {dimension: weight} mapping (missing dimensions weigh 0),
+    a sequence of six weights, or None for the GEFS_WEIGHTS defaults.
+    """
+    if weights is None:
+        return GEFS_WEIGHTS
+    if isinstance(weights, dict):
+        unknown = set(weights) - set(GEFS_DIMENSIONS)
+        if unknown:
+            raise ValueError(f"Unknown GEFS dimensions: {', '.join(sorted(unknown))}")
+        return tuple(float(weights.get(name, 0.0)) for name in GEFS_DIMENSIONS)
+    vector = tuple(float(weight) for weight in weights)
+    if len(vector) != len(GEFS_DIMENSIONS):
+        raise ValueError(f"Expected {len(GEFS_DIMENSIONS)} GEFS weights, got {len(vector)}")
+    return vector
+
+
+def gefs_batch_scores(matrix: Any, weights: Any = None) -> Any:
+    """Score many GEFS vectors (rows in GEFS_DIMENSIONS order) at once.
+
+    With NumPy this is one matrix-vector product returning an array;
+    without it a list of floats is computed in pure Python.
+    """
+    vector = gefs_weight_vector(weights)
+    if np is not None:
+        array = np.asarray(matrix, dtype=np.float64).reshape(-1, len(vector))
+        return array @ np.asarray(vector)
+    return [sum(value * weight for value, weight in zip(row, vector)) for row in matrix]
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # 🏛️ REGISTRY ENTRY - CORE DATA MODEL
 # ═══════════════════════════════════════════════════════════════════════════════
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Normalize to aware UTC; a naive datetime is read as local time."""
+    return value.astimezone(timezone.utc)
+
 class EntryType(Enum):
     """Registry entry types"""
     PLUGIN = "plugin"
@@ -129,8 +210,8 @@ class RegistryEntry:
     
     # Lifecycle
     status: EntryStatus = EntryStatus.REGISTERED
-    created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=_utc_now)
+    updated_at: datetime = field(default_factory=_utc_now)
     
     # Quality & Scoring
     gefs_score: GEFSScore = field(default_factory=GEFSScore)
@@ -139,6 +220,11 @@ class RegistryEntry:
     config: Dict[str, Any] = field(default_factory=dict)
     metadata: Dict[str, Any] = field(default_factory=dict)
     
+    def __post_init__(self):
+        # Timestamps are timezone-aware UTC; naive values are local time
+        self.created_at = _as_utc(self.created_at)
+        self.updated_at = _as_utc(self.updated_at)
+    
     def calculate_checksum(self, data: bytes) -> str:
         """Calculate SHA-256 checksum"""
         return hashlib.sha256(data).hexdigest()
@@ -296,34 +382,621 @@ class FeatureLayer:
 # 🗄️ STORAGE BACKEND - HYBRID JSON + SQLite
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Pragmas for file-backed databases: WAL lets readers run alongside the
+# single writer, and NORMAL sync is durable across application crashes.
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "mmap_size": 256 * 1024 * 1024,
+    "cache_size": -64 * 1024,  # KiB, i.e. 64 MiB per connection
+    "temp_store": "MEMORY",
+    "busy_timeout": 5000,
+}
+
+
+def _is_memory_db(db_path: str) -> bool:
+    return db_path in ("", ":memory:") or "mode=memory" in db_path
+
+
+class ReaderPool:
+    """Bounded pool of read-only SQLite connections"""
+
+    def __init__(self, connect: Callable[[], sqlite3.Connection], size: int = 4):
+        self._connect = connect
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._all: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self.size = size
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection, opening one lazily up to the pool size."""
+        self._slots.acquire()
+        try:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = self._connect()
+                with self._lock:
+                    self._all.append(conn)
+            try:
+                yield conn
+            finally:
+                self._idle.put(conn)
+        finally:
+            self._slots.release()
+
+    def close(self):
+        with self._lock:
+            for conn in self._all:
+                conn.close()
+            self._all.clear()
+
+
+@dataclass
+class SlowQuery:
+    """One slow-query log record"""
+    shape: str                  # Normalized SQL (see normalize_sql)
+    params: Tuple[Any, ...]
+    duration: float             # Seconds
+    at: datetime
+
+
+@dataclass
+class IndexSuggestion:
+    """A composite index proposed for a frequent filter combination"""
+    columns: Tuple[str, ...]    # Most selective column first
+    hits: int                   # Queries that filtered on exactly these columns
+    sql: str
+
+
+@functools.lru_cache(maxsize=1024)
+def normalize_sql(sql: str) -> str:
+    """Query shape: whitespace collapsed and IN lists folded to ``(?...)``."""
+    sql = " ".join(sql.split())
+    return re.sub(r"\(\?(?:\s*,\s*\?)*\)", "(?...)", sql)
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+class QueryProfiler:
+    """Latency by query shape, a slow-query log and filter usage counts
+
+    Each shape keeps its most recent ``samples`` latencies for the
+    percentiles; queries slower than ``threshold`` seconds are also kept
+    in a bounded log and reported through the ``hyper_registry`` logger.
+    """
+
+    def __init__(self, threshold: float = 0.1, samples: int = 1024, slow_log_size: int = 256):
+        self.threshold = threshold
+        self.samples = samples
+        self.slow_log: "deque[SlowQuery]" = deque(maxlen=slow_log_size)
+        self.latencies: Dict[str, "deque[float]"] = {}
+        self.counts: "Counter[str]" = Counter()
+        self.filter_usage: "Counter[Tuple[str, ...]]" = Counter()
+        self.lock = threading.Lock()
+
+    def record(self, sql: str, params: Iterable[Any], duration: float):
+        shape = normalize_sql(sql)
+        with self.lock:
+            samples = self.latencies.get(shape)
+            if samples is None:
+                samples = self.latencies[shape] = deque(maxlen=self.samples)
+            samples.append(duration)
+            self.counts[shape] += 1
+            if duration < self.threshold:
+                return
+            params = tuple(params)
+            self.slow_log.append(SlowQuery(shape, params, duration, _utc_now()))
+        logger.warning("Slow registry query (%.1f ms): %s %r", duration * 1000, shape, params)
+
+    def note_filters(self, columns: Tuple[str, ...]):
+        """Count a query filtering on these registry columns."""
+        if columns:
+            with self.lock:
+                self.filter_usage[columns] += 1
+
+    def percentiles(self) -> Dict[str, Dict[str, float]]:
+        """{shape: {count, p50, p95, p99, max}} with latencies in ms."""
+        with self.lock:
+            snapshot = {shape: sorted(samples) for shape, samples in self.latencies.items()}
+            counts = dict(self.counts)
+        return {
+            shape: {
+                "count": counts[shape],
+                "p50": _percentile(ordered, 0.50) * 1000,
+                "p95": _percentile(ordered, 0.95) * 1000,
+                "p99": _percentile(ordered, 0.99) * 1000,
+                "max": ordered[-1] * 1000,
+            }
+            for shape, ordered in snapshot.items()
+        }
+
+    def reset(self):
+        with self.lock:
+            self.slow_log.clear()
+            self.latencies.clear()
+            self.counts.clear()
+            self.filter_usage.clear()
+
+
+# Scalar filters that map straight onto registry columns
+INDEXABLE_FILTERS = ("namespace", "type", "status")
+
+# Hot fields are real columns; list-valued and nested fields are JSON text
+# and timestamps are UTC epoch microseconds. The table also has an internal
+# ``row_id`` (a stable rowid alias) that keys the full-text index. GEFS
+# dimensions are copied out of gefs_score into numeric columns for ranking.
+GEFS_COLUMNS = tuple(f"gefs_{name}" for name in GEFS_DIMENSIONS)
+REGISTRY_COLUMNS = (
+    "id", "namespace", "name", "type", "version", "status",
+    "description", "author", "tags", "path", "url", "checksum",
+    "dependencies", "conflicts", "gefs_overall", *GEFS_COLUMNS, "gefs_score",
+    "created_at", "updated_at", "config", "metadata",
+)
+# Columns that make up a full entry (the numeric GEFS columns are derived)
+DERIVED_COLUMNS = {"gefs_overall", *GEFS_COLUMNS}
+ENTRY_COLUMNS = tuple(name for name in REGISTRY_COLUMNS if name not in DERIVED_COLUMNS)
+JSON_COLUMNS = {"tags", "dependencies", "conflicts", "gefs_score", "config", "metadata"}
+TIMESTAMP_COLUMNS = {"created_at", "updated_at"}
+
+# registry_changes operations
+CHANGE_UPSERT = "upsert"
+CHANGE_DELETE = "delete"
+# Change-log position: a seq, or per-shard seqs for sharded storage
+ChangePosition = Union[int, Tuple[int, ...]]
+
+REGISTRY_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        row_id INTEGER PRIMARY KEY,
+        id TEXT NOT NULL UNIQUE,
+        namespace TEXT NOT NULL,
+        name TEXT NOT NULL,
+        type TEXT NOT NULL,
+        version TEXT NOT NULL,
+        status TEXT NOT NULL,
+        description TEXT NOT NULL DEFAULT '',
+        author TEXT NOT NULL DEFAULT '',
+        tags TEXT NOT NULL DEFAULT '[]',
+        path TEXT,
+        url TEXT,
+        checksum TEXT,
+        dependencies TEXT NOT NULL DEFAULT '[]',
+        conflicts TEXT NOT NULL DEFAULT '[]',
+        gefs_overall REAL NOT NULL DEFAULT 0,
+        gefs_quality REAL NOT NULL DEFAULT 0,
+        gefs_reliability REAL NOT NULL DEFAULT 0,
+        gefs_performance REAL NOT NULL DEFAULT 0,
+        gefs_security REAL NOT NULL DEFAULT 0,
+        gefs_compatibility REAL NOT NULL DEFAULT 0,
+        gefs_documentation REAL NOT NULL DEFAULT 0,
+        gefs_score TEXT NOT NULL DEFAULT '{{}}',
+        created_at INTEGER NOT NULL,
+        updated_at INTEGER NOT NULL,
+        config TEXT NOT NULL DEFAULT '{{}}',
+        metadata TEXT NOT NULL DEFAULT '{{}}',
+        UNIQUE(namespace, name, version)
+    )
+"""
+
+# Upsert on id only: an entry whose (namespace, name, version) belongs to
+# another id fails with IntegrityError instead of silently replacing it
+_INSERT_SQL = (
+    "INSERT INTO {table} (" + ", ".join(REGISTRY_COLUMNS) + ") "
+    "VALUES (" + ", ".join("?" * len(REGISTRY_COLUMNS)) + ") "
+    "ON CONFLICT(id) DO UPDATE SET "
+    + ", ".join(f"{name} = excluded.{name}" for name in REGISTRY_COLUMNS if name != "id")
+)
+_ENTRY_SELECT = ", ".join(ENTRY_COLUMNS)
+
+# Full-text index over the descriptive fields, keyed by registry.row_id and
+# maintained by triggers. Tags are indexed as space-separated words.
+FTS_COLUMNS = ("name", "description", "tags", "author")
+FTS_WEIGHTS = (10.0, 2.0, 5.0, 1.0)  # bm25 weight per FTS column
+_FTS_TAGS = "(SELECT group_concat(value, ' ') FROM json_each({row}.tags))"
+FTS_SCHEMA = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS registry_fts USING fts5("
+    "name, description, tags, author, tokenize = 'unicode61 remove_diacritics 2', "
+    "prefix = '2 3')",
+    f"""
+    CREATE TRIGGER IF NOT EXISTS registry_fts_insert AFTER INSERT ON registry BEGIN
+        INSERT INTO registry_fts (rowid, name, description, tags, author)
+        VALUES (new.row_id, new.name, new.description, {_FTS_TAGS.format(row="new")}, new.author);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS registry_fts_delete AFTER DELETE ON registry BEGIN
+        DELETE FROM registry_fts WHERE rowid = old.row_id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS registry_fts_update
+    AFTER UPDATE OF name, description, tags, author ON registry BEGIN
+        UPDATE registry_fts
+        SET name = new.name, description = new.description,
+            tags = {_FTS_TAGS.format(row="new")}, author = new.author
+        WHERE rowid = new.row_id;
+    END
+    """,
+)
+
+
+def _fts_query(text: str, prefix: bool = True) -> str:
+    """Turn free text into an FTS5 query matching every word.
+
+    Words are quoted so user input can never be parsed as FTS5 syntax;
+    with ``prefix`` each word also matches longer tokens ("vis" -> visual).
+    """
+    words = re.findall(r"\w+", text)
+    suffix = "*" if prefix else ""
+    return " ".join(f'"{word}"{suffix}' for word in words)
+
+
+def _to_epoch_us(value: datetime) -> int:
+    return (_as_utc(value) - _EPOCH) // timedelta(microseconds=1)
+
+
+def _from_epoch_us(value: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _as_datetime(value: Any) -> datetime:
+    """Accept datetimes from storage and ISO strings from JSON exports."""
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, (int, float)):
+        return _from_epoch_us(value)
+    return datetime.fromisoformat(value)
+
+
+def _decode_row(columns: Iterable[str], row: Iterable[Any]) -> Dict[str, Any]:
+    """Decode a registry row into a dict keyed by column name."""
+    decoded: Dict[str, Any] = {}
+    for name, value in zip(columns, row):
+        if name in JSON_COLUMNS:
+            value = json.loads(value) if value else None
+        elif name in TIMESTAMP_COLUMNS:
+            value = _from_epoch_us(value)
+        decoded[name] = value
+    return decoded
+
+
+def _copy_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a decoded row so its list and dict values are not shared."""
+    return {
+        name: copy.deepcopy(value) if name in JSON_COLUMNS else value
+        for name, value in row.items()
+    }
+
+
+def _entry_diff(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Field-level diff {field: {"old", "new"}} of two decoded entry rows.
+
+    Only entry fields present in ``old`` are compared; updated_at and the
+    derived GEFS columns are left out.
+    """
+    return {
+        name: {"old": old[name], "new": new[name]}
+        for name in old
+        if name != "updated_at" and name not in DERIVED_COLUMNS and old[name] != new[name]
+    }
+
+
+def _legacy_row(data: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Convert a legacy JSON-blob entry into a columnar registry row."""
+    gefs = GEFSScore(**(data.get("gefs_score") or {}))
+    return (
+        data["id"],
+        data["namespace"],
+        data["name"],
+        data["type"],
+        data["version"],
+        data.get("status", "registered"),
+        data.get("description", ""),
+        data.get("author", ""),
+        json.dumps(data.get("tags", [])),
+        data.get("path"),
+        data.get("url"),
+        data.get("checksum"),
+        json.dumps(data.get("dependencies", [])),
+        json.dumps(data.get("conflicts", [])),
+        gefs.overall,
+        *gefs.vector(),
+        json.dumps(gefs.to_dict()),
+        _to_epoch_us(datetime.fromisoformat(data["created_at"])),
+        _to_epoch_us(datetime.fromisoformat(data["updated_at"])),
+        json.dumps(data.get("config", {})),
+        json.dumps(data.get("metadata", {})),
+    )
+
+
+def _encode_cursor(key: Tuple[int, str]) -> str:
+    """Opaque page token for a (updated_at, id) keyset position."""
+    raw = json.dumps(list(key), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(token: str) -> Tuple[int, str]:
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        updated_at, entry_id = json.loads(raw)
+        if not isinstance(updated_at, int) or not isinstance(entry_id, str):
+            raise ValueError
+    except (ValueError, TypeError):
+        raise ValueError(f"Invalid page token: {token!r}") from None
+    return updated_at, entry_id
+
+
+def _duplicate_version_error(entry: "RegistryEntry") -> str:
+    return (
+        f"{entry.namespace}/{entry.name} {entry.version} is already registered "
+        f"under another ID"
+    )
+
+
+def _check_fields(fields: Tuple[str, ...]):
+    unknown = [name for name in fields if name not in REGISTRY_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unknown registry fields: {', '.join(unknown)}")
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+# Snapshot layout (inside the gzip or zstd stream): SNAPSHOT_MAGIC, a format
+# byte, then length-prefixed records. The first record is a JSON header with
+# the schema version, record count and column names; every following record
+# is one registry row (raw column values in header order) and a zero length
+# ends the stream. Records are msgpack when available, otherwise JSON.
+SCHEMA_VERSION = 3  # Registry table layout; bump when columns change
+SNAPSHOT_MAGIC = b"HRSNAP"
+SNAPSHOT_FORMAT = 1
+_RECORD_LEN = struct.Struct("<I")
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+# Errors raised by the decompressors on damaged input
+_STREAM_ERRORS: Tuple[type, ...] = (EOFError, OSError, zlib.error) + (
+    (zstandard.ZstdError,) if zstandard is not None else ()
+)
+
+
+def _encode_record(codec: str, value: Any) -> bytes:
+    if codec == "msgpack":
+        return msgpack.packb(value, use_bin_type=True)
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+def _decode_record(codec: str, payload: bytes) -> Any:
+    if codec == "msgpack":
+        return msgpack.unpackb(payload, raw=False)
+    return json.loads(payload)
+
+
+def _write_record(stream, payload: bytes):
+    stream.write(_RECORD_LEN.pack(len(payload)))
+    stream.write(payload)
+
+
+def _read_exact(stream, size: int) -> bytes:
+    """Read exactly ``size`` bytes; decompressors may return short reads."""
+    chunks = []
+    while size:
+        chunk = stream.read(size)
+        if not chunk:
+            raise ValueError("Truncated snapshot")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def _read_record(stream) -> Optional[bytes]:
+    """Next record payload, or None at the end-of-stream marker."""
+    (size,) = _RECORD_LEN.unpack(_read_exact(stream, _RECORD_LEN.size))
+    return _read_exact(stream, size) if size else None
+
+
+def _snapshot_writer(path: str, compression: str):
+    if compression == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstd snapshots require the zstandard package")
+        return zstandard.ZstdCompressor(level=3).stream_writer(open(path, "wb"))
+    if compression == "gzip":
+        return gzip.open(path, "wb", compresslevel=6)
+    raise ValueError(f"Unknown snapshot compression: {compression!r}")
+
+
+def _snapshot_reader(path: str):
+    """Open a snapshot for reading, detecting the compression from its magic."""
+    with open(path, "rb") as raw:
+        magic = raw.read(len(_ZSTD_MAGIC))
+    if magic.startswith(_GZIP_MAGIC):
+        return gzip.open(path, "rb")
+    if magic == _ZSTD_MAGIC:
+        if zstandard is None:
+            raise RuntimeError("zstd snapshots require the zstandard package")
+        return zstandard.ZstdDecompressor().stream_reader(open(path, "rb"))
+    raise ValueError(f"{path} is not a registry snapshot")
+
+
+def _write_snapshot(
+    path: str, compression: Optional[str], count: int, version: int,
+    rows: Iterable[Tuple[Any, ...]]
+) -> int:
+    """Write ENTRY_COLUMNS rows as a snapshot file; returns the rows written."""
+    codec = "msgpack" if msgpack is not None else "json"
+    compression = compression or ("zstd" if zstandard is not None else "gzip")
+    header = {
+        "schema": SCHEMA_VERSION,
+        "codec": codec,
+        "count": count,
+        "registry_version": version,
+        "columns": list(ENTRY_COLUMNS),
+        "created_at": _utc_now().isoformat(),
+    }
+    tmp_path = f"{path}.tmp"
+    written = 0
+    try:
+        with _snapshot_writer(tmp_path, compression) as out:
+            out.write(SNAPSHOT_MAGIC + bytes([SNAPSHOT_FORMAT]))
+            _write_record(out, json.dumps(header).encode("utf-8"))
+            for row in rows:
+                _write_record(out, _encode_record(codec, list(row)))
+                written += 1
+            out.write(_RECORD_LEN.pack(0))
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return written
+
+
+def _write_json_export(path: str, rows: Iterable[Tuple[Any, ...]]):
+    """Write ENTRY_COLUMNS rows as a JSON array, one entry at a time."""
+    with open(path, 'w') as f:
+        f.write("[")
+        for index, row in enumerate(rows):
+            f.write(",\n" if index else "\n")
+            f.write(json.dumps(_decode_row(ENTRY_COLUMNS, row), default=_json_default))
+        f.write("\n]\n")
+
+
+@contextmanager
+def open_snapshot(path: str):
+    """Open a snapshot, yielding ``(header, records)``.
+
+    ``records`` lazily decodes one entry dict at a time, so a snapshot of
+    any size is read in constant memory. It raises ValueError for a
+    snapshot written by a newer schema, and if the stream is truncated or
+    holds a different number of records than the header announced.
+    """
+    with _snapshot_reader(path) as stream:
+        try:
+            magic = _read_exact(stream, len(SNAPSHOT_MAGIC) + 1)
+        except (ValueError, *_STREAM_ERRORS):
+            raise ValueError(f"{path} is not a registry snapshot") from None
+        if magic[:-1] != SNAPSHOT_MAGIC:
+            raise ValueError(f"{path} is not a registry snapshot")
+        if magic[-1] > SNAPSHOT_FORMAT:
+            raise ValueError(f"Unsupported snapshot format {magic[-1]}")
+        header = json.loads(_read_record(stream) or b"{}")
+        schema = header.get("schema", SCHEMA_VERSION)
+        if not isinstance(schema, int) or schema > SCHEMA_VERSION:
+            raise ValueError(f"Unsupported snapshot schema {schema!r}")
+        codec = header.get("codec", "json")
+        if codec == "msgpack" and msgpack is None:
+            raise RuntimeError("This snapshot requires the msgpack package")
+        columns = header.get("columns", ENTRY_COLUMNS)
+
+        def records() -> Iterator[Dict[str, Any]]:
+            read = 0
+            try:
+                while True:
+                    payload = _read_record(stream)
+                    if payload is None:
+                        break
+                    read += 1
+                    yield _decode_row(columns, _decode_record(codec, payload))
+            except _STREAM_ERRORS as exc:
+                raise ValueError(f"Corrupt snapshot: {exc}") from None
+            if read != header.get("count", read):
+                raise ValueError(
+                    f"Snapshot holds {read} records, header says {header['count']}"
+                )
+
+        yield header, records()
+
+
 class StorageBackend:
-    """Hybrid storage: SQLite for queries + JSON for backup"""
+    """Hybrid storage: SQLite for queries + JSON for backup
+
+    File-backed databases run in WAL mode with one writer connection
+    (serialized by ``lock``) and a pool of ``readers`` read-only
+    connections, so searches and loads proceed in parallel with writes.
+    An in-memory database is private to its connection, so there every
+    read shares the writer connection under the lock.
+    """
     
-    def __init__(self, db_path: str = ":memory:", json_path: Optional[str] = None):
+    def __init__(self, db_path: str = ":memory:", json_path: Optional[str] = None,
+                 readers: int = 4, slow_query_threshold: float = 0.1,
+                 profiler: Optional[QueryProfiler] = None):
         self.db_path = db_path
         self.json_path = json_path
+        self.in_memory = _is_memory_db(db_path)
         self.conn = sqlite3.connect(db_path, check_same_thread=False)
         self.lock = threading.RLock()
+        if not self.in_memory:
+            self._apply_pragmas(self.conn)
+        self.fts_enabled = False
+        self.local_writes = 0  # write transactions committed by this backend
+        self.commit_listeners: List[Callable[[], None]] = []
+        self.profiler = profiler or QueryProfiler(threshold=slow_query_threshold)
         self._init_database()
+        self.readers: Optional[ReaderPool] = None
+        if not self.in_memory and readers > 0:
+            self.readers = ReaderPool(self._connect_reader, size=readers)
+        # Held open so PRAGMA data_version sees commits from any connection
+        self._watcher: Optional[sqlite3.Connection] = None
+        self._watcher_lock = threading.Lock()
+        if not self.in_memory:
+            self._watcher = self._connect_reader()
+
+    @staticmethod
+    def _apply_pragmas(conn: sqlite3.Connection, read_only: bool = False):
+        for name, value in SQLITE_PRAGMAS.items():
+            if read_only and name == "journal_mode":
+                continue  # Persistent, set once by the writer
+            conn.execute(f"PRAGMA {name} = {value}")
+        if read_only:
+            conn.execute("PRAGMA query_only = ON")
+
+    def _connect_reader(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._apply_pragmas(conn, read_only=True)
+        return conn
+
+    @contextmanager
+    def _reader(self):
+        """Connection for a read: pooled reader, or the writer when in memory."""
+        if self.readers is None:
+            with self.lock:
+                yield self.conn
+        else:
+            with self.readers.connection() as conn:
+                yield conn
+
+    def close(self):
+        """Close the writer and every pooled reader connection."""
+        if self.readers is not None:
+            self.readers.close()
+        if self._watcher is not None:
+            with self._watcher_lock:
+                self._watcher.close()
+        with self.lock:
+            self.conn.close()
     
     def _init_database(self):
         """Initialize database schema"""
         with self.lock:
             cursor = self.conn.cursor()
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS registry (
-                    id TEXT PRIMARY KEY,
-                    namespace TEXT NOT NULL,
-                    name TEXT NOT NULL,
-                    type TEXT NOT NULL,
-                    version TEXT NOT NULL,
-                    status TEXT NOT NULL,
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL,
-                    data TEXT NOT NULL,
-                    UNIQUE(namespace, name, version)
+            self._migrate_schema(cursor)
+            cursor.execute(REGISTRY_TABLE_SQL.format(table="registry"))
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS registry_meta (
+                    key TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL
                 )
-            """)
+                """
+            )
+            cursor.execute("INSERT OR IGNORE INTO registry_meta VALUES ('version', 0)")
             cursor.execute(
                 """
                 CREATE TABLE IF NOT EXISTS registry_facets (
@@ -343,6 +1016,12 @@ class StorageBackend:
             cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_status ON registry(status)
             """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_updated_id ON registry(updated_at, id)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_gefs_overall ON registry(gefs_overall DESC, id)
+            """)
             cursor.execute(
                 """
                 CREATE INDEX IF NOT EXISTS idx_facets_key_value
@@ -355,8 +1034,123 @@ class StorageBackend:
                 ON registry_facets(entry_id)
                 """
             )
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS registry_changes (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    entry_id TEXT NOT NULL,
+                    op TEXT NOT NULL,
+                    changed_at INTEGER NOT NULL,
+                    data TEXT,
+                    diff TEXT
+                )
+                """
+            )
+            change_columns = [row[1] for row in cursor.execute("PRAGMA table_info(registry_changes)")]
+            if "diff" not in change_columns:
+                cursor.execute("ALTER TABLE registry_changes ADD COLUMN diff TEXT")
+            self._init_dependencies(cursor)
+            self._init_fts(cursor)
             self.conn.commit()
 
+    def _init_dependencies(self, cursor: sqlite3.Cursor):
+        """Create the dependency edge table, backfilling it if new."""
+        exists = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'registry_dependencies'"
+        ).fetchone()
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS registry_dependencies (
+                entry_id TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                depends_on TEXT NOT NULL,
+                PRIMARY KEY (entry_id, position)
+            )
+            """
+        )
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_dependencies_target
+            ON registry_dependencies(depends_on)
+            """
+        )
+        if not exists:
+            rows = cursor.execute("SELECT id, dependencies FROM registry").fetchall()
+            cursor.executemany(
+                "INSERT INTO registry_dependencies (entry_id, position, depends_on) "
+                "VALUES (?, ?, ?)",
+                [
+                    (entry_id, position, dep)
+                    for entry_id, deps in rows
+                    for position, dep in enumerate(dict.fromkeys(json.loads(deps)))
+                ],
+            )
+
+    def _init_fts(self, cursor: sqlite3.Cursor):
+        """Create the full-text index and its triggers if FTS5 is available."""
+        exists = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'registry_fts'"
+        ).fetchone()
+        try:
+            for statement in FTS_SCHEMA:
+                cursor.execute(statement)
+        except sqlite3.OperationalError:
+            return  # SQLite built without FTS5 or JSON1
+        if not exists:
+            cursor.execute(
+                "INSERT INTO registry_fts (rowid, name, description, tags, author) "
+                f"SELECT row_id, name, description, {_FTS_TAGS.format(row='registry')}, "
+                "author FROM registry"
+            )
+        self.fts_enabled = True
+
+    def _migrate_schema(self, cursor: sqlite3.Cursor):
+        """Bring a registry table created by an older schema version up to date."""
+        columns = [row[1] for row in cursor.execute("PRAGMA table_info(registry)")]
+        if not columns:
+            return
+        missing_gefs = [name for name in GEFS_COLUMNS if name not in columns]
+        if "row_id" not in columns:
+            self._rebuild_registry(cursor, columns)
+        else:
+            for name in missing_gefs:
+                cursor.execute(f"ALTER TABLE registry ADD COLUMN {name} REAL NOT NULL DEFAULT 0")
+        if missing_gefs:
+            self._backfill_gefs(cursor)
+
+    @staticmethod
+    def _backfill_gefs(cursor: sqlite3.Cursor):
+        """Fill the numeric GEFS columns from each row's gefs_score JSON."""
+        assignments = ", ".join(f"{name} = ?" for name in GEFS_COLUMNS)
+        rows = cursor.execute("SELECT row_id, gefs_score FROM registry").fetchall()
+        cursor.executemany(
+            f"UPDATE registry SET {assignments} WHERE row_id = ?",
+            [
+                (*GEFSScore(**json.loads(gefs or "{}")).vector(), row_id)
+                for row_id, gefs in rows
+            ],
+        )
+
+    @staticmethod
+    def _rebuild_registry(cursor: sqlite3.Cursor, columns: List[str]):
+        """Copy a pre-columnar registry table into the current layout."""
+        cursor.execute("DROP TABLE IF EXISTS registry_fts")
+        cursor.execute(REGISTRY_TABLE_SQL.format(table="registry_columnar"))
+        if "data" in columns:
+            # Entries stored as one JSON blob
+            rows = cursor.execute("SELECT data FROM registry").fetchall()
+            cursor.executemany(
+                _INSERT_SQL.format(table="registry_columnar"),
+                [_legacy_row(json.loads(row[0])) for row in rows],
+            )
+        else:
+            shared = ", ".join(name for name in REGISTRY_COLUMNS if name in columns)
+            cursor.execute(
+                f"INSERT INTO registry_columnar ({shared}) SELECT {shared} FROM registry"
+            )
+        cursor.execute("DROP TABLE registry")
+        cursor.execute("ALTER TABLE registry_columnar RENAME TO registry")
+
     @staticmethod
     def _extract_facets(entry: "RegistryEntry") -> Dict[str, List[str]]:
         """Safely extract facets from an entry config/metadata."""
@@ -380,133 +1174,1298 @@ class StorageBackend:
                 facets[key].extend(normalized)
         return facets
 
-    def _persist_facets(self, entry: "RegistryEntry", cursor: sqlite3.Cursor):
-        """Persist flattened facets for accelerated search."""
-        facets = self._extract_facets(entry)
-        cursor.execute("DELETE FROM registry_facets WHERE entry_id = ?", (entry.id,))
-        for key, values in facets.items():
-            for value in values:
-                cursor.execute(
-                    "INSERT INTO registry_facets (entry_id, facet_key, facet_value) VALUES (?, ?, ?)",
-                    (entry.id, key, value),
+    @classmethod
+    def _facet_rows(cls, entry: "RegistryEntry") -> List[Tuple[str, str, str]]:
+        """Flatten entry facets into registry_facets rows (deduplicated)."""
+        return [
+            (entry.id, key, value)
+            for key, values in cls._extract_facets(entry).items()
+            for value in dict.fromkeys(values)
+        ]
+
+    @staticmethod
+    def _dependency_rows(entry: "RegistryEntry") -> List[Tuple[str, int, str]]:
+        """Dependency edges of an entry in declaration order, deduplicated."""
+        return [
+            (entry.id, position, dep)
+            for position, dep in enumerate(dict.fromkeys(entry.dependencies))
+        ]
+
+    @staticmethod
+    def _entry_row(entry: "RegistryEntry") -> Tuple[Any, ...]:
+        """Build the registry table row for an entry (REGISTRY_COLUMNS order)."""
+        return (
+            entry.id,
+            entry.namespace,
+            entry.name,
+            entry.type.value,
+            entry.version,
+            entry.status.value,
+            entry.description,
+            entry.author,
+            json.dumps(entry.tags),
+            entry.path,
+            entry.url,
+            entry.checksum,
+            json.dumps(entry.dependencies),
+            json.dumps(entry.conflicts),
+            entry.gefs_score.overall,
+            *entry.gefs_score.vector(),
+            json.dumps(entry.gefs_score.to_dict()),
+            _to_epoch_us(entry.created_at),
+            _to_epoch_us(entry.updated_at),
+            json.dumps(entry.config),
+            json.dumps(entry.metadata),
+        )
+
+    def _write_entries(
+        self, entries: List["RegistryEntry"], cursor: sqlite3.Cursor,
+        diffs: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None
+    ):
+        """Upsert rows and replace facets for a group of entries (no commit).
+
+        ``diffs`` maps entry ids to the field diff logged with their upsert.
+        """
+        cursor.executemany(
+            _INSERT_SQL.format(table="registry"),
+            [self._entry_row(entry) for entry in entries],
+        )
+        cursor.executemany(
+            "DELETE FROM registry_facets WHERE entry_id = ?",
+            [(entry.id,) for entry in entries],
+        )
+        cursor.executemany(
+            "INSERT INTO registry_facets (entry_id, facet_key, facet_value) VALUES (?, ?, ?)",
+            [row for entry in entries for row in self._facet_rows(entry)],
+        )
+        cursor.executemany(
+            "DELETE FROM registry_dependencies WHERE entry_id = ?",
+            [(entry.id,) for entry in entries],
+        )
+        cursor.executemany(
+            "INSERT INTO registry_dependencies (entry_id, position, depends_on) VALUES (?, ?, ?)",
+            [row for entry in entries for row in self._dependency_rows(entry)],
+        )
+        now = _to_epoch_us(_utc_now())
+        diffs = diffs or {}
+        cursor.executemany(
+            "INSERT INTO registry_changes (entry_id, op, changed_at, data, diff) VALUES (?, ?, ?, ?, ?)",
+            [
+                (
+                    entry.id, CHANGE_UPSERT, now, json.dumps(entry.to_dict()),
+                    json.dumps(diffs[entry.id], default=_json_default) if entry.id in diffs else None,
                 )
+                for entry in entries
+            ],
+        )
+    
+    def _commit_write(self, cursor: sqlite3.Cursor):
+        """Bump the registry version and commit the current write."""
+        cursor.execute("UPDATE registry_meta SET value = value + 1 WHERE key = 'version'")
+        self.conn.commit()
+        self.local_writes += 1
+        for listener in self.commit_listeners:
+            listener()
+
+    def data_version(self) -> int:
+        """Change marker that differs after any commit to the database.
+
+        Unlike version() it reads no table: a file-backed database asks
+        PRAGMA data_version on a held connection, and a private in-memory
+        one can only change through this backend's own writes.
+        """
+        if self._watcher is None:
+            return self.local_writes
+        with self._watcher_lock:
+            return self._watcher.execute("PRAGMA data_version").fetchone()[0]
+
+    def version(self) -> int:
+        """Registry version; every committed write increments it.
+
+        The counter lives in the database, so it also advances for writes
+        made by other connections and processes sharing the file.
+        """
+        with self._reader() as conn:
+            row = conn.execute(
+                "SELECT value FROM registry_meta WHERE key = 'version'"
+            ).fetchone()
+            return row[0] if row else 0
     
-    def save(self, entry: RegistryEntry):
+    def save(self, entry: RegistryEntry, diff: Optional[Dict[str, Dict[str, Any]]] = None):
         """Save entry to storage"""
         with self.lock:
             cursor = self.conn.cursor()
-            data = json.dumps(entry.to_dict())
-            cursor.execute("""
-                INSERT OR REPLACE INTO registry 
-                (id, namespace, name, type, version, status, created_at, updated_at, data)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                entry.id,
-                entry.namespace,
-                entry.name,
-                entry.type.value,
-                entry.version,
-                entry.status.value,
-                entry.created_at.isoformat(),
-                entry.updated_at.isoformat(),
-                data
-            ))
-            self._persist_facets(entry, cursor)
-            self.conn.commit()
+            self._write_entries([entry], cursor, {entry.id: diff} if diff else None)
+            self._commit_write(cursor)
+
+    def update(
+        self, entry: RegistryEntry, updated_at: datetime
+    ) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Write only the columns of ``entry`` that differ from the stored row.
+
+        Returns the field-level diff, which is empty (and nothing is
+        written) when the entry is unchanged, or None if it is not stored.
+        updated_at is set only on a real change. Facet and dependency rows
+        are rewritten only when they changed, and the diff is logged with
+        the upsert in registry_changes.
+        """
+        with self.lock:
+            cursor = self.conn.cursor()
+            row = cursor.execute(
+                f"SELECT {', '.join(REGISTRY_COLUMNS)} FROM registry WHERE id = ?", (entry.id,)
+            ).fetchone()
+            if row is None:
+                return None
+            updated = replace(entry, updated_at=updated_at)
+            new_row = self._entry_row(updated)
+            old = _decode_row(REGISTRY_COLUMNS, row)
+            new = _decode_row(REGISTRY_COLUMNS, new_row)
+            diff = _entry_diff({name: old[name] for name in ENTRY_COLUMNS}, new)
+            if not diff:
+                return {}
+            changed = [
+                name for name in REGISTRY_COLUMNS
+                if name in diff or (name in DERIVED_COLUMNS and old[name] != new[name])
+            ]
+            changed.append("updated_at")
+            values = dict(zip(REGISTRY_COLUMNS, new_row))
+            cursor.execute(
+                f"UPDATE registry SET {', '.join(f'{name} = ?' for name in changed)} WHERE id = ?",
+                [*(values[name] for name in changed), entry.id],
+            )
+            if "config" in diff or "metadata" in diff:
+                facets = self._facet_rows(entry)
+                stored = cursor.execute(
+                    "SELECT entry_id, facet_key, facet_value FROM registry_facets WHERE entry_id = ?",
+                    (entry.id,),
+                ).fetchall()
+                if set(stored) != set(facets):
+                    cursor.execute("DELETE FROM registry_facets WHERE entry_id = ?", (entry.id,))
+                    cursor.executemany(
+                        "INSERT INTO registry_facets (entry_id, facet_key, facet_value) VALUES (?, ?, ?)",
+                        facets,
+                    )
+            if "dependencies" in diff:
+                cursor.execute("DELETE FROM registry_dependencies WHERE entry_id = ?", (entry.id,))
+                cursor.executemany(
+                    "INSERT INTO registry_dependencies (entry_id, position, depends_on) VALUES (?, ?, ?)",
+                    self._dependency_rows(entry),
+                )
+            cursor.execute(
+                "INSERT INTO registry_changes (entry_id, op, changed_at, data, diff) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    entry.id, CHANGE_UPSERT, _to_epoch_us(_utc_now()),
+                    json.dumps(updated.to_dict()), json.dumps(diff, default=_json_default),
+                ),
+            )
+            self._commit_write(cursor)
+            return diff
+
+    def save_many(
+        self, entries: List[RegistryEntry], chunk_size: int = 500
+    ) -> Dict[str, str]:
+        """Save entries in chunked transactions, returning {entry_id: error}.
+
+        Each chunk is written with executemany in a single transaction. If a
+        chunk fails it is rolled back and retried entry by entry, so one bad
+        row only costs its own entry.
+        """
+        failed: Dict[str, str] = {}
+        with self.lock:
+            cursor = self.conn.cursor()
+            for start in range(0, len(entries), chunk_size):
+                chunk = entries[start:start + chunk_size]
+                try:
+                    self._write_entries(chunk, cursor)
+                    self._commit_write(cursor)
+                    continue
+                except sqlite3.Error:
+                    self.conn.rollback()
+                for entry in chunk:
+                    try:
+                        self._write_entries([entry], cursor)
+                        self._commit_write(cursor)
+                    except sqlite3.Error as exc:
+                        self.conn.rollback()
+                        failed[entry.id] = str(exc)
+        return failed
+
+    def _query(self, conn: sqlite3.Connection, sql: str, params: Iterable[Any] = ()) -> List[Tuple[Any, ...]]:
+        """Run a read query and fetch all rows, recording it in the profiler."""
+        params = list(params)
+        start = time.perf_counter()
+        rows = conn.execute(sql, params).fetchall()
+        self.profiler.record(sql, params, time.perf_counter() - start)
+        return rows
+
+    def _where(self, filters: Dict[str, Any]) -> Tuple[str, List[Any]]:
+        """_filter_clause, also counting the filter columns for the advisor."""
+        self.profiler.note_filters(tuple(name for name in INDEXABLE_FILTERS if filters.get(name)))
+        return self._filter_clause(filters)
+
+    def existing_ids(self, entry_ids: Iterable[str], chunk_size: int = 500) -> Set[str]:
+        """Return the subset of entry_ids present in storage."""
+        ids = list(dict.fromkeys(entry_ids))
+        found: Set[str] = set()
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            for start in range(0, len(ids), chunk_size):
+                chunk = ids[start:start + chunk_size]
+                placeholders = ",".join(["?"] * len(chunk))
+                cursor.execute(
+                    f"SELECT id FROM registry WHERE id IN ({placeholders})", chunk
+                )
+                found.update(row[0] for row in cursor.fetchall())
+        return found
     
     def load(self, entry_id: str) -> Optional[Dict[str, Any]]:
         """Load entry by ID"""
-        with self.lock:
-            cursor = self.conn.cursor()
-            cursor.execute("SELECT data FROM registry WHERE id = ?", (entry_id,))
-            row = cursor.fetchone()
-            if row:
-                return json.loads(row[0])
+        with self._reader() as conn:
+            rows = self._query(
+                conn, f"SELECT {_ENTRY_SELECT} FROM registry WHERE id = ?", (entry_id,)
+            )
+            if rows:
+                return _decode_row(ENTRY_COLUMNS, rows[0])
             return None
+
+    def load_many(
+        self, entry_ids: Iterable[str], chunk_size: int = 500,
+        fields: Iterable[str] = ENTRY_COLUMNS
+    ) -> Dict[str, Dict[str, Any]]:
+        """Load several entries with one IN query per chunk, keyed by id.
+
+        ``fields`` limits the columns read and decoded for each entry.
+        """
+        ids = list(dict.fromkeys(entry_ids))
+        fields = tuple(fields)
+        columns = ", ".join(fields)
+        loaded: Dict[str, Dict[str, Any]] = {}
+        with self._reader() as conn:
+            for start in range(0, len(ids), chunk_size):
+                chunk = ids[start:start + chunk_size]
+                placeholders = ",".join(["?"] * len(chunk))
+                for row in self._query(
+                    conn,
+                    f"SELECT id, {columns} FROM registry WHERE id IN ({placeholders})",
+                    chunk,
+                ):
+                    loaded[row[0]] = _decode_row(fields, row[1:])
+        return loaded
+
+    def dependency_edges(self) -> List[Tuple[str, str]]:
+        """All (entry_id, depends_on) edges in declaration order."""
+        with self._reader() as conn:
+            return conn.execute(
+                "SELECT entry_id, depends_on FROM registry_dependencies "
+                "ORDER BY entry_id, position"
+            ).fetchall()
+
+    @staticmethod
+    def _filter_clause(filters: Dict[str, Any]) -> Tuple[str, List[Any]]:
+        """Build the WHERE clause (over alias ``r``) for search filters."""
+        params: List[Any] = []
+        conditions: List[str] = ["1=1"]
+
+        namespace = filters.get("namespace")
+        if namespace:
+            conditions.append("r.namespace = ?")
+            params.append(namespace)
+
+        entry_type = filters.get("type")
+        if entry_type:
+            conditions.append("r.type = ?")
+            params.append(entry_type.value if hasattr(entry_type, "value") else entry_type)
+
+        status = filters.get("status")
+        if status:
+            conditions.append("r.status = ?")
+            params.append(status.value if hasattr(status, "value") else status)
+
+        facet_filters = filters.get("facets")
+        if facet_filters:
+            if not isinstance(facet_filters, dict):
+                raise ValueError("facets filter must be a dictionary")
+            for key, raw_values in facet_filters.items():
+                values = raw_values if isinstance(raw_values, list) else [raw_values]
+                values = [v for v in values if v is not None]
+                if not values:
+                    continue
+                placeholders = ",".join(["?"] * len(values))
+                conditions.append(
+                    f"EXISTS (SELECT 1 FROM registry_facets f WHERE f.entry_id = r.id AND f.facet_key = ? AND f.facet_value IN ({placeholders}))"
+                )
+                params.append(key)
+                params.extend(values)
+
+        return " AND ".join(conditions), params
     
     def search(self, **filters) -> List[Dict[str, Any]]:
         """Search entries with filters"""
-        with self.lock:
-            cursor = self.conn.cursor()
-            query = "SELECT DISTINCT r.data FROM registry r"
-            params: List[Any] = []
-            conditions: List[str] = ["1=1"]
-
-            namespace = filters.get("namespace")
-            if namespace:
-                conditions.append("r.namespace = ?")
-                params.append(namespace)
-
-            entry_type = filters.get("type")
-            if entry_type:
-                conditions.append("r.type = ?")
-                params.append(entry_type.value if hasattr(entry_type, "value") else entry_type)
-
-            status = filters.get("status")
-            if status:
-                conditions.append("r.status = ?")
-                params.append(status.value if hasattr(status, "value") else status)
-
-            facet_filters = filters.get("facets")
-            if facet_filters:
-                if not isinstance(facet_filters, dict):
-                    raise ValueError("facets filter must be a dictionary")
-                for key, raw_values in facet_filters.items():
-                    values = raw_values if isinstance(raw_values, list) else [raw_values]
-                    values = [v for v in values if v is not None]
-                    if not values:
-                        continue
-                    placeholders = ",".join(["?"] * len(values))
-                    conditions.append(
-                        f"EXISTS (SELECT 1 FROM registry_facets f WHERE f.entry_id = r.id AND f.facet_key = ? AND f.facet_value IN ({placeholders}))"
-                    )
-                    params.append(key)
-                    params.extend(values)
+        return self.select(ENTRY_COLUMNS, **filters)
+
+    def select(self, fields: Iterable[str], **filters) -> List[Dict[str, Any]]:
+        """Search returning only the requested columns of each entry.
+
+        Only the selected columns are read and decoded, so list views that
+        need a few fields never materialize whole entries.
+        """
+        fields = tuple(fields)
+        _check_fields(fields)
+        where, params = self._where(filters)
+        with self._reader() as conn:
+            rows = self._query(conn, self._select_sql(fields, where), params)
+        return [_decode_row(fields, row) for row in rows]
+
+    def _keyed_select(
+        self, fields: Tuple[str, ...], filters: Dict[str, Any]
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        """(id, row) pairs of matching entries in id order, for merging shards."""
+        _check_fields(fields)
+        where, params = self._where(filters)
+        with self._reader() as conn:
+            rows = self._query(conn, self._select_sql(fields, where, ordered=True), params)
+        width = len(fields)
+        return [(row[width], _decode_row(fields, row[:width])) for row in rows]
+
+    @staticmethod
+    def _select_sql(fields: Tuple[str, ...], where: str, ordered: bool = False) -> str:
+        """SQL run by select(); ``ordered`` appends the id sort key."""
+        columns = ", ".join(f"r.{name}" for name in fields)
+        if ordered:
+            return f"SELECT {columns}, r.id FROM registry r WHERE {where} ORDER BY r.id"
+        return f"SELECT {columns} FROM registry r WHERE {where}"
+
+    def facet_counts(
+        self, facet_keys: Optional[Iterable[str]] = None, **filters
+    ) -> Dict[str, Dict[str, int]]:
+        """Count matching entries per (facet key, value) with GROUP BY."""
+        where, params = self._where(filters)
+        keys = list(facet_keys) if facet_keys is not None else None
+        if keys is not None:
+            if not keys:
+                return {}
+            where += f" AND f.facet_key IN ({','.join(['?'] * len(keys))})"
+            params.extend(keys)
+        with self._reader() as conn:
+            rows = self._query(
+                conn,
+                "SELECT f.facet_key, f.facet_value, COUNT(DISTINCT f.entry_id) AS hits "
+                "FROM registry_facets f JOIN registry r ON r.id = f.entry_id "
+                f"WHERE {where} GROUP BY f.facet_key, f.facet_value "
+                "ORDER BY f.facet_key, hits DESC, f.facet_value",
+                params,
+            )
+        counts: Dict[str, Dict[str, int]] = {key: {} for key in keys or ()}
+        for key, value, hits in rows:
+            counts.setdefault(key, {})[value] = hits
+        return counts
+
+    def gefs_matrix(self, **filters) -> Tuple[List[str], Any]:
+        """Ids and GEFS dimension rows of matching entries, ordered by id.
+
+        The rows are a float64 NumPy array of shape (n, 6) when NumPy is
+        installed, otherwise a list of tuples; see gefs_batch_scores.
+        """
+        where, params = self._where(filters)
+        columns = ", ".join(f"r.{name}" for name in GEFS_COLUMNS)
+        with self._reader() as conn:
+            rows = self._query(
+                conn,
+                f"SELECT r.id, {columns} FROM registry r WHERE {where} ORDER BY r.id",
+                params,
+            )
+        ids = [row[0] for row in rows]
+        vectors = [row[1:] for row in rows]
+        if np is not None:
+            vectors = np.array(vectors, dtype=np.float64).reshape(-1, len(GEFS_COLUMNS))
+        return ids, vectors
+
+    def top_k(
+        self, weights: Any = None, k: int = 10,
+        fields: Iterable[str] = ("id", "namespace", "name", "type", "version"),
+        **filters
+    ) -> List[Tuple[Dict[str, Any], float]]:
+        """The k best (row, score) pairs by weighted GEFS score, in SQL.
+
+        The default weights rank by gefs_overall through its index; custom
+        weights are scored over the numeric GEFS columns. Ties go to the
+        lower id.
+        """
+        fields = tuple(fields)
+        _check_fields(fields)
+        vector = gefs_weight_vector(weights)
+        where, params = self._where(filters)
+        if vector == GEFS_WEIGHTS:
+            score, score_params = "r.gefs_overall", []
+        else:
+            score = " + ".join(f"? * r.{name}" for name in GEFS_COLUMNS)
+            score_params = list(vector)
+        columns = ", ".join(f"r.{name}" for name in fields)
+        with self._reader() as conn:
+            rows = self._query(
+                conn,
+                f"SELECT {columns}, {score} AS score FROM registry r WHERE {where} "
+                "ORDER BY score DESC, r.id LIMIT ?",
+                [*score_params, *params, k],
+            )
+        width = len(fields)
+        return [(_decode_row(fields, row[:width]), row[width]) for row in rows]
+
+    def page(
+        self,
+        after: Optional[Tuple[int, str]] = None,
+        limit: int = 100,
+        fields: Iterable[str] = ENTRY_COLUMNS,
+        **filters
+    ) -> Tuple[List[Dict[str, Any]], Optional[Tuple[int, str]]]:
+        """One keyset page ordered by (updated_at, id).
+
+        Returns the rows after the ``after`` position and the position of
+        the last row, or None when there are no further rows. Each page is
+        an index range scan, so paging never re-reads earlier rows.
+        """
+        rows = self._keyed_page(after, limit + 1, tuple(fields), filters)
+        next_key = rows[limit - 1][0] if len(rows) > limit else None
+        return [row for _, row in rows[:limit]], next_key
+
+    def _keyed_page(
+        self, after: Optional[Tuple[int, str]], limit: int,
+        fields: Tuple[str, ...], filters: Dict[str, Any]
+    ) -> List[Tuple[Tuple[int, str], Dict[str, Any]]]:
+        """Up to ``limit`` (key, row) pairs after ``after`` in key order."""
+        where, params = self._where(filters)
+        if after is not None:
+            where += " AND (r.updated_at, r.id) > (?, ?)"
+            params.extend(after)
+        columns = ", ".join(f"r.{name}" for name in fields)
+        with self._reader() as conn:
+            rows = self._query(
+                conn,
+                f"SELECT {columns}, r.updated_at, r.id FROM registry r WHERE {where} "
+                "ORDER BY r.updated_at, r.id LIMIT ?",
+                [*params, limit],
+            )
+        width = len(fields)
+        return [(tuple(row[width:]), _decode_row(fields, row[:width])) for row in rows]
 
-            query += " WHERE " + " AND ".join(conditions)
-            cursor.execute(query, params)
-            return [json.loads(row[0]) for row in cursor.fetchall()]
+    def text_search(
+        self, match: str, limit: int = 20, highlight: Tuple[str, str] = ("[", "]"),
+        **filters
+    ) -> List[Tuple[Dict[str, Any], float, str]]:
+        """Full-text search ranked by BM25, returning (entry, score, snippet).
+
+        ``match`` is an FTS5 query expression; scores are bm25() values, so
+        lower is better. Regular search filters narrow the matches.
+        """
+        if not self.fts_enabled:
+            raise RuntimeError("Full-text search requires SQLite with FTS5")
+        where, params = self._where(filters)
+        weights = ", ".join(str(w) for w in FTS_WEIGHTS)
+        columns = ", ".join(f"r.{name}" for name in ENTRY_COLUMNS)
+        query = (
+            f"SELECT {columns}, bm25(registry_fts, {weights}) AS score, "
+            "snippet(registry_fts, -1, ?, ?, '…', 12) "
+            "FROM registry_fts JOIN registry r ON r.row_id = registry_fts.rowid "
+            f"WHERE registry_fts MATCH ? AND {where} ORDER BY score LIMIT ?"
+        )
+        width = len(ENTRY_COLUMNS)
+        with self._reader() as conn:
+            rows = self._query(conn, query, [*highlight, match, *params, limit])
+        return [
+            (_decode_row(ENTRY_COLUMNS, row[:width]), row[width], row[width + 1])
+            for row in rows
+        ]
     
-    def delete(self, entry_id: str) -> bool:
-        """Delete entry"""
+    def delete(self, entry_id: str, log_change: bool = True) -> bool:
+        """Delete entry (``log_change=False`` leaves no change-log record)"""
         with self.lock:
             cursor = self.conn.cursor()
             cursor.execute("DELETE FROM registry_facets WHERE entry_id = ?", (entry_id,))
+            cursor.execute("DELETE FROM registry_dependencies WHERE entry_id = ?", (entry_id,))
             cursor.execute("DELETE FROM registry WHERE id = ?", (entry_id,))
+            deleted = cursor.rowcount > 0
+            if deleted and log_change:
+                cursor.execute(
+                    "INSERT INTO registry_changes (entry_id, op, changed_at) VALUES (?, ?, ?)",
+                    (entry_id, CHANGE_DELETE, _to_epoch_us(_utc_now())),
+                )
+            if deleted:
+                self._commit_write(cursor)
+            else:
+                self.conn.rollback()  # Nothing changed; keep the version (and caches)
+            return deleted
+
+    def changes_since(self, seq: int = 0, limit: int = 1000) -> List[Tuple[Any, ...]]:
+        """Change log rows (seq, entry_id, op, changed_at, data, diff) after seq."""
+        with self._reader() as conn:
+            return conn.execute(
+                "SELECT seq, entry_id, op, changed_at, data, diff FROM registry_changes "
+                "WHERE seq > ? ORDER BY seq LIMIT ?",
+                (seq, limit),
+            ).fetchall()
+
+    def last_change_seq(self) -> int:
+        """Sequence number of the newest change (0 if none)."""
+        with self._reader() as conn:
+            return conn.execute(
+                "SELECT COALESCE(MAX(seq), 0) FROM registry_changes"
+            ).fetchone()[0]
+
+    def prune_changes(self, upto_seq: int) -> int:
+        """Drop change log rows with seq <= upto_seq; returns rows removed."""
+        with self.lock:
+            cursor = self.conn.cursor()
+            cursor.execute("DELETE FROM registry_changes WHERE seq <= ?", (upto_seq,))
             self.conn.commit()
-            return cursor.rowcount > 0
+            return cursor.rowcount
     
     def count(self, **filters) -> int:
         """Count entries matching filters"""
-        with self.lock:
-            cursor = self.conn.cursor()
-            query = "SELECT COUNT(*) FROM registry WHERE 1=1"
-            params = []
-            
-            if 'namespace' in filters:
-                query += " AND namespace = ?"
-                params.append(filters['namespace'])
-            if 'type' in filters:
-                query += " AND type = ?"
-                params.append(filters['type'])
-            
-            cursor.execute(query, params)
-            return cursor.fetchone()[0]
+        where, params = self._where(filters)
+        with self._reader() as conn:
+            return self._query(conn, f"SELECT COUNT(*) FROM registry r WHERE {where}", params)[0][0]
+
+    def explain(
+        self, fields: Iterable[str] = ENTRY_COLUMNS, ordered: bool = False, **filters
+    ) -> List[str]:
+        """EXPLAIN QUERY PLAN of the search for these filters, one step per line.
+
+        Nested steps are indented under their parent, as in the sqlite3
+        shell; "SEARCH ... USING INDEX" means an index serves the filter,
+        "SCAN r" a full table scan. ``ordered`` plans the id-sorted query
+        that sharded storage runs on each shard.
+        """
+        fields = tuple(fields)
+        _check_fields(fields)
+        where, params = self._filter_clause(filters)
+        sql = self._select_sql(fields, where, ordered)
+        with self._reader() as conn:
+            plan = conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+        depth: Dict[int, int] = {0: -1}
+        lines = []
+        for node, parent, _, detail in plan:
+            depth[node] = depth.get(parent, -1) + 1
+            lines.append("  " * depth[node] + detail)
+        return lines
+
+    def _index_columns(self, conn: sqlite3.Connection) -> List[List[str]]:
+        """Column lists of every index on the registry table."""
+        indexes = []
+        for row in conn.execute("PRAGMA index_list(registry)").fetchall():
+            info = conn.execute(f"PRAGMA index_info({row[1]})").fetchall()
+            indexes.append([column for _, _, column in sorted(info)])
+        return indexes
+
+    def suggest_indexes(self, min_hits: int = 10, create: bool = False) -> List[IndexSuggestion]:
+        """Composite indexes for filter combinations seen at least min_hits times.
+
+        Only combinations of two or more INDEXABLE_FILTERS columns that no
+        existing index leads with are suggested, most used first. Columns
+        are ordered by selectivity (distinct values) so the index prefix
+        also serves the narrower filters. With ``create`` the indexes are
+        built and the planner statistics refreshed.
+        """
+        with self.profiler.lock:
+            usage = [
+                (columns, hits) for columns, hits in self.profiler.filter_usage.items()
+                if len(columns) > 1 and hits >= min_hits
+            ]
+        if not usage:
+            return []
+        with self._reader() as conn:
+            indexes = self._index_columns(conn)
+            distinct = {
+                name: conn.execute(f"SELECT COUNT(DISTINCT {name}) FROM registry").fetchone()[0]
+                for name in {name for columns, _ in usage for name in columns}
+            }
+        suggestions = []
+        for columns, hits in sorted(usage, key=lambda item: (-item[1], item[0])):
+            if any(set(index[:len(columns)]) == set(columns) for index in indexes):
+                continue
+            ordered = tuple(sorted(columns, key=lambda name: (-distinct[name], name)))
+            sql = (
+                f"CREATE INDEX IF NOT EXISTS idx_{'_'.join(ordered)} "
+                f"ON registry({', '.join(ordered)})"
+            )
+            suggestions.append(IndexSuggestion(ordered, hits, sql))
+            indexes.append(list(ordered))
+        if create and suggestions:
+            with self.lock:
+                for suggestion in suggestions:
+                    self.conn.execute(suggestion.sql)
+                self.conn.execute("ANALYZE registry")
+                self.conn.commit()
+        return suggestions
     
+    @contextmanager
+    def _snapshot_rows(self, batch_size: int = 1000):
+        """Yield ``(count, version, rows)`` read from one consistent snapshot.
+
+        Pooled readers hold a read transaction for the whole scan, so the
+        count and the rows agree even while writes continue; ``rows``
+        streams through the cursor ``batch_size`` rows at a time.
+        """
+        with self._reader() as conn:
+            snapshot = conn is not self.conn
+            if snapshot:
+                conn.execute("BEGIN")
+            try:
+                count = conn.execute("SELECT COUNT(*) FROM registry").fetchone()[0]
+                row = conn.execute(
+                    "SELECT value FROM registry_meta WHERE key = 'version'"
+                ).fetchone()
+                cursor = conn.execute(
+                    f"SELECT {_ENTRY_SELECT} FROM registry ORDER BY row_id"
+                )
+
+                def rows() -> Iterator[Tuple[Any, ...]]:
+                    while True:
+                        batch = cursor.fetchmany(batch_size)
+                        if not batch:
+                            return
+                        yield from batch
+
+                yield count, row[0] if row else 0, rows()
+            finally:
+                if snapshot:
+                    conn.rollback()
+
+    def export_snapshot(
+        self, path: str, compression: Optional[str] = None, batch_size: int = 1000
+    ) -> int:
+        """Stream every entry into a compressed binary snapshot at ``path``.
+
+        ``compression`` is "zstd" or "gzip" (default: zstd when zstandard
+        is installed). Rows are copied as stored, without decoding, and the
+        file is written next to ``path`` then renamed into place. Returns
+        the number of entries written.
+        """
+        with self._snapshot_rows(batch_size) as (count, version, rows):
+            return _write_snapshot(path, compression, count, version, rows)
+
+    def export_json(self, path: str):
+        """Export all entries to JSON, streaming one entry at a time"""
+        with self._snapshot_rows() as (_, _, rows):
+            _write_json_export(path, rows)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 🧩 SHARDED STORAGE - ONE DATABASE PER NAMESPACE GROUP
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class ConsistentHashRing:
+    """Maps keys onto ``nodes`` buckets with virtual-node consistent hashing"""
+
+    def __init__(self, nodes: int, replicas: int = 64):
+        self.nodes = nodes
+        ring = sorted(
+            (self._hash(f"{node}:{replica}"), node)
+            for node in range(nodes) for replica in range(replicas)
+        )
+        self._points = [point for point, _ in ring]
+        self._owners = [node for _, node in ring]
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        return int.from_bytes(hashlib.sha1(key.encode("utf-8")).digest()[:8], "big")
+
+    def node_for(self, key: str) -> int:
+        index = bisect.bisect(self._points, self._hash(key)) % len(self._points)
+        return self._owners[index]
+
+
+def shard_paths(db_path: str, shards: int) -> List[str]:
+    """Database file of each shard: ``registry.db`` -> ``registry.shard0.db``..."""
+    if _is_memory_db(db_path):
+        return [":memory:"] * shards
+    path = Path(db_path)
+    return [str(path.with_name(f"{path.stem}.shard{index}{path.suffix}")) for index in range(shards)]
+
+
+class ShardedStorageBackend:
+    """StorageBackend spread over one SQLite file per namespace group
+
+    ``entry.namespace`` is routed to a shard by consistent hashing, so each
+    namespace lives in exactly one file with its own writer lock and
+    independent namespaces never contend. Queries filtered by namespace
+    touch one shard; the rest scatter to every shard in parallel, and
+    select/search results from several shards are merged in id order.
+
+    Lookups by id alone go to every shard. Change-log positions are tuples
+    of per-shard sequence numbers. The shard count is recorded in each
+    file and must not change for an existing registry.
+    """
+
+    def __init__(self, db_path: str = ":memory:", shards: int = 4, readers: int = 4,
+                 slow_query_threshold: float = 0.1):
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+        self.db_path = db_path
+        self.ring = ConsistentHashRing(shards)
+        self.profiler = QueryProfiler(threshold=slow_query_threshold)
+        self.commit_listeners: List[Callable[[], None]] = []
+        self.shards = [
+            StorageBackend(path, readers=readers, profiler=self.profiler)
+            for path in shard_paths(db_path, shards)
+        ]
+        try:
+            for index, shard in enumerate(self.shards):
+                self._check_layout(shard, index)
+                shard.commit_listeners = self.commit_listeners
+        except ValueError:
+            for shard in self.shards:
+                shard.close()
+            raise
+        self.fts_enabled = all(shard.fts_enabled for shard in self.shards)
+        self.executor = ThreadPoolExecutor(
+            max_workers=shards, thread_name_prefix="registry-shard"
+        )
+
+    def _check_layout(self, shard: StorageBackend, index: int):
+        with shard.lock:
+            shard.conn.executemany(
+                "INSERT OR IGNORE INTO registry_meta VALUES (?, ?)",
+                [("shard_count", len(self.shards)), ("shard_index", index)],
+            )
+            shard.conn.commit()
+            stored = dict(shard.conn.execute(
+                "SELECT key, value FROM registry_meta WHERE key IN ('shard_count', 'shard_index')"
+            ).fetchall())
+        if stored != {"shard_count": len(self.shards), "shard_index": index}:
+            raise ValueError(
+                f"Shard {index} of {self.db_path} was created as shard "
+                f"{stored['shard_index']} of {stored['shard_count']}"
+            )
+
+    @property
+    def local_writes(self) -> int:
+        return sum(shard.local_writes for shard in self.shards)
+
+    def shard_for(self, namespace: str) -> StorageBackend:
+        """The shard holding a namespace."""
+        return self.shards[self.ring.node_for(namespace)]
+
+    def _targets(self, filters: Dict[str, Any]) -> List[StorageBackend]:
+        namespace = filters.get("namespace")
+        return [self.shard_for(namespace)] if namespace else self.shards
+
+    def _gather(self, func: Callable[[Any], Any], items: Optional[List[Any]] = None) -> List[Any]:
+        """Run func on each item (default: every shard) in parallel, in order."""
+        items = self.shards if items is None else items
+        if len(items) == 1:
+            return [func(items[0])]
+        return list(self.executor.map(func, items))
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+        for shard in self.shards:
+            shard.close()
+
+    def data_version(self) -> Tuple[int, ...]:
+        """Per-shard change markers (see StorageBackend.data_version)."""
+        return tuple(shard.data_version() for shard in self.shards)
+
+    def version(self) -> int:
+        """Sum of the shard versions; it grows with every committed write."""
+        return sum(shard.version() for shard in self.shards)
+
+    def save(self, entry: RegistryEntry, diff: Optional[Dict[str, Dict[str, Any]]] = None):
+        self.shard_for(entry.namespace).save(entry, diff)
+        self._drop_moved([entry])
+
+    def update(
+        self, entry: RegistryEntry, updated_at: datetime
+    ) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Delta update on the home shard; a namespace change moves the entry."""
+        diff = self.shard_for(entry.namespace).update(entry, updated_at)
+        if diff is not None:
+            return diff
+        old = self.load(entry.id)
+        if old is None:
+            return None
+        updated = replace(entry, updated_at=updated_at)
+        diff = _entry_diff(old, _decode_row(REGISTRY_COLUMNS, StorageBackend._entry_row(updated)))
+        self.save(updated, diff)
+        return diff
+
+    def save_many(self, entries: List[RegistryEntry], chunk_size: int = 500) -> Dict[str, str]:
+        """Save each shard's entries in parallel, returning {entry_id: error}."""
+        groups: Dict[int, List[RegistryEntry]] = {}
+        for entry in entries:
+            groups.setdefault(self.ring.node_for(entry.namespace), []).append(entry)
+        failed: Dict[str, str] = {}
+        for result in self._gather(
+            lambda index: self.shards[index].save_many(groups[index], chunk_size), list(groups)
+        ):
+            failed.update(result)
+        self._drop_moved([entry for entry in entries if entry.id not in failed])
+        return failed
+
+    def _drop_moved(self, entries: List[RegistryEntry]):
+        """Delete stored entries from shards they left after a namespace change.
+
+        The change log of the new shard already has the upsert, so the old
+        copy goes without a delete record that would undo it for readers.
+        """
+        if len(self.shards) == 1 or not entries:
+            return
+        home = {entry.id: self.ring.node_for(entry.namespace) for entry in entries}
+
+        def drop(index: int):
+            shard = self.shards[index]
+            for entry_id in shard.existing_ids(i for i, node in home.items() if node != index):
+                shard.delete(entry_id, log_change=False)
+
+        self._gather(drop, list(range(len(self.shards))))
+
+    def existing_ids(self, entry_ids: Iterable[str], chunk_size: int = 500) -> Set[str]:
+        ids = list(entry_ids)
+        found: Set[str] = set()
+        for result in self._gather(lambda shard: shard.existing_ids(ids, chunk_size)):
+            found |= result
+        return found
+
+    def load(self, entry_id: str) -> Optional[Dict[str, Any]]:
+        for data in self._gather(lambda shard: shard.load(entry_id)):
+            if data is not None:
+                return data
+        return None
+
+    def load_many(
+        self, entry_ids: Iterable[str], chunk_size: int = 500,
+        fields: Iterable[str] = ENTRY_COLUMNS
+    ) -> Dict[str, Dict[str, Any]]:
+        ids, fields = list(entry_ids), tuple(fields)
+        loaded: Dict[str, Dict[str, Any]] = {}
+        for result in self._gather(lambda shard: shard.load_many(ids, chunk_size, fields)):
+            loaded.update(result)
+        return loaded
+
+    def dependency_edges(self) -> List[Tuple[str, str]]:
+        # Each entry lives on one shard, so merging by entry id keeps positions
+        return list(heapq.merge(
+            *self._gather(lambda shard: shard.dependency_edges()), key=lambda edge: edge[0]
+        ))
+
+    def search(self, **filters) -> List[Dict[str, Any]]:
+        return self.select(ENTRY_COLUMNS, **filters)
+
+    def select(self, fields: Iterable[str], **filters) -> List[Dict[str, Any]]:
+        fields = tuple(fields)
+        targets = self._targets(filters)
+        if len(targets) == 1:
+            return targets[0].select(fields, **filters)
+        parts = self._gather(lambda shard: shard._keyed_select(fields, filters), targets)
+        return [row for _, row in heapq.merge(*parts, key=lambda pair: pair[0])]
+
+    def count(self, **filters) -> int:
+        return sum(self._gather(lambda shard: shard.count(**filters), self._targets(filters)))
+
+    def facet_counts(
+        self, facet_keys: Optional[Iterable[str]] = None, **filters
+    ) -> Dict[str, Dict[str, int]]:
+        keys = list(facet_keys) if facet_keys is not None else None
+        totals: Dict[str, Counter] = {}
+        for counts in self._gather(
+            lambda shard: shard.facet_counts(keys, **filters), self._targets(filters)
+        ):
+            for key, values in counts.items():
+                totals.setdefault(key, Counter()).update(values)
+        ordered_keys = keys if keys is not None else sorted(totals)
+        return {
+            key: dict(sorted(totals.get(key, {}).items(), key=lambda item: (-item[1], item[0])))
+            for key in ordered_keys
+        }
+
+    def gefs_matrix(self, **filters) -> Tuple[List[str], Any]:
+        parts = self._gather(lambda shard: shard.gefs_matrix(**filters), self._targets(filters))
+        ids = [entry_id for part_ids, _ in parts for entry_id in part_ids]
+        order = sorted(range(len(ids)), key=ids.__getitem__)
+        if np is not None:
+            vectors = np.concatenate([vectors for _, vectors in parts])[order]
+        else:
+            vectors = [row for _, rows in parts for row in rows]
+            vectors = [vectors[index] for index in order]
+        return [ids[index] for index in order], vectors
+
+    def top_k(
+        self, weights: Any = None, k: int = 10,
+        fields: Iterable[str] = ("id", "namespace", "name", "type", "version"),
+        **filters
+    ) -> List[Tuple[Dict[str, Any], float]]:
+        fields = tuple(fields)
+        wanted = fields if "id" in fields else fields + ("id",)
+        merged = heapq.merge(
+            *self._gather(
+                lambda shard: shard.top_k(weights, k, wanted, **filters), self._targets(filters)
+            ),
+            key=lambda hit: (-hit[1], hit[0]["id"]),
+        )
+        return [
+            ({name: row[name] for name in fields}, score) for row, score in islice(merged, k)
+        ]
+
+    def page(
+        self,
+        after: Optional[Tuple[int, str]] = None,
+        limit: int = 100,
+        fields: Iterable[str] = ENTRY_COLUMNS,
+        **filters
+    ) -> Tuple[List[Dict[str, Any]], Optional[Tuple[int, str]]]:
+        """One keyset page ordered by (updated_at, id) across the shards."""
+        fields = tuple(fields)
+        merged = heapq.merge(
+            *self._gather(
+                lambda shard: shard._keyed_page(after, limit + 1, fields, filters),
+                self._targets(filters),
+            ),
+            key=lambda keyed: keyed[0],
+        )
+        rows = list(islice(merged, limit + 1))
+        next_key = rows[limit - 1][0] if len(rows) > limit else None
+        return [row for _, row in rows[:limit]], next_key
+
+    def text_search(
+        self, match: str, limit: int = 20, highlight: Tuple[str, str] = ("[", "]"),
+        **filters
+    ) -> List[Tuple[Dict[str, Any], float, str]]:
+        """Full-text search merged by bm25 score.
+
+        bm25 uses per-shard term statistics, so scores from different
+        shards are comparable only approximately.
+        """
+        merged = heapq.merge(
+            *self._gather(
+                lambda shard: shard.text_search(match, limit, highlight, **filters),
+                self._targets(filters),
+            ),
+            key=lambda hit: hit[1],
+        )
+        return list(islice(merged, limit))
+
+    def delete(self, entry_id: str) -> bool:
+        return any(self._gather(lambda shard: shard.delete(entry_id)))
+
+    def _positions(self, position: ChangePosition) -> Tuple[int, ...]:
+        if not position:
+            return (0,) * len(self.shards)
+        if len(position) != len(self.shards):
+            raise ValueError("Change position does not match the shard count")
+        return tuple(position)
+
+    def changes_since(self, position: ChangePosition = 0, limit: int = 1000) -> List[Tuple[Any, ...]]:
+        """Change log rows merged by time; seq is the position after each row."""
+        start = self._positions(position)
+        parts = self._gather(
+            lambda index: [
+                (row[3], index, row)
+                for row in self.shards[index].changes_since(start[index], limit)
+            ],
+            list(range(len(self.shards))),
+        )
+        current = list(start)
+        rows = []
+        for _, index, (seq, *change) in islice(heapq.merge(*parts), limit):
+            current[index] = seq
+            rows.append((tuple(current), *change))
+        return rows
+
+    def last_change_seq(self) -> Tuple[int, ...]:
+        return tuple(self._gather(lambda shard: shard.last_change_seq()))
+
+    def prune_changes(self, upto_seq: ChangePosition) -> int:
+        upto = self._positions(upto_seq)
+        return sum(
+            shard.prune_changes(seq) for shard, seq in zip(self.shards, upto) if seq
+        )
+
+    def explain(
+        self, fields: Iterable[str] = ENTRY_COLUMNS, ordered: bool = False, **filters
+    ) -> List[str]:
+        """Plan on one shard; all shards share the schema.
+
+        A query spanning several shards is planned with its id sort.
+        """
+        targets = self._targets(filters)
+        return targets[0].explain(fields, ordered or len(targets) > 1, **filters)
+
+    def suggest_indexes(self, min_hits: int = 10, create: bool = False) -> List[IndexSuggestion]:
+        return self._gather(lambda shard: shard.suggest_indexes(min_hits, create))[0]
+
+    def export_snapshot(
+        self, path: str, compression: Optional[str] = None, batch_size: int = 1000
+    ) -> int:
+        with ExitStack() as stack:
+            parts = [
+                stack.enter_context(shard._snapshot_rows(batch_size)) for shard in self.shards
+            ]
+            return _write_snapshot(
+                path, compression,
+                sum(count for count, _, _ in parts),
+                sum(version for _, version, _ in parts),
+                chain.from_iterable(rows for _, _, rows in parts),
+            )
+
     def export_json(self, path: str):
-        """Export all entries to JSON"""
+        with ExitStack() as stack:
+            parts = [stack.enter_context(shard._snapshot_rows()) for shard in self.shards]
+            _write_json_export(path, chain.from_iterable(rows for _, _, rows in parts))
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# 🕸️ DEPENDENCY GRAPH - CLOSURE, CYCLES & INSTALL ORDER
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class DependencyCycleError(ValueError):
+    """Raised when dependencies form a cycle; ``cycle`` is the id path"""
+
+    def __init__(self, cycle: List[str]):
+        super().__init__(f"Dependency cycle: {' -> '.join(cycle)}")
+        self.cycle = cycle
+
+
+class DependencyGraph:
+    """In-memory adjacency index over registry dependency edges
+
+    Transitive closures are memoized per node. Changing a node's edges
+    only forgets the memo of that node and of the nodes that can reach
+    it, so unrelated closures stay warm across writes.
+    """
+
+    def __init__(self, edges: Iterable[Tuple[str, str]] = ()):
+        self.deps: Dict[str, List[str]] = {}
+        self.rdeps: Dict[str, Set[str]] = {}
+        self._closure: Dict[str, FrozenSet[str]] = {}
+        self.lock = threading.RLock()
+        for entry_id, dep in edges:
+            self.deps.setdefault(entry_id, []).append(dep)
+            self.rdeps.setdefault(dep, set()).add(entry_id)
+
+    def set_dependencies(self, entry_id: str, dependencies: Iterable[str]):
+        """Replace the outgoing edges of entry_id."""
         with self.lock:
-            cursor = self.conn.cursor()
-            cursor.execute("SELECT data FROM registry")
-            entries = [json.loads(row[0]) for row in cursor.fetchall()]
-            with open(path, 'w') as f:
-                json.dump(entries, f, indent=2)
+            self._invalidate(entry_id)
+            for dep in self.deps.pop(entry_id, []):
+                self.rdeps.get(dep, set()).discard(entry_id)
+            deps = list(dict.fromkeys(dependencies))
+            if deps:
+                self.deps[entry_id] = deps
+                for dep in deps:
+                    self.rdeps.setdefault(dep, set()).add(entry_id)
+
+    def remove(self, entry_id: str):
+        """Drop the outgoing edges of a deleted entry."""
+        self.set_dependencies(entry_id, ())
+
+    def _invalidate(self, entry_id: str):
+        """Forget memoized closures of entry_id and everything reaching it."""
+        pending = [entry_id]
+        seen = {entry_id}
+        while pending:
+            node = pending.pop()
+            self._closure.pop(node, None)
+            for parent in self.rdeps.get(node, ()):
+                if parent not in seen:
+                    seen.add(parent)
+                    pending.append(parent)
+
+    def closure(self, entry_id: str) -> FrozenSet[str]:
+        """Every id reachable from entry_id (excluding itself unless cyclic)."""
+        with self.lock:
+            cached = self._closure.get(entry_id)
+            if cached is not None:
+                return cached
+            reached: Set[str] = set()
+            pending = list(self.deps.get(entry_id, ()))
+            while pending:
+                node = pending.pop()
+                if node in reached:
+                    continue
+                reached.add(node)
+                memo = self._closure.get(node)
+                if memo is not None:
+                    reached |= memo
+                else:
+                    pending.extend(self.deps.get(node, ()))
+            result = frozenset(reached)
+            self._closure[entry_id] = result
+            return result
+
+    def _postorder(
+        self, roots: Iterable[str], overrides: Optional[Dict[str, List[str]]] = None
+    ) -> Iterator[str]:
+        """Depth-first walk yielding each node after all of its dependencies.
+
+        Iterative, so deep chains cannot overflow the stack; raises
+        DependencyCycleError with the path as soon as a back edge is found.
+        ``overrides`` replaces the stored edges of the given nodes.
+        """
+        deps = self.deps if not overrides else {**self.deps, **overrides}
+        done: Set[str] = set()
+        for root in roots:
+            if root in done:
+                continue
+            path = [root]
+            on_path = {root}
+            stack = [iter(deps.get(root, ()))]
+            while stack:
+                node = next(stack[-1], None)
+                if node is None:
+                    stack.pop()
+                    finished = path.pop()
+                    on_path.discard(finished)
+                    done.add(finished)
+                    yield finished
+                    continue
+                if node in on_path:
+                    raise DependencyCycleError(path[path.index(node):] + [node])
+                if node in done:
+                    continue
+                path.append(node)
+                on_path.add(node)
+                stack.append(iter(deps.get(node, ())))
+
+    def find_cycle(self, roots: Optional[Iterable[str]] = None) -> Optional[List[str]]:
+        """Return a cycle reachable from roots (default: all nodes) as a path."""
+        with self.lock:
+            try:
+                for _ in self._postorder(list(roots) if roots is not None else list(self.deps)):
+                    pass
+            except DependencyCycleError as exc:
+                return exc.cycle
+            return None
+
+    def topological_order(
+        self, entry_ids: Iterable[str], overrides: Optional[Dict[str, List[str]]] = None
+    ) -> List[str]:
+        """entry_ids and their transitive dependencies, dependencies first.
+
+        Raises DependencyCycleError with the offending path on a cycle.
+        """
+        with self.lock:
+            return list(self._postorder(entry_ids, overrides))
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # 🏛️ HYPER REGISTRY - MAIN ENGINE
 # ═══════════════════════════════════════════════════════════════════════════════
 
+class BoundedLRU:
+    """Thread-safe dict-like LRU mapping holding at most max_size items"""
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self.data: "OrderedDict[Any, Any]" = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        with self.lock:
+            try:
+                value = self.data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self.data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def __setitem__(self, key: Any, value: Any):
+        with self.lock:
+            self.data[key] = value
+            self.data.move_to_end(key)
+            while len(self.data) > self.max_size:
+                self.data.popitem(last=False)
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: Any) -> bool:
+        with self.lock:
+            return key in self.data
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def pop(self, key: Any, default: Any = None) -> Any:
+        with self.lock:
+            return self.data.pop(key, default)
+
+    def clear(self):
+        with self.lock:
+            self.data.clear()
+
+
+_MISSING = object()
+
+
+def _normalize_filters(filters: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Canonical, hashable form of search filters for result caching."""
+    normalized = []
+    for key, value in sorted(filters.items()):
+        if hasattr(value, "value"):
+            value = value.value
+        if isinstance(value, dict):
+            value = tuple(sorted(
+                (facet, tuple(sorted({
+                    str(v) for v in (values if isinstance(values, list) else [values])
+                    if v is not None
+                })))
+                for facet, values in value.items()
+            ))
+        elif isinstance(value, list):
+            value = tuple(value)
+        normalized.append((key, value))
+    return tuple(normalized)
+
+
+@dataclass
+class BulkRegisterResult:
+    """Outcome of HyperRegistry.register_many"""
+    registered: List[str] = field(default_factory=list)
+    errors: Dict[str, List[str]] = field(default_factory=dict)  # entry id -> errors
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+@dataclass
+class SnapshotImportResult:
+    """Outcome of HyperRegistry.import_snapshot"""
+    header: Dict[str, Any] = field(default_factory=dict)
+    imported: int = 0
+    errors: Dict[str, List[str]] = field(default_factory=dict)  # entry id -> errors
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+@dataclass
+class ChangeRecord:
+    """One row of the registry change log"""
+    seq: ChangePosition
+    entry_id: str
+    op: str                          # CHANGE_UPSERT or CHANGE_DELETE
+    changed_at: datetime
+    entry: Optional[Dict[str, Any]]  # Entry as stored (to_dict form); None on delete
+    diff: Optional[Dict[str, Dict[str, Any]]] = None  # {field: {"old", "new"}} for updates
+
+
+@dataclass
+class TextSearchHit:
+    """One HyperRegistry.text_search result"""
+    entry: RegistryEntry
+    score: float    # bm25, lower is more relevant
+    snippet: str    # best matching fragment with highlighted terms
+
+
 class HyperRegistry:
     """
     Advanced Dynamic Universal Hyper Registry
@@ -517,20 +2476,45 @@ class HyperRegistry:
     - Conflict detection
     - Version management
     - Real-time queries
+
+    Entries (including known-missing ids) and search results are cached in
+    bounded LRUs. Both are checked against the registry version counter in
+    the database, so writes from other processes sharing the file drop
+    stale state on the next read.
+
+    With ``shards`` > 1 entries are stored in one database per namespace
+    group (see ShardedStorageBackend).
     """
     
-    def __init__(self, storage_path: Optional[str] = None):
+    def __init__(self, storage_path: Optional[str] = None,
+                 cache_size: int = 10_000, query_cache_size: int = 256,
+                 slow_query_threshold: float = 0.1, shards: int = 1):
         self.storage_path = storage_path or ":memory:"
-        self.storage = StorageBackend(self.storage_path)
+        if shards > 1:
+            self.storage = ShardedStorageBackend(
+                self.storage_path, shards=shards, slow_query_threshold=slow_query_threshold
+            )
+        else:
+            self.storage = StorageBackend(
+                self.storage_path, slow_query_threshold=slow_query_threshold
+            )
         self.hooks: Dict[str, List[Callable]] = {
             'before_register': [],
             'after_register': [],
+            'after_register_batch': [],
             'before_update': [],
             'after_update': [],
             'before_delete': [],
             'after_delete': []
         }
-        self.cache: Dict[str, RegistryEntry] = {}
+        self.cache = BoundedLRU(cache_size)
+        self.query_cache = BoundedLRU(query_cache_size)
+        self._graph: Optional[DependencyGraph] = None
+        self._watchers: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+        self.storage.commit_listeners.append(self._notify_watchers)
+        self._data_version = self.storage.data_version()
+        self._version = self.storage.version()
+        self._local_writes = self.storage.local_writes
         self.stats = {
             'total_registered': 0,
             'total_active': 0,
@@ -554,9 +2538,13 @@ class HyperRegistry:
         
         # Save
         entry.status = EntryStatus.REGISTERED
-        entry.updated_at = datetime.now()
-        self.storage.save(entry)
+        entry.updated_at = _utc_now()
+        try:
+            self.storage.save(entry)
+        except sqlite3.IntegrityError:
+            raise ValueError(_duplicate_version_error(entry)) from None
         self.cache[entry.id] = entry
+        self._index_dependencies(entry)
         
         # Update stats
         self.stats['total_registered'] += 1
@@ -565,12 +2553,115 @@ class HyperRegistry:
         self._run_hooks('after_register', entry)
         
         return True
+
+    def register_many(
+        self, entries: Iterable[RegistryEntry], chunk_size: int = 500,
+        restore: bool = False
+    ) -> BulkRegisterResult:
+        """Register many entries in chunked transactions.
+
+        Every entry is validated (fields, conflicts, duplicate ids in the
+        batch, before_register hooks) before anything is written; invalid
+        entries are reported in the result instead of aborting the batch.
+        after_register hooks run once the writes are committed, followed by
+        after_register_batch with the list of stored entries.
+
+        With ``restore`` the entries come from a snapshot: their status and
+        timestamps are kept and conflicts are not re-checked.
+        """
+        entries = list(entries)
+        result = BulkRegisterResult()
+        batch_ids = {entry.id for entry in entries}
+        existing = set() if restore else self.storage.existing_ids(
+            conflict_id for entry in entries for conflict_id in entry.conflicts
+        )
+
+        accepted: List[RegistryEntry] = []
+        seen = set()
+        for entry in entries:
+            errors = entry.validate()
+            if entry.id in seen:
+                errors.append("Duplicate entry ID in batch")
+            if not restore and any(c in existing or c in batch_ids for c in entry.conflicts):
+                errors.append("Entry conflicts with existing entries")
+            if not errors:
+                try:
+                    self._run_hooks('before_register', entry)
+                except Exception as exc:
+                    errors.append(f"before_register hook failed: {exc}")
+            seen.add(entry.id)
+            if errors:
+                result.errors.setdefault(entry.id, []).extend(errors)
+                continue
+            if not restore:
+                entry.status = EntryStatus.REGISTERED
+                entry.updated_at = _utc_now()
+            accepted.append(entry)
+
+        failed = self.storage.save_many(accepted, chunk_size=chunk_size)
+        stored = [entry for entry in accepted if entry.id not in failed]
+        for entry_id, error in failed.items():
+            result.errors.setdefault(entry_id, []).append(f"Storage error: {error}")
+
+        for entry in stored:
+            self.cache[entry.id] = entry
+            self._index_dependencies(entry)
+            result.registered.append(entry.id)
+        self.stats['total_registered'] += len(stored)
+
+        for entry in stored:
+            self._run_hooks('after_register', entry)
+        for hook in self.hooks['after_register_batch']:
+            hook(stored)
+        return result
+    
+    def _sync_cache(self):
+        """Drop cached state invalidated since the last observed version.
+
+        Writes made through this registry already updated the entry cache,
+        so it survives when they account for the whole version change; any
+        other writer clears it. Search results are dropped on every change.
+        The registry version is only read once data_version has moved, so
+        a cached read costs no query.
+        """
+        data_version = self.storage.data_version()
+        if data_version == self._data_version:
+            return
+        self._data_version = data_version
+        local_writes = self.storage.local_writes
+        version = self.storage.version()
+        if version == self._version:
+            return
+        if version - self._version != local_writes - self._local_writes:
+            self.cache.clear()
+            self._graph = None
+        self.query_cache.clear()
+        self._version = version
+        self._local_writes = local_writes
+
+    def _cached_query(self, key: Tuple[Any, ...], run: Callable[[], Any]) -> Any:
+        """Serve a query from the result cache, running it on a miss.
+
+        The cached object is shared: callers build fresh results from it
+        (see _copy_row) so mutating a result never reaches the cache.
+        """
+        self._sync_cache()
+        try:
+            results = self.query_cache.get(key, _MISSING)
+        except TypeError:  # Unhashable filter values are never cached
+            return run()
+        if results is _MISSING:
+            results = run()
+            self.query_cache[key] = results
+        return results
     
     def get(self, entry_id: str) -> Optional[RegistryEntry]:
         """Get entry by ID"""
-        # Check cache
-        if entry_id in self.cache:
-            return self.cache[entry_id]
+        # Check cache (None marks an id known to be missing)
+        self._sync_cache()
+        cached = self.cache.get(entry_id, _MISSING)
+        if cached is not _MISSING:
+            return cached
         
         # Load from storage
         start = time.time()
@@ -581,14 +2672,45 @@ class HyperRegistry:
              (time.time() - start)) / self.stats['total_queries']
         )
         
-        if data:
-            entry = self._dict_to_entry(data)
-            self.cache[entry_id] = entry
-            return entry
-        return None
+        entry = self._dict_to_entry(data) if data else None
+        self.cache[entry_id] = entry
+        return entry
+
+    def get_many(self, entry_ids: Iterable[str]) -> Dict[str, RegistryEntry]:
+        """Get several entries, loading all cache misses in one query."""
+        self._sync_cache()
+        found: Dict[str, RegistryEntry] = {}
+        missing: List[str] = []
+        for entry_id in dict.fromkeys(entry_ids):
+            cached = self.cache.get(entry_id, _MISSING)
+            if cached is _MISSING:
+                missing.append(entry_id)
+            elif cached is not None:
+                found[entry_id] = cached
+        if missing:
+            start = time.time()
+            loaded = self.storage.load_many(missing)
+            self.stats['total_queries'] += 1
+            self.stats['avg_query_time'] = (
+                (self.stats['avg_query_time'] * (self.stats['total_queries'] - 1) + 
+                 (time.time() - start)) / self.stats['total_queries']
+            )
+            for entry_id in missing:
+                data = loaded.get(entry_id)
+                entry = self._dict_to_entry(data) if data else None
+                self.cache[entry_id] = entry
+                if entry is not None:
+                    found[entry_id] = entry
+        return found
     
     def search(self, **filters) -> List[RegistryEntry]:
         """Search entries"""
+        rows = self._cached_query(
+            ("search", _normalize_filters(filters)), lambda: self._search(**filters)
+        )
+        return [self._dict_to_entry(_copy_row(data)) for data in rows]
+
+    def _search(self, **filters) -> List[Dict[str, Any]]:
         start = time.time()
         results = self.storage.search(**filters)
         self.stats['total_queries'] += 1
@@ -597,7 +2719,128 @@ class HyperRegistry:
              (time.time() - start)) / self.stats['total_queries']
         )
         
-        return [self._dict_to_entry(data) for data in results]
+        return results
+
+    def select(self, fields: Iterable[str], **filters) -> List[Dict[str, Any]]:
+        """Search returning only the given fields (see REGISTRY_COLUMNS)."""
+        fields = tuple(fields)
+        rows = self._cached_query(
+            ("select", fields, _normalize_filters(filters)),
+            lambda: self.storage.select(fields, **filters),
+        )
+        return [_copy_row(row) for row in rows]
+
+    def facet_counts(
+        self, facet_keys: Optional[Iterable[str]] = None, **filters
+    ) -> Dict[str, Dict[str, int]]:
+        """Histogram of entries per facet value under the given filters.
+
+        Returns {facet_key: {value: count}} with values ordered by count,
+        for ``facet_keys`` (default: every facet key in use). Counts are
+        computed in SQL and cached until the next registry write.
+        """
+        keys = tuple(facet_keys) if facet_keys is not None else None
+        counts = self._cached_query(
+            ("facet_counts", keys, _normalize_filters(filters)),
+            lambda: self.storage.facet_counts(keys, **filters),
+        )
+        return {key: dict(values) for key, values in counts.items()}
+
+    def top_k(
+        self, weights: Any = None, k: int = 10,
+        fields: Iterable[str] = ("id", "namespace", "name", "type", "version"),
+        **filters
+    ) -> List[Tuple[Dict[str, Any], float]]:
+        """Best k matches by weighted GEFS score as (fields, score) pairs.
+
+        ``weights`` is a {dimension: weight} mapping or six weights in
+        GEFS_DIMENSIONS order (default: the GEFSScore.overall weights).
+        No RegistryEntry objects are built. With NumPy the GEFS matrix of
+        the filtered entries is cached until the next write and each call
+        re-scores it with one matrix product; without NumPy the ranking
+        runs in SQL. Ties go to the lower id.
+        """
+        fields = tuple(fields)
+        _check_fields(fields)
+        vector = gefs_weight_vector(weights)
+        if k <= 0:
+            return []
+        if np is None:
+            return self.storage.top_k(vector, k, fields, **filters)
+        ids, matrix = self._cached_query(
+            ("gefs_matrix", _normalize_filters(filters)),
+            lambda: self.storage.gefs_matrix(**filters),
+        )
+        if not ids:
+            return []
+        scores = gefs_batch_scores(matrix, vector)
+        if k < len(ids):
+            # Everything tied with the k-th best, in id order for tie-breaks
+            threshold = np.partition(scores, len(ids) - k)[len(ids) - k]
+            candidates = np.flatnonzero(scores >= threshold)
+        else:
+            candidates = np.arange(len(ids))
+        best = candidates[np.argsort(-scores[candidates], kind="stable")][:k]
+        rows = self.storage.load_many([ids[i] for i in best], fields=fields)
+        return [(rows[ids[i]], float(scores[i])) for i in best if ids[i] in rows]
+
+    def search_page(
+        self, after: Optional[str] = None, limit: int = 100, **filters
+    ) -> Tuple[List[RegistryEntry], Optional[str]]:
+        """Return one page of matches and the token for the next page.
+
+        Pages are ordered by (updated_at, id) and addressed by keyset, so
+        any page costs the same regardless of how deep it is. The token is
+        None on the last page.
+        """
+        key = _decode_cursor(after) if after else None
+        rows, next_key = self.storage.page(after=key, limit=limit, **filters)
+        entries = [self._dict_to_entry(data) for data in rows]
+        return entries, (_encode_cursor(next_key) if next_key else None)
+
+    def search_iter(self, batch_size: int = 500, **filters) -> Iterator[RegistryEntry]:
+        """Lazily yield every match, reading batch_size rows at a time.
+
+        No connection or lock is held between batches, so a slow consumer
+        never blocks writers; memory stays bounded by one batch.
+        """
+        key = None
+        while True:
+            rows, key = self.storage.page(after=key, limit=batch_size, **filters)
+            for data in rows:
+                yield self._dict_to_entry(data)
+            if key is None:
+                return
+
+    def text_search(
+        self,
+        query: str,
+        limit: int = 20,
+        prefix: bool = True,
+        raw: bool = False,
+        highlight: Tuple[str, str] = ("[", "]"),
+        **filters,
+    ) -> List[TextSearchHit]:
+        """Full-text search over name, description, tags and author.
+
+        Every word of ``query`` must match (as a prefix unless ``prefix`` is
+        False); pass ``raw=True`` to use FTS5 query syntax directly. Results
+        are BM25-ranked and accept the same filters as search().
+        """
+        match = query if raw else _fts_query(query, prefix=prefix)
+        if not match:
+            return []
+        start = time.time()
+        rows = self.storage.text_search(match, limit=limit, highlight=highlight, **filters)
+        self.stats['total_queries'] += 1
+        self.stats['avg_query_time'] = (
+            (self.stats['avg_query_time'] * (self.stats['total_queries'] - 1) + 
+             (time.time() - start)) / self.stats['total_queries']
+        )
+        return [
+            TextSearchHit(entry=self._dict_to_entry(data), score=score, snippet=snippet)
+            for data, score, snippet in rows
+        ]
     
     def update(self, entry: RegistryEntry) -> bool:
         """Update existing entry"""
@@ -606,9 +2849,19 @@ class HyperRegistry:
         
         self._run_hooks('before_update', entry)
         
-        entry.updated_at = datetime.now()
-        self.storage.save(entry)
-        self.cache[entry.id] = entry
+        # Only changed columns are written; an unchanged entry is a no-op
+        now = _utc_now()
+        try:
+            diff = self.storage.update(entry, now)
+        except sqlite3.IntegrityError:
+            raise ValueError(_duplicate_version_error(entry)) from None
+        if diff is None:
+            raise ValueError(f"Entry {entry.id} not found")
+        if diff:
+            entry.updated_at = now
+            self.cache[entry.id] = entry
+            if "dependencies" in diff:
+                self._index_dependencies(entry)
         
         self._run_hooks('after_update', entry)
         return True
@@ -622,29 +2875,145 @@ class HyperRegistry:
         self._run_hooks('before_delete', entry)
         
         result = self.storage.delete(entry_id)
-        if result and entry_id in self.cache:
-            del self.cache[entry_id]
+        if result:
+            self.cache[entry_id] = None
+            if self._graph is not None:
+                self._graph.remove(entry_id)
         
         self._run_hooks('after_delete', entry)
         return result
     
+    @property
+    def graph(self) -> DependencyGraph:
+        """Dependency index, loaded from storage on first use."""
+        self._sync_cache()
+        if self._graph is None:
+            self._graph = DependencyGraph(self.storage.dependency_edges())
+        return self._graph
+
+    def _index_dependencies(self, entry: RegistryEntry):
+        if self._graph is not None:
+            self._graph.set_dependencies(entry.id, entry.dependencies)
+    
     def resolve_dependencies(self, entry: RegistryEntry) -> List[RegistryEntry]:
-        """Resolve all dependencies for entry"""
-        resolved = []
-        for dep_id in entry.dependencies:
-            dep = self.get(dep_id)
-            if dep:
-                resolved.append(dep)
-                # Recursive resolution
-                resolved.extend(self.resolve_dependencies(dep))
-        return resolved
+        """Resolve all dependencies for entry, in install order
+
+        Each transitive dependency appears once, after its own dependencies;
+        ids that are not registered are skipped. Raises
+        DependencyCycleError if the dependencies form a cycle.
+        """
+        order = self.graph.topological_order(
+            [entry.id], overrides={entry.id: list(entry.dependencies)}
+        )
+        order.pop()  # The entry itself comes last
+        found = self.get_many(order)
+        return [found[dep_id] for dep_id in order if dep_id in found]
+
+    def dependency_closure(self, entry_id: str) -> Set[str]:
+        """Ids of every transitive dependency of a registered entry."""
+        return set(self.graph.closure(entry_id))
+
+    def find_cycle(self, entry_ids: Optional[Iterable[str]] = None) -> Optional[List[str]]:
+        """Path of a dependency cycle reachable from entry_ids (default: all)."""
+        return self.graph.find_cycle(entry_ids)
+
+    def topological_order(self, entry_ids: Iterable[str]) -> List[str]:
+        """Install plan for entry_ids: every id after its dependencies."""
+        return self.graph.topological_order(entry_ids)
+
+    def export_snapshot(self, path: str, compression: Optional[str] = None) -> int:
+        """Write a compressed binary snapshot; returns the entry count."""
+        return self.storage.export_snapshot(path, compression=compression)
+
+    def import_snapshot(self, path: str, chunk_size: int = 1000) -> SnapshotImportResult:
+        """Restore entries from a snapshot through register_many.
+
+        Records are decoded and registered ``chunk_size`` at a time, so the
+        import runs in constant memory. Entries keep their stored status
+        and timestamps and replace existing entries with the same id.
+        """
+        with open_snapshot(path) as (header, records):
+            result = SnapshotImportResult(header=header)
+            while True:
+                chunk = list(islice(records, chunk_size))
+                if not chunk:
+                    break
+                entries = []
+                for data in chunk:
+                    try:
+                        entries.append(self._dict_to_entry(data))
+                    except (KeyError, TypeError, ValueError) as exc:
+                        result.errors.setdefault(str(data.get("id")), []).append(
+                            f"Invalid record: {exc}"
+                        )
+                batch = self.register_many(entries, chunk_size=chunk_size, restore=True)
+                result.imported += len(batch.registered)
+                result.errors.update(batch.errors)
+        return result
+
+    def changes_since(self, seq: ChangePosition = 0, limit: int = 1000) -> List[ChangeRecord]:
+        """Changes with a sequence number greater than seq, oldest first.
+
+        Consumers remember the last seq they applied and pass it back to
+        receive only the delta, including writes made by other processes.
+        """
+        return [
+            ChangeRecord(
+                seq=row_seq,
+                entry_id=entry_id,
+                op=op,
+                changed_at=_from_epoch_us(changed_at),
+                entry=json.loads(data) if data else None,
+                diff=json.loads(diff) if diff else None,
+            )
+            for row_seq, entry_id, op, changed_at, data, diff in self.storage.changes_since(seq, limit)
+        ]
+
+    async def watch(
+        self, since: Optional[ChangePosition] = None, poll_interval: float = 1.0, batch_size: int = 500
+    ) -> AsyncIterator[ChangeRecord]:
+        """Yield changes as they are committed, starting after ``since``.
+
+        ``since`` defaults to the newest change, so only new writes are
+        seen. Writes through this registry wake the watcher immediately;
+        writes from other processes are picked up every poll_interval.
+        """
+        loop = asyncio.get_running_loop()
+        wakeup = asyncio.Event()
+        watcher = (loop, wakeup)
+        self._watchers.add(watcher)
+        try:
+            seq = since
+            if seq is None:
+                seq = await loop.run_in_executor(None, self.storage.last_change_seq)
+            while True:
+                wakeup.clear()
+                changes = await loop.run_in_executor(
+                    None, self.changes_since, seq, batch_size
+                )
+                for change in changes:
+                    seq = change.seq
+                    yield change
+                if len(changes) == batch_size:
+                    continue
+                try:
+                    await asyncio.wait_for(wakeup.wait(), poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._watchers.discard(watcher)
+
+    def _notify_watchers(self):
+        """Wake every watch() generator after a local commit (any thread)."""
+        for loop, wakeup in list(self._watchers):
+            try:
+                loop.call_soon_threadsafe(wakeup.set)
+            except RuntimeError:  # Loop already closed
+                self._watchers.discard((loop, wakeup))
     
     def _has_conflicts(self, entry: RegistryEntry) -> bool:
         """Check if entry conflicts with existing entries"""
-        for conflict_id in entry.conflicts:
-            if self.get(conflict_id):
-                return True
-        return False
+        return bool(entry.conflicts) and bool(self.get_many(entry.conflicts))
     
     def _dict_to_entry(self, data: Dict[str, Any]) -> RegistryEntry:
         """Convert dict to RegistryEntry"""
@@ -666,8 +3035,8 @@ class HyperRegistry:
             dependencies=data.get('dependencies', []),
             conflicts=data.get('conflicts', []),
             status=EntryStatus(data.get('status', 'registered')),
-            created_at=datetime.fromisoformat(data['created_at']),
-            updated_at=datetime.fromisoformat(data['updated_at']),
+            created_at=_as_datetime(data['created_at']),
+            updated_at=_as_datetime(data['updated_at']),
             gefs_score=gefs_score,
             config=data.get('config', {}),
             metadata=data.get('metadata', {})
@@ -688,9 +3057,30 @@ class HyperRegistry:
         return {
             **self.stats,
             'total_cached': len(self.cache),
+            'cache_hits': self.cache.hits,
+            'cache_misses': self.cache.misses,
+            'cached_queries': len(self.query_cache),
+            'version': self._version,
+            'slow_queries': len(self.storage.profiler.slow_log),
             'storage_count': self.storage.count()
         }
 
+    def explain(self, **filters) -> List[str]:
+        """Query plan of search(**filters); see StorageBackend.explain."""
+        return self.storage.explain(**filters)
+
+    def query_stats(self) -> Dict[str, Dict[str, float]]:
+        """Latency percentiles (ms) and call counts per SQL query shape."""
+        return self.storage.profiler.percentiles()
+
+    def slow_queries(self) -> List[SlowQuery]:
+        """Recent queries slower than the slow-query threshold, oldest first."""
+        return list(self.storage.profiler.slow_log)
+
+    def suggest_indexes(self, min_hits: int = 10, create: bool = False) -> List[IndexSuggestion]:
+        """Composite index advice from observed filters; see StorageBackend."""
+        return self.storage.suggest_indexes(min_hits=min_hits, create=create)
+
     def register_subregistry(
         self,
         name: str,
@@ -787,6 +3177,128 @@ class HyperRegistry:
         return entry
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# ⚡ ASYNC FACADE - EVENT-LOOP FRIENDLY REGISTRY ACCESS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class AsyncHyperRegistry:
+    """Asyncio facade running HyperRegistry calls on a bounded executor
+
+    Every call runs on a dedicated thread pool of ``max_workers`` threads,
+    so SQLite I/O never blocks the event loop and at most that many
+    registry calls are in flight. ``get`` calls made in the same loop
+    iteration are coalesced into one get_many (a single WHERE id IN query
+    for the cache misses).
+    """
+
+    def __init__(self, registry: Optional[HyperRegistry] = None,
+                 storage_path: Optional[str] = None, max_workers: int = 4, **kwargs):
+        self.registry = registry or HyperRegistry(storage_path, **kwargs)
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="hyper-registry"
+        )
+        # Per event loop: entry_id -> future of the get batch being collected
+        self._pending_gets: Dict[asyncio.AbstractEventLoop, Dict[str, asyncio.Future]] = {}
+
+    async def _run(self, func: Callable, *args, **kwargs) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def register(self, entry: RegistryEntry) -> bool:
+        """Register new entry"""
+        return await self._run(self.registry.register, entry)
+
+    async def register_many(
+        self, entries: Iterable[RegistryEntry], chunk_size: int = 500
+    ) -> BulkRegisterResult:
+        """Register many entries in chunked transactions"""
+        return await self._run(self.registry.register_many, list(entries), chunk_size)
+
+    async def get(self, entry_id: str) -> Optional[RegistryEntry]:
+        """Get entry by ID, batched with other gets from the same tick"""
+        loop = asyncio.get_running_loop()
+        pending = self._pending_gets.get(loop)
+        if pending is None:
+            pending = self._pending_gets[loop] = {}
+            loop.call_soon(self._flush_gets, loop)
+        future = pending.get(entry_id)
+        if future is None:
+            future = pending[entry_id] = loop.create_future()
+        # Shielded so one cancelled caller doesn't cancel the shared lookup
+        return await asyncio.shield(future)
+
+    def _flush_gets(self, loop: asyncio.AbstractEventLoop):
+        """Resolve the collected gets with one get_many on the executor."""
+        pending = self._pending_gets.pop(loop, {})
+        if not pending:
+            return
+
+        def resolve(batch: "asyncio.Future[Dict[str, RegistryEntry]]"):
+            error = None if batch.cancelled() else batch.exception()
+            for entry_id, future in pending.items():
+                if future.done():
+                    continue
+                if batch.cancelled():
+                    future.cancel()
+                elif error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(batch.result().get(entry_id))
+
+        batch = loop.run_in_executor(self.executor, self.registry.get_many, list(pending))
+        batch.add_done_callback(resolve)
+
+    async def get_many(self, entry_ids: Iterable[str]) -> Dict[str, RegistryEntry]:
+        """Get several entries with one query for the cache misses"""
+        return await self._run(self.registry.get_many, list(entry_ids))
+
+    async def search(self, **filters) -> List[RegistryEntry]:
+        """Search entries"""
+        return await self._run(self.registry.search, **filters)
+
+    async def search_iter(
+        self, batch_size: int = 500, **filters
+    ) -> AsyncIterator[RegistryEntry]:
+        """Lazily yield every match, fetching batch_size rows per executor call."""
+        def fetch(after):
+            rows, key = self.registry.storage.page(after=after, limit=batch_size, **filters)
+            return [self.registry._dict_to_entry(data) for data in rows], key
+
+        key = None
+        while True:
+            entries, key = await self._run(fetch, key)
+            for entry in entries:
+                yield entry
+            if key is None:
+                return
+
+    async def update(self, entry: RegistryEntry) -> bool:
+        """Update existing entry"""
+        return await self._run(self.registry.update, entry)
+
+    async def delete(self, entry_id: str) -> bool:
+        """Delete entry"""
+        return await self._run(self.registry.delete, entry_id)
+
+    def watch(self, *args, **kwargs) -> AsyncIterator[ChangeRecord]:
+        """Change feed; see HyperRegistry.watch"""
+        return self.registry.watch(*args, **kwargs)
+
+    async def close(self):
+        """Wait for in-flight calls, then stop the executor."""
+        await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(self.executor.shutdown, wait=True)
+        )
+
+    async def __aenter__(self) -> "AsyncHyperRegistry":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # 🧪 DEMO & TESTING
 # ═══════════════════════════════════════════════════════════════════════════════
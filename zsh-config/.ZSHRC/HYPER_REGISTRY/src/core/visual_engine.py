@@ -240,6 +240,8 @@ class ParticleSystem:
         self.particles: List[Particle] = []
         self.max_particles = max_particles
         self.emitters: List[Dict] = []
+        self._grid: List[List[str]] = []
+        self._grid_shape: Tuple[int, int] = (0, 0)
     
     def emit(self, x: float, y: float, count: int = 10, 
              char: str = '✨', color: str = '\033[96m'):
@@ -262,9 +264,20 @@ class ParticleSystem:
         """Update all particles"""
         self.particles = [p for p in self.particles if p.update(dt)]
     
+    def _blank_grid(self, width: int, height: int) -> List[List[str]]:
+        """Reuse the previous frame's grid, wiped in place, when the shape matches"""
+        if self._grid_shape != (width, height):
+            self._grid = [[' '] * width for _ in range(height)]
+            self._grid_shape = (width, height)
+        else:
+            blank = [' '] * width
+            for row in self._grid:
+                row[:] = blank
+        return self._grid
+    
     def render(self, width: int, height: int) -> str:
         """Render particle field to string"""
-        grid = [[' ' for _ in range(width)] for _ in range(height)]
+        grid = self._blank_grid(width, height)
         for p in self.particles:
             x, y = int(p.x), int(p.y)
             if 0 <= x < width and 0 <= y < height:
@@ -0,0 +1,37 @@
+"""Shared fixtures for the registry tests.
+
+Importing this module puts the HYPER_REGISTRY root on sys.path, so test
+modules import it before anything from ``src``.
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from src.core.registry_engine import EntryType, RegistryEntry
+
+
+def entry_factory(kind: EntryType, namespace: str, prefix: str = "", digits: int = 0):
+    """Build a ``make_entry(index, namespace=..., **fields)`` for one test module.
+
+    Entries get the id ``<prefix>-<index>`` (zero-padded to ``digits``),
+    the name ``<Prefix> <index>`` and version 1.0.0; ``prefix`` defaults
+    to the entry type. Any RegistryEntry field can be overridden.
+    """
+    prefix = prefix or kind.value
+
+    def make_entry(index: int, namespace: str = namespace, **fields) -> RegistryEntry:
+        values = dict(
+            id=f"{prefix}-{index:0{digits}d}",
+            name=f"{prefix.title()} {index}",
+            type=kind,
+            namespace=namespace,
+            version="1.0.0",
+        )
+        values.update(fields)
+        return RegistryEntry(**values)
+
+    return make_entry
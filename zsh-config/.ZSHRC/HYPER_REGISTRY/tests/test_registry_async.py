@@ -0,0 +1,99 @@
+import asyncio
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from registry_helpers import entry_factory
+from src.core.registry_engine import (
+    AsyncHyperRegistry,
+    EntryType,
+    HyperRegistry,
+)
+
+
+make_entry = entry_factory(EntryType.COMPONENT, "async.ns", prefix="widget")
+
+
+class AsyncRegistryTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.registry = HyperRegistry(str(Path(self.tmp.name) / "registry.db"))
+
+    def tearDown(self):
+        self.registry.storage.close()
+        self.tmp.cleanup()
+
+    def run_async(self, coro_fn):
+        async def main():
+            async with AsyncHyperRegistry(self.registry, max_workers=2) as facade:
+                return await coro_fn(facade)
+        return asyncio.run(main())
+
+    def test_register_get_search_off_the_loop(self):
+        threads = set()
+        self.registry.add_hook(
+            "before_register", lambda entry: threads.add(threading.current_thread().name)
+        )
+
+        async def scenario(facade):
+            await facade.register(make_entry(1))
+            await facade.register_many([make_entry(2), make_entry(3, "other.ns")])
+            entry = await facade.get("widget-1")
+            found = await facade.search(namespace="async.ns")
+            return entry, found
+
+        entry, found = self.run_async(scenario)
+        self.assertEqual(entry.id, "widget-1")
+        self.assertEqual({e.id for e in found}, {"widget-1", "widget-2"})
+        self.assertTrue(all(name.startswith("hyper-registry") for name in threads))
+
+    def test_same_tick_gets_share_one_query(self):
+        self.registry.register_many([make_entry(i) for i in range(5)])
+        self.registry.cache.clear()
+        calls = []
+        load_many = self.registry.storage.load_many
+
+        def counting_load_many(entry_ids, *args, **kwargs):
+            calls.append(list(entry_ids))
+            return load_many(entry_ids, *args, **kwargs)
+
+        self.registry.storage.load_many = counting_load_many
+
+        async def scenario(facade):
+            ids = ["widget-0", "widget-3", "widget-3", "missing", "widget-4"]
+            return await asyncio.gather(*(facade.get(entry_id) for entry_id in ids))
+
+        results = self.run_async(scenario)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(sorted(calls[0]), ["missing", "widget-0", "widget-3", "widget-4"])
+        self.assertEqual(
+            [e.id if e else None for e in results],
+            ["widget-0", "widget-3", "widget-3", None, "widget-4"],
+        )
+
+    def test_cancelled_get_does_not_cancel_batch(self):
+        self.registry.register(make_entry(1))
+        self.registry.cache.clear()
+
+        async def scenario(facade):
+            doomed = asyncio.ensure_future(facade.get("widget-1"))
+            survivor = asyncio.ensure_future(facade.get("widget-1"))
+            await asyncio.sleep(0)
+            doomed.cancel()
+            return await survivor
+
+        self.assertEqual(self.run_async(scenario).id, "widget-1")
+
+    def test_search_iter_streams_batches(self):
+        self.registry.register_many([make_entry(i) for i in range(7)])
+
+        async def scenario(facade):
+            return [entry.id async for entry in facade.search_iter(batch_size=3)]
+
+        ids = self.run_async(scenario)
+        self.assertEqual(sorted(ids), sorted(f"widget-{i}" for i in range(7)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+
+from registry_helpers import entry_factory
+from src.core.registry_engine import EntryType, HyperRegistry
+
+
+_make_component = entry_factory(EntryType.COMPONENT, "bulk.ns")
+
+
+def make_entry(index, **overrides):
+    overrides.setdefault("config", {"facets": {"tier": "core" if index % 2 else "edge"}})
+    return _make_component(index, **overrides)
+
+
+class RegisterManyTests(unittest.TestCase):
+    def setUp(self):
+        self.registry = HyperRegistry()
+
+    def test_registers_all_entries_across_chunks(self):
+        result = self.registry.register_many(
+            [make_entry(i) for i in range(25)], chunk_size=10
+        )
+
+        self.assertTrue(result.ok)
+        self.assertEqual(len(result.registered), 25)
+        self.assertEqual(self.registry.storage.count(), 25)
+        self.assertEqual(len(self.registry.search(facets={"tier": "core"})), 12)
+
+    def test_invalid_entries_are_reported_without_aborting_batch(self):
+        self.registry.register(make_entry(100))
+        entries = [
+            make_entry(1),
+            make_entry(2, name=""),
+            make_entry(3, conflicts=["component-100"]),
+            make_entry(1, name="Duplicate"),
+            make_entry(4),
+        ]
+
+        result = self.registry.register_many(entries)
+
+        self.assertEqual(result.registered, ["component-1", "component-4"])
+        self.assertIn("Entry name is required", result.errors["component-2"])
+        self.assertIn("Entry conflicts with existing entries", result.errors["component-3"])
+        self.assertIn("Duplicate entry ID in batch", result.errors["component-1"])
+        self.assertIsNone(self.registry.storage.load("component-3"))
+
+    def test_hooks_fire_after_batch_is_written(self):
+        seen_counts = []
+        batches = []
+        self.registry.add_hook(
+            "after_register", lambda entry: seen_counts.append(self.registry.storage.count())
+        )
+        self.registry.add_hook("after_register_batch", batches.append)
+
+        self.registry.register_many([make_entry(i) for i in range(3)])
+
+        self.assertEqual(seen_counts, [3, 3, 3])
+        self.assertEqual([[e.id for e in batch] for batch in batches],
+                         [["component-0", "component-1", "component-2"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
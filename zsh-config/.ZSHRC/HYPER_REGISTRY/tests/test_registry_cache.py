@@ -0,0 +1,111 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from registry_helpers import entry_factory
+from src.core.registry_engine import EntryStatus, EntryType, HyperRegistry
+
+
+make_entry = entry_factory(EntryType.RESOURCE, "cache.ns")
+
+
+class EntryCacheTests(unittest.TestCase):
+    def test_entry_cache_is_bounded(self):
+        registry = HyperRegistry(cache_size=3)
+        registry.register_many([make_entry(i) for i in range(10)])
+        for i in range(10):
+            registry.get(f"resource-{i}")
+        self.assertEqual(len(registry.cache), 3)
+
+    def test_search_results_are_cached_until_a_write(self):
+        registry = HyperRegistry()
+        registry.register(make_entry(1))
+        first = registry.search(namespace="cache.ns", type=EntryType.RESOURCE)
+        queries = registry.stats["total_queries"]
+
+        again = registry.search(type="resource", namespace="cache.ns")
+        self.assertEqual([e.id for e in again], [e.id for e in first])
+        self.assertEqual(registry.stats["total_queries"], queries)
+
+        registry.register(make_entry(2))
+        after_write = registry.search(namespace="cache.ns")
+        self.assertEqual(len(after_write), 2)
+
+    def test_mutating_cached_results_leaves_the_cache_intact(self):
+        registry = HyperRegistry()
+        entry = make_entry(1)
+        entry.tags = ["core"]
+        entry.metadata = {"owner": "ops"}
+        registry.register(entry)
+
+        found = registry.search(namespace="cache.ns")[0]
+        found.tags.append("changed")
+        found.metadata["owner"] = "nobody"
+        found.name = "Changed"
+        again = registry.search(namespace="cache.ns")[0]
+        self.assertIsNot(again, found)
+        self.assertEqual((again.name, again.tags, again.metadata), ("Resource 1", ["core"], {"owner": "ops"}))
+
+        row = registry.select(["id", "tags"], namespace="cache.ns")[0]
+        row["tags"].append("changed")
+        row["id"] = "other"
+        self.assertEqual(registry.select(["id", "tags"], namespace="cache.ns"), [{"id": "resource-1", "tags": ["core"]}])
+
+        fields, _ = registry.top_k(k=1, fields=("id", "tags"))[0]
+        fields["tags"].append("changed")
+        self.assertEqual(registry.top_k(k=1, fields=("id", "tags"))[0][0], {"id": "resource-1", "tags": ["core"]})
+
+    def test_missing_ids_are_remembered(self):
+        registry = HyperRegistry()
+        self.assertIsNone(registry.get("resource-404"))
+        queries = registry.stats["total_queries"]
+        self.assertIsNone(registry.get("resource-404"))
+        self.assertEqual(registry.stats["total_queries"], queries)
+
+        registry.register(make_entry(404))
+        self.assertIsNotNone(registry.get("resource-404"))
+
+
+class CrossProcessCoherenceTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        path = str(Path(self.tmp.name) / "shared.db")
+        self.writer = HyperRegistry(path)
+        self.reader = HyperRegistry(path)
+
+    def tearDown(self):
+        self.writer.storage.close()
+        self.reader.storage.close()
+        self.tmp.cleanup()
+
+    def test_other_writers_invalidate_cached_entries_and_queries(self):
+        self.writer.register(make_entry(1))
+        self.assertEqual(self.reader.get("resource-1").status, EntryStatus.REGISTERED)
+        self.assertEqual(len(self.reader.search(namespace="cache.ns")), 1)
+
+        entry = self.writer.get("resource-1")
+        entry.status = EntryStatus.ACTIVE
+        self.writer.update(entry)
+        self.writer.register(make_entry(2))
+
+        self.assertEqual(self.reader.get("resource-1").status, EntryStatus.ACTIVE)
+        self.assertEqual(len(self.reader.search(namespace="cache.ns")), 2)
+
+    def test_cached_reads_skip_the_version_query(self):
+        self.writer.register(make_entry(1))
+        self.reader.get("resource-1")
+        self.reader.search(namespace="cache.ns")
+        with mock.patch.object(self.reader.storage, "version", wraps=self.reader.storage.version) as version:
+            for _ in range(5):
+                self.reader.get("resource-1")
+                self.reader.search(namespace="cache.ns")
+            self.assertEqual(version.call_count, 0)
+
+            self.writer.register(make_entry(2))
+            self.assertEqual(len(self.reader.search(namespace="cache.ns")), 2)
+            self.assertEqual(version.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import asyncio
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from registry_helpers import entry_factory
+from src.core.registry_engine import (
+    CHANGE_DELETE,
+    CHANGE_UPSERT,
+    EntryStatus,
+    EntryType,
+    HyperRegistry,
+)
+
+
+make_entry = entry_factory(EntryType.LAYOUT, "changes.ns")
+
+
+class ChangeLogTests(unittest.TestCase):
+    def setUp(self):
+        self.registry = HyperRegistry()
+
+    def test_changes_since_returns_ordered_deltas(self):
+        self.registry.register_many([make_entry(1), make_entry(2)])
+        entry = self.registry.get("layout-1")
+        entry.status = EntryStatus.ACTIVE
+        self.registry.update(entry)
+        self.registry.delete("layout-2")
+
+        changes = self.registry.changes_since(0)
+        self.assertEqual(
+            [(c.entry_id, c.op) for c in changes],
+            [("layout-1", CHANGE_UPSERT), ("layout-2", CHANGE_UPSERT),
+             ("layout-1", CHANGE_UPSERT), ("layout-2", CHANGE_DELETE)],
+        )
+        self.assertEqual(changes[2].entry["status"], "active")
+        self.assertIsNone(changes[3].entry)
+
+        tail = self.registry.changes_since(changes[1].seq)
+        self.assertEqual([c.seq for c in tail], [changes[2].seq, changes[3].seq])
+
+    def test_deleting_a_missing_id_commits_nothing(self):
+        self.registry.register(make_entry(1))
+        version = self.registry.storage.version()
+        position = self.registry.storage.last_change_seq()
+
+        self.assertFalse(self.registry.storage.delete("layout-404"))
+        self.assertEqual(self.registry.storage.version(), version)
+        self.assertEqual(self.registry.changes_since(position), [])
+
+        sharded = HyperRegistry(shards=3)
+        sharded.register(make_entry(1))
+        sharded.register(make_entry(2, namespace="other.ns"))
+        cached = sharded.get("layout-2")
+        versions = [shard.version() for shard in sharded.storage.shards]
+        self.assertTrue(sharded.delete("layout-1"))
+        changed = [
+            shard.version() - before for shard, before in zip(sharded.storage.shards, versions)
+        ]
+        self.assertEqual(sorted(changed), [0, 0, 1])
+        self.assertIs(sharded.get("layout-2"), cached)
+        sharded.storage.close()
+
+    def test_watch_yields_new_local_writes(self):
+        self.registry.register(make_entry(0))
+
+        async def consume():
+            seen = []
+            watcher = self.registry.watch(poll_interval=5.0)
+            writer = threading.Timer(0.05, self.registry.register, args=(make_entry(1),))
+            writer.start()
+            async for change in watcher:
+                seen.append(change.entry_id)
+                break
+            await watcher.aclose()
+            return seen
+
+        seen = asyncio.run(asyncio.wait_for(consume(), timeout=2.0))
+        self.assertEqual(seen, ["layout-1"])
+        self.assertEqual(self.registry._watchers, set())
+
+    def test_watch_polls_writes_from_other_connections(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / "changes.db")
+            consumer = HyperRegistry(path)
+            producer = HyperRegistry(path)
+
+            async def consume():
+                watcher = consumer.watch(since=0, poll_interval=0.02)
+                producer.register(make_entry(9))
+                change = await watcher.__anext__()
+                await watcher.aclose()
+                return change
+
+            try:
+                change = asyncio.run(asyncio.wait_for(consume(), timeout=2.0))
+            finally:
+                consumer.storage.close()
+                producer.storage.close()
+            self.assertEqual((change.entry_id, change.op), ("layout-9", CHANGE_UPSERT))
+
+
+if __name__ == "__main__":
+    unittest.main()
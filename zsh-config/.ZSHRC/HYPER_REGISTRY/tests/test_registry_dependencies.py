@@ -0,0 +1,92 @@
+import sys
+import time
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT))
+
+from src.core.registry_engine import (
+    DependencyCycleError,
+    EntryType,
+    HyperRegistry,
+    RegistryEntry,
+)
+
+
+def make_entry(entry_id, dependencies=(), conflicts=()):
+    return RegistryEntry(
+        id=entry_id,
+        name=entry_id.title(),
+        type=EntryType.MODULE,
+        namespace="deps.ns",
+        version="1.0.0",
+        dependencies=list(dependencies),
+        conflicts=list(conflicts),
+    )
+
+
+class DependencyResolutionTests(unittest.TestCase):
+    def setUp(self):
+        self.registry = HyperRegistry()
+        # app -> (ui, api); ui -> core; api -> core; core -> (nothing)
+        self.registry.register_many([
+            make_entry("core"),
+            make_entry("ui", ["core"]),
+            make_entry("api", ["core", "missing"]),
+            make_entry("app", ["ui", "api"]),
+        ])
+
+    def test_shared_dependencies_resolve_once_in_install_order(self):
+        resolved = [e.id for e in self.registry.resolve_dependencies(self.registry.get("app"))]
+        self.assertEqual(resolved, ["core", "ui", "api"])
+        self.assertEqual(self.registry.topological_order(["app"]),
+                         ["core", "ui", "missing", "api", "app"])
+
+    def test_closure_follows_updates_and_deletes(self):
+        self.assertEqual(self.registry.dependency_closure("app"),
+                         {"ui", "api", "core", "missing"})
+
+        self.registry.register(make_entry("log"))
+        core = self.registry.get("core")
+        core.dependencies = ["log"]
+        self.registry.update(core)
+        self.assertIn("log", self.registry.dependency_closure("app"))
+
+        self.registry.delete("core")
+        self.assertEqual(self.registry.dependency_closure("ui"), {"core"})
+
+    def test_cycles_are_reported_with_their_path(self):
+        core = self.registry.get("core")
+        core.dependencies = ["app"]
+        self.registry.update(core)
+
+        cycle = self.registry.find_cycle(["app"])
+        self.assertEqual(cycle[0], cycle[-1])
+        self.assertEqual(set(cycle), {"app", "ui", "core"})
+        with self.assertRaises(DependencyCycleError) as ctx:
+            self.registry.resolve_dependencies(self.registry.get("ui"))
+        self.assertEqual(ctx.exception.cycle[0], ctx.exception.cycle[-1])
+
+    def test_conflicts_are_checked_in_one_lookup(self):
+        with self.assertRaises(ValueError):
+            self.registry.register(make_entry("alt", conflicts=["nope", "core"]))
+        self.registry.register(make_entry("alt2", conflicts=["nope"]))
+
+    def test_large_chain_resolves_quickly(self):
+        registry = HyperRegistry()
+        registry.register_many(
+            [make_entry(f"n{i}", [f"n{i + 1}"] if i < 9999 else []) for i in range(10000)]
+        )
+        start = time.perf_counter()
+        order = registry.topological_order(["n0"])
+        closure = registry.dependency_closure("n0")
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(order[0], "n9999")
+        self.assertEqual(len(closure), 9999)
+        self.assertLess(elapsed, 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+
+from registry_helpers import entry_factory
+from src.core.registry_engine import (
+    EntryType,
+    FeatureFlag,
+    FeatureLayer,
+    HyperRegistry,
+)
+
+
+_make_plugin = entry_factory(EntryType.PLUGIN, "counts.ns")
+
+
+def make_entry(index, tier, region, namespace="counts.ns"):
+    return _make_plugin(index, namespace, config={"facets": {"tier": tier, "region": region}})
+
+
+class FacetCountTests(unittest.TestCase):
+    def setUp(self):
+        self.registry = HyperRegistry()
+        self.registry.register_many([
+            make_entry(1, "gold", ["eu", "us"]),
+            make_entry(2, "gold", "eu"),
+            make_entry(3, "silver", "us"),
+            make_entry(4, "silver", "us", namespace="other.ns"),
+        ])
+
+    def test_counts_per_value_ordered_by_frequency(self):
+        counts = self.registry.facet_counts(["tier", "region", "absent"])
+
+        self.assertEqual(counts["tier"], {"gold": 2, "silver": 2})
+        self.assertEqual(list(counts["region"].items()), [("us", 3), ("eu", 2)])
+        self.assertEqual(counts["absent"], {})
+
+    def test_counts_respect_filters(self):
+        counts = self.registry.facet_counts(
+            ["tier", "region"], namespace="counts.ns", facets={"region": "us"}
+        )
+        self.assertEqual(counts, {"tier": {"gold": 1, "silver": 1},
+                                  "region": {"us": 2, "eu": 1}})
+
+    def test_feature_layer_facets_are_counted_once_per_entry(self):
+        self.registry.register_feature_layer(FeatureLayer(
+            id="layer", name="Layer", namespace="layers.ns",
+            features=[FeatureFlag(id="f", name="F", category="quality", tags=["perf"])],
+        ))
+        counts = self.registry.facet_counts(namespace="layers.ns")
+        self.assertEqual(counts["categories"], {"quality": 1})
+        self.assertEqual(counts["maturity"], {"ga": 1})
+
+    def test_cached_counts_refresh_after_writes(self):
+        self.assertEqual(self.registry.facet_counts(["tier"])["tier"]["gold"], 2)
+        self.registry.register(make_entry(5, "gold", "apac"))
+        self.assertEqual(self.registry.facet_counts(["tier"])["tier"]["gold"], 3)
+        self.registry.delete("plugin-1")
+        self.assertEqual(self.registry.facet_counts(["tier"])["tier"]["gold"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
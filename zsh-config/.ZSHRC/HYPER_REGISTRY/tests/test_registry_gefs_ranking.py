@@ -0,0 +1,123 @@
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from registry_helpers import entry_factory
+from src.core import registry_engine
+from src.core.registry_engine import (
+    GEFS_COLUMNS,
+    EntryType,
+    GEFSScore,
+    HyperRegistry,
+    gefs_batch_scores,
+)
+
+
+_make_service = entry_factory(EntryType.SERVICE, "rank.ns", digits=2)
+
+
+def make_entry(index, namespace="rank.ns"):
+    return _make_service(
+        index,
+        namespace,
+        gefs_score=GEFSScore(
+            quality=index * 3 % 100,
+            reliability=(index * 7) % 100,
+            performance=50,
+            security=100 - index,
+            compatibility=index % 5,
+            documentation=(index * 11) % 100,
+        ),
+    )
+
+
+class GEFSRankingTests(unittest.TestCase):
+    def setUp(self):
+        self.registry = HyperRegistry()
+        self.entries = [make_entry(i) for i in range(30)]
+        self.entries.append(make_entry(99, namespace="other.ns"))
+        self.registry.register_many(self.entries)
+
+    def expected(self, key, k, entries=None):
+        ranked = sorted(entries or self.entries, key=lambda e: (-key(e), e.id))
+        return [entry.id for entry in ranked[:k]]
+
+    def test_default_weights_rank_by_overall(self):
+        hits = self.registry.top_k(k=5)
+        self.assertEqual(
+            [row["id"] for row, _ in hits],
+            self.expected(lambda e: e.gefs_score.overall, 5),
+        )
+        row, score = hits[0]
+        self.assertEqual(set(row), {"id", "namespace", "name", "type", "version"})
+        self.assertAlmostEqual(score, self.registry.get(row["id"]).gefs_score.overall)
+
+    def test_custom_weights_and_filters(self):
+        hits = self.registry.top_k({"security": 1.0}, k=3, fields=["id"], namespace="rank.ns")
+        in_namespace = [e for e in self.entries if e.namespace == "rank.ns"]
+        self.assertEqual(
+            [row["id"] for row, _ in hits],
+            self.expected(lambda e: e.gefs_score.security, 3, in_namespace),
+        )
+        self.assertEqual([score for _, score in hits], [100.0, 99.0, 98.0])
+
+    def test_sql_and_batch_paths_agree(self):
+        weights = [0.0, 1.0, 0.0, 0.0, 2.0, 0.5]
+        ranked = self.registry.top_k(weights, k=10)
+        with mock.patch.object(registry_engine, "np", None):
+            fallback = HyperRegistry.top_k(self.registry, weights, k=10)
+        self.assertEqual([r["id"] for r, _ in ranked], [r["id"] for r, _ in fallback])
+        for (_, a), (_, b) in zip(ranked, fallback):
+            self.assertAlmostEqual(a, b)
+
+    def test_rescoring_after_write(self):
+        self.registry.top_k({"performance": 1.0}, k=1)
+        boosted = make_entry(5)
+        boosted.gefs_score.performance = 100
+        self.registry.update(boosted)
+        row, score = self.registry.top_k({"performance": 1.0}, k=1)[0]
+        self.assertEqual((row["id"], score), ("service-05", 100.0))
+
+    def test_batch_scorer_matches_overall(self):
+        vectors = [entry.gefs_score.vector() for entry in self.entries]
+        scores = list(gefs_batch_scores(vectors))
+        with mock.patch.object(registry_engine, "np", None):
+            fallback = gefs_batch_scores(vectors)
+        for entry, score, plain in zip(self.entries, scores, fallback):
+            self.assertAlmostEqual(score, entry.gefs_score.overall)
+            self.assertAlmostEqual(plain, entry.gefs_score.overall)
+
+    def test_invalid_weights_rejected(self):
+        with self.assertRaises(ValueError):
+            self.registry.top_k({"speed": 1.0})
+        with self.assertRaises(ValueError):
+            self.registry.top_k([1.0, 2.0])
+        with self.assertRaises(ValueError):
+            self.registry.top_k(fields=["nope"])
+
+
+class GEFSColumnMigrationTests(unittest.TestCase):
+    def test_missing_columns_are_added_and_backfilled(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / "registry.db")
+            registry = HyperRegistry(path)
+            registry.register(make_entry(7))
+            registry.storage.close()
+
+            conn = sqlite3.connect(path)
+            for name in GEFS_COLUMNS:
+                conn.execute(f"ALTER TABLE registry DROP COLUMN {name}")
+            conn.commit()
+            conn.close()
+
+            registry = HyperRegistry(path)
+            row = registry.storage.select(["gefs_quality", "gefs_security"])[0]
+            self.assertEqual(row, {"gefs_quality": 21.0, "gefs_security": 93.0})
+            self.assertEqual(registry.top_k({"security": 1.0}, k=1)[0][1], 93.0)
+            registry.storage.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
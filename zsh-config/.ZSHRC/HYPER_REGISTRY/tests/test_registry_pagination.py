@@ -0,0 +1,47 @@
+import unittest
+from datetime import datetime
+
+from registry_helpers import entry_factory
+from src.core.registry_engine import EntryType, HyperRegistry
+
+make_entry = entry_factory(EntryType.MODULE, "paging.ns", digits=2)
+
+
+class PaginationTests(unittest.TestCase):
+    def setUp(self):
+        self.registry = HyperRegistry()
+        entries = [
+            make_entry(i, type=EntryType.MODULE if i % 3 else EntryType.THEME)
+            for i in range(23)
+        ]
+        self.registry.register_many(entries)
+        # Share timestamps so ordering has to fall back to the id
+        stamp = int(datetime(2024, 1, 1).timestamp() * 1_000_000)
+        self.registry.storage.conn.execute("UPDATE registry SET updated_at = ?", (stamp,))
+        self.registry.storage.conn.commit()
+
+    def test_pages_cover_every_entry_once_in_order(self):
+        seen = []
+        token = None
+        pages = 0
+        while True:
+            entries, token = self.registry.search_page(after=token, limit=5)
+            seen.extend(entry.id for entry in entries)
+            pages += 1
+            if token is None:
+                break
+
+        self.assertEqual(pages, 5)
+        self.assertEqual(seen, [f"module-{i:02d}" for i in range(23)])
+
+    def test_search_iter_streams_filtered_results(self):
+        ids = [entry.id for entry in self.registry.search_iter(batch_size=2, type=EntryType.THEME)]
+        self.assertEqual(ids, [f"module-{i:02d}" for i in range(0, 23, 3)])
+
+    def test_invalid_token_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.registry.search_page(after="not-a-token")
+
+
+if __name__ == "__main__":
+    unittest.main()
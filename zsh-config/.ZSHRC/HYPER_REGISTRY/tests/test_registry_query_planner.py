@@ -0,0 +1,104 @@
+import unittest
+from datetime import timezone
+
+from registry_helpers import entry_factory
+from src.core.registry_engine import (
+    EntryStatus,
+    EntryType,
+    HyperRegistry,
+    normalize_sql,
+)
+
+
+_make_plugin = entry_factory(EntryType.PLUGIN, "planner.ns0")
+
+
+def make_entry(index):
+    return _make_plugin(
+        index,
+        f"planner.ns{index % 3}",
+        type=EntryType.PLUGIN if index % 2 else EntryType.THEME,
+    )
+
+
+class QueryPlannerTests(unittest.TestCase):
+    def setUp(self):
+        self.registry = HyperRegistry()
+        self.registry.register_many([make_entry(i) for i in range(12)])
+
+    def test_normalize_sql_folds_in_lists(self):
+        self.assertEqual(
+            normalize_sql("SELECT id FROM registry\n  WHERE id IN (?, ?,?)"),
+            "SELECT id FROM registry WHERE id IN (?...)",
+        )
+
+    def test_query_stats_group_by_shape(self):
+        for namespace in ("planner.ns0", "planner.ns1", "planner.ns2"):
+            self.registry.search(namespace=namespace)
+        self.registry.get_many(["plugin-1", "plugin-2"])
+
+        stats = self.registry.query_stats()
+        search_shapes = [s for s in stats if "r.namespace = ?" in s and "COUNT" not in s]
+        self.assertEqual(len(search_shapes), 1)
+        summary = stats[search_shapes[0]]
+        self.assertEqual(summary["count"], 3)
+        self.assertLessEqual(summary["p50"], summary["p95"])
+        self.assertLessEqual(summary["p99"], summary["max"])
+
+    def test_slow_query_log_records_shape_and_params(self):
+        self.registry.storage.profiler.threshold = 0.0
+        with self.assertLogs("hyper_registry", level="WARNING"):
+            self.registry.search(namespace="planner.ns1", type=EntryType.PLUGIN)
+        slow = self.registry.slow_queries()[-1]
+        self.assertIn("r.type = ?", slow.shape)
+        self.assertEqual(slow.params, ("planner.ns1", "plugin"))
+        self.assertEqual(slow.at.tzinfo, timezone.utc)
+        self.assertGreaterEqual(self.registry.get_stats()["slow_queries"], 1)
+
+    def test_explain_reports_index_use(self):
+        plan = "\n".join(self.registry.explain(namespace="planner.ns1"))
+        self.assertIn("USING INDEX", plan)
+        facet_plan = self.registry.explain(facets={"layer": "core"})
+        self.assertTrue(any(line.startswith("  ") for line in facet_plan))
+
+    def test_explain_plans_the_sql_that_select_runs(self):
+        statements = []
+        self.registry.storage.conn.set_trace_callback(statements.append)
+        self.registry.storage.select(["id", "name"], type=EntryType.PLUGIN)
+        self.registry.storage.conn.set_trace_callback(None)
+        ran, = [sql for sql in statements if sql.startswith("SELECT")]
+        self.assertNotIn("ORDER BY", ran)
+        self.assertEqual(
+            self.registry.storage.explain(["id", "name"], type=EntryType.PLUGIN),
+            [row[3] for row in self.registry.storage.conn.execute(f"EXPLAIN QUERY PLAN {ran}")],
+        )
+
+        sharded = HyperRegistry(shards=3)
+        self.assertIn("USE TEMP B-TREE FOR ORDER BY", sharded.explain(type=EntryType.PLUGIN))
+        self.assertNotIn("USE TEMP B-TREE FOR ORDER BY", sharded.explain(namespace="planner.ns1"))
+        sharded.storage.close()
+
+    def test_advisor_suggests_and_creates_composite_index(self):
+        for _ in range(3):
+            self.registry.storage.search(
+                namespace="planner.ns1", type=EntryType.PLUGIN, status=EntryStatus.REGISTERED
+            )
+            self.registry.storage.count(namespace="planner.ns1")
+
+        suggestions = self.registry.suggest_indexes(min_hits=3)
+        self.assertEqual(len(suggestions), 1)
+        self.assertEqual(set(suggestions[0].columns), {"namespace", "type", "status"})
+        self.assertEqual(suggestions[0].columns[0], "namespace")  # most distinct values
+        self.assertEqual(suggestions[0].hits, 3)
+        self.assertEqual(self.registry.suggest_indexes(min_hits=4), [])
+
+        self.registry.suggest_indexes(min_hits=3, create=True)
+        self.assertEqual(self.registry.suggest_indexes(min_hits=3), [])
+        plan = "\n".join(self.registry.explain(
+            namespace="planner.ns1", type=EntryType.PLUGIN, status=EntryStatus.REGISTERED
+        ))
+        self.assertIn("idx_namespace_", plan)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from registry_helpers import entry_factory
+from src.core.registry_engine import (
+    CHANGE_UPSERT,
+    ConsistentHashRing,
+    EntryType,
+    GEFSScore,
+    HyperRegistry,
+    ShardedStorageBackend,
+)
+
+
+_make_tool = entry_factory(EntryType.PLUGIN, "team0.tools", prefix="tool", digits=2)
+
+
+def make_entry(index, namespace=None):
+    return _make_tool(
+        index,
+        namespace or f"team{index % 6}.tools",
+        type=EntryType.PLUGIN if index % 2 else EntryType.THEME,
+        gefs_score=GEFSScore(quality=(index * 37) % 100),
+        metadata={"facets": {"layer": ["core" if index % 3 else "edge"]}},
+    )
+
+
+class ShardedRegistryTests(unittest.TestCase):
+    def setUp(self):
+        self.entries = [make_entry(i) for i in range(30)]
+        self.sharded = HyperRegistry(shards=4)
+        self.single = HyperRegistry()
+        for registry in (self.sharded, self.single):
+            registry.register_many([make_entry(i) for i in range(30)])
+
+    def tearDown(self):
+        self.sharded.storage.close()
+
+    def test_namespaces_route_consistently(self):
+        ring = ConsistentHashRing(4)
+        self.assertEqual(ring.node_for("team1.tools"), ConsistentHashRing(4).node_for("team1.tools"))
+        storage = self.sharded.storage
+        self.assertIsInstance(storage, ShardedStorageBackend)
+        used = {storage.ring.node_for(e.namespace) for e in self.entries}
+        self.assertGreater(len(used), 1)
+        for index, shard in enumerate(storage.shards):
+            namespaces = {row["namespace"] for row in shard.select(["namespace"])}
+            self.assertTrue(all(storage.ring.node_for(ns) == index for ns in namespaces))
+        self.assertEqual(storage.count(), 30)
+
+    def test_single_namespace_query_uses_one_shard(self):
+        storage = self.sharded.storage
+        home = storage.shard_for("team2.tools")
+        others = [shard for shard in storage.shards if shard is not home]
+        for shard in others:
+            shard.select = mock.Mock(side_effect=AssertionError("query left the namespace shard"))
+        found = self.sharded.search(namespace="team2.tools")
+        self.assertEqual(
+            sorted(e.id for e in found),
+            sorted(e.id for e in self.entries if e.namespace == "team2.tools"),
+        )
+
+    def test_cross_shard_results_match_single_database(self):
+        # Cross-shard results come back merged in id order
+        self.assertEqual(
+            [e.id for e in self.sharded.search(type=EntryType.PLUGIN)],
+            sorted(e.id for e in self.single.search(type=EntryType.PLUGIN)),
+        )
+        self.assertEqual(
+            self.sharded.select(["name", "version"]),
+            sorted(self.single.select(["name", "version", "id"]), key=lambda row: row.pop("id")),
+        )
+        self.assertEqual(
+            [r["id"] for r, _ in self.sharded.top_k({"quality": 1.0}, k=8, fields=["id"])],
+            [r["id"] for r, _ in self.single.top_k({"quality": 1.0}, k=8, fields=["id"])],
+        )
+        self.assertEqual(self.sharded.facet_counts(), self.single.facet_counts())
+        self.assertEqual(
+            self.sharded.storage.count(type=EntryType.THEME),
+            self.single.storage.count(type=EntryType.THEME),
+        )
+
+    def test_pages_merge_in_key_order(self):
+        seen, token = [], None
+        while True:
+            page, token = self.sharded.search_page(after=token, limit=7)
+            seen.extend(page)
+            if token is None:
+                break
+        keys = [(e.updated_at, e.id) for e in seen]
+        self.assertEqual(keys, sorted(keys))
+        self.assertEqual(sorted(e.id for e in seen), sorted(e.id for e in self.entries))
+
+    def test_namespace_change_moves_entry(self):
+        position = self.sharded.storage.last_change_seq()
+        moved = self.sharded.get("tool-01")
+        target = next(
+            ns for ns in (f"other{i}.tools" for i in range(50))
+            if self.sharded.storage.ring.node_for(ns)
+            != self.sharded.storage.ring.node_for(moved.namespace)
+        )
+        moved.namespace = target
+        self.sharded.update(moved)
+
+        self.assertEqual(self.sharded.storage.count(), 30)
+        self.assertEqual(self.sharded.storage.shard_for(target).load("tool-01")["namespace"], target)
+        changes = self.sharded.changes_since(position)
+        self.assertEqual([(c.entry_id, c.op) for c in changes], [("tool-01", CHANGE_UPSERT)])
+        self.assertEqual(len(changes[0].seq), 4)
+        self.assertEqual(self.sharded.changes_since(changes[-1].seq), [])
+
+    def test_delete_and_snapshot_across_shards(self):
+        self.assertTrue(self.sharded.delete("tool-04"))
+        self.assertIsNone(self.sharded.get("tool-04"))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / "sharded.snap")
+            self.assertEqual(self.sharded.export_snapshot(path, compression="gzip"), 29)
+            restored = HyperRegistry()
+            self.assertEqual(restored.import_snapshot(path).imported, 29)
+
+
+class ShardFileTests(unittest.TestCase):
+    def test_files_per_shard_and_layout_check(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / "registry.db")
+            registry = HyperRegistry(path, shards=3)
+            registry.register(make_entry(1))
+            registry.storage.close()
+            self.assertEqual(
+                sorted(p.name for p in Path(tmp).glob("registry.shard*.db")),
+                ["registry.shard0.db", "registry.shard1.db", "registry.shard2.db"],
+            )
+
+            reopened = HyperRegistry(path, shards=3)
+            self.assertEqual(reopened.get("tool-01").name, "Tool 1")
+            reopened.storage.close()
+
+            with self.assertRaises(ValueError):
+                HyperRegistry(path, shards=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import gzip
+import json
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest import mock
+
+from registry_helpers import entry_factory
+from src.core.registry_engine import (
+    SCHEMA_VERSION,
+    EntryStatus,
+    EntryType,
+    GEFSScore,
+    HyperRegistry,
+    open_snapshot,
+)
+
+
+_make_theme = entry_factory(EntryType.THEME, "snapshot.ns")
+
+
+def make_entry(index):
+    return _make_theme(
+        index,
+        tags=["dark", f"t{index}"],
+        dependencies=[f"theme-{index - 1}"] if index else [],
+        gefs_score=GEFSScore(quality=index),
+        metadata={"index": index},
+    )
+
+
+class SnapshotTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = str(Path(self.tmp.name) / "registry.snap")
+        self.registry = HyperRegistry()
+        self.registry.register_many([make_entry(i) for i in range(25)])
+        entry = self.registry.get("theme-3")
+        entry.status = EntryStatus.ACTIVE
+        self.registry.update(entry)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip_preserves_entries(self):
+        self.assertEqual(self.registry.export_snapshot(self.path, compression="gzip"), 25)
+
+        restored = HyperRegistry()
+        result = restored.import_snapshot(self.path, chunk_size=7)
+
+        self.assertTrue(result.ok)
+        self.assertEqual(result.imported, 25)
+        self.assertEqual(result.header["count"], 25)
+        self.assertEqual(result.header["schema"], SCHEMA_VERSION)
+        self.assertEqual(datetime.fromisoformat(result.header["created_at"]).tzinfo, timezone.utc)
+        for index in (0, 3, 24):
+            original = self.registry.get(f"theme-{index}")
+            self.assertEqual(
+                restored.get(f"theme-{index}").to_dict(), original.to_dict()
+            )
+        self.assertEqual(restored.get("theme-3").status, EntryStatus.ACTIVE)
+        self.assertEqual(restored.resolve_dependencies(restored.get("theme-2"))[0].id, "theme-0")
+
+    def test_records_stream_lazily(self):
+        self.registry.export_snapshot(self.path, compression="gzip")
+        with open_snapshot(self.path) as (header, records):
+            first = next(records)
+        self.assertEqual(header["columns"][0], "id")
+        self.assertIn(first["id"], {f"theme-{i}" for i in range(25)})
+
+    def test_rejects_foreign_file(self):
+        with gzip.open(self.path, "wt") as f:
+            json.dump([], f)
+        with self.assertRaises(ValueError):
+            HyperRegistry().import_snapshot(self.path)
+
+        Path(self.path).write_text("plain text")
+        with self.assertRaises(ValueError):
+            HyperRegistry().import_snapshot(self.path)
+
+    def test_rejects_newer_schema(self):
+        with mock.patch("src.core.registry_engine.SCHEMA_VERSION", SCHEMA_VERSION + 1):
+            self.registry.export_snapshot(self.path, compression="gzip")
+        restored = HyperRegistry()
+        with self.assertRaisesRegex(ValueError, "schema"):
+            restored.import_snapshot(self.path)
+        self.assertEqual(restored.storage.count(), 0)
+        with self.assertRaises(ValueError):
+            with open_snapshot(self.path):
+                pass
+
+    def test_truncated_snapshot_raises(self):
+        self.registry.export_snapshot(self.path, compression="gzip")
+        with gzip.open(self.path, "rb") as f:
+            data = f.read()
+        with gzip.open(self.path, "wb") as f:
+            f.write(data[:len(data) // 2])
+        with self.assertRaises(ValueError):
+            HyperRegistry().import_snapshot(self.path)
+
+    def test_file_backed_export_uses_consistent_snapshot(self):
+        registry = HyperRegistry(str(Path(self.tmp.name) / "registry.db"))
+        registry.register_many([make_entry(i) for i in range(10)])
+        self.assertEqual(registry.export_snapshot(self.path, compression="gzip"), 10)
+        self.assertFalse(Path(self.path + ".tmp").exists())
+
+        restored = HyperRegistry()
+        self.assertEqual(restored.import_snapshot(self.path).imported, 10)
+        self.assertEqual(restored.storage.count(), 10)
+        registry.storage.close()
+
+    def test_export_json_streams_valid_json(self):
+        json_path = Path(self.tmp.name) / "registry.json"
+        self.registry.storage.export_json(str(json_path))
+        entries = json.loads(json_path.read_text())
+        self.assertEqual(len(entries), 25)
+        self.assertEqual({e["namespace"] for e in entries}, {"snapshot.ns"})
+
+
+if __name__ == "__main__":
+    unittest.main()
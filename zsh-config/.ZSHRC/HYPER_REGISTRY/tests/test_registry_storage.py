@@ -0,0 +1,189 @@
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from registry_helpers import entry_factory
+from src.core.registry_engine import (
+    EntryType,
+    GEFSScore,
+    HyperRegistry,
+    StorageBackend,
+)
+
+
+make_entry = entry_factory(EntryType.SERVICE, "storage.ns")
+
+
+class FileBackedStorageTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.registry = HyperRegistry(str(Path(self.tmp.name) / "registry.db"))
+        self.storage = self.registry.storage
+
+    def tearDown(self):
+        self.storage.close()
+        self.tmp.cleanup()
+
+    def test_uses_wal_and_reader_pool(self):
+        mode = self.storage.conn.execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode.lower(), "wal")
+        self.assertIsNotNone(self.storage.readers)
+
+    def test_reads_do_not_wait_for_writer_lock(self):
+        self.registry.register(make_entry(1))
+        results = []
+
+        with self.storage.lock:
+            reader = threading.Thread(
+                target=lambda: results.append(self.storage.load("service-1"))
+            )
+            reader.start()
+            reader.join(timeout=2)
+            self.assertFalse(reader.is_alive())
+
+        self.assertEqual(results[0]["id"], "service-1")
+
+    def test_in_memory_storage_shares_writer_connection(self):
+        registry = HyperRegistry()
+        self.assertIsNone(registry.storage.readers)
+        registry.register(make_entry(2))
+        self.assertEqual(len(registry.search(namespace="storage.ns")), 1)
+
+
+
+class ColumnarSchemaTests(unittest.TestCase):
+    def setUp(self):
+        self.registry = HyperRegistry()
+
+    def test_entry_round_trips_through_columns(self):
+        entry = make_entry(1)
+        entry.tags = ["api", "core"]
+        entry.dependencies = ["service-0"]
+        entry.gefs_score = GEFSScore(quality=90.0, security=80.0)
+        entry.config = {"port": 8080}
+        self.registry.register(entry)
+        self.registry.cache.clear()
+
+        loaded = self.registry.get("service-1")
+
+        self.assertEqual(loaded.to_dict(), entry.to_dict())
+
+    @unittest.skipUnless(hasattr(time, "tzset"), "needs time.tzset")
+    def test_timestamps_round_trip_as_utc(self):
+        saved = os.environ.get("TZ")
+        os.environ["TZ"] = "America/New_York"
+        time.tzset()
+        try:
+            entry = make_entry(1)
+            entry.created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+            self.registry.register(entry)
+            naive = make_entry(2)
+            naive.created_at = datetime(2024, 1, 1)
+            self.registry.register(naive)
+            offset = make_entry(3)
+            offset.created_at = datetime(2024, 1, 1, 5, 30, tzinfo=timezone(timedelta(hours=5, minutes=30)))
+            self.registry.register(offset)
+            self.registry.cache.clear()
+
+            loaded = self.registry.get("service-1")
+            self.assertEqual(loaded.created_at, datetime(2024, 1, 1, tzinfo=timezone.utc))
+            self.assertEqual(loaded.created_at.utcoffset(), timedelta(0))
+            self.assertEqual(loaded.updated_at.tzinfo, timezone.utc)
+            self.assertEqual(
+                self.registry.get("service-3").created_at,
+                datetime(2024, 1, 1, tzinfo=timezone.utc),
+            )
+            # Naive values are local time
+            self.assertEqual(
+                self.registry.get("service-2").created_at,
+                datetime(2024, 1, 1, 5, tzinfo=timezone.utc),
+            )
+        finally:
+            if saved is None:
+                os.environ.pop("TZ", None)
+            else:
+                os.environ["TZ"] = saved
+            time.tzset()
+
+    def test_select_returns_only_requested_fields(self):
+        entry = make_entry(1)
+        entry.gefs_score = GEFSScore(quality=100.0)
+        self.registry.register(entry)
+
+        rows = self.registry.select(["id", "tags", "gefs_overall"], namespace="storage.ns")
+
+        self.assertEqual(rows, [{"id": "service-1", "tags": [], "gefs_overall": 25.0}])
+        with self.assertRaises(ValueError):
+            self.registry.select(["data"])
+
+    def test_same_version_under_another_id_is_rejected(self):
+        original = make_entry(1)
+        original.metadata = {"facets": {"tier": "core"}}
+        original.dependencies = ["service-0"]
+        self.registry.register(original)
+        position = self.registry.storage.last_change_seq()
+        clash = make_entry(1)
+        clash.id = "service-clash"
+
+        with self.assertRaises(ValueError):
+            self.registry.register(clash)
+        result = self.registry.register_many([clash])
+        self.assertEqual(list(result.errors), ["service-clash"])
+
+        self.registry.cache.clear()
+        self.assertEqual(self.registry.get("service-1").name, "Service 1")
+        self.assertIsNone(self.registry.get("service-clash"))
+        self.assertEqual(self.registry.facet_counts(), {"tier": {"core": 1}})
+        self.assertEqual(self.registry.storage.dependency_edges(), [("service-1", "service-0")])
+        self.assertEqual(self.registry.changes_since(position), [])
+
+        other = make_entry(2)
+        self.registry.register(other)
+        other.name = "Service 1"
+        with self.assertRaises(ValueError):
+            self.registry.update(other)
+
+    def test_resaving_an_entry_keeps_one_search_row(self):
+        self.registry.register(make_entry(1))
+        entry = make_entry(1)
+        entry.description = "renamed payments gateway"
+        self.registry.register(entry)
+        hits = self.registry.text_search("payments")
+        self.assertEqual([hit.entry.id for hit in hits], ["service-1"])
+        self.assertEqual(len(self.registry.text_search("Service")), 1)
+
+    def test_legacy_json_blob_table_is_migrated(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / "legacy.db")
+            data = make_entry(7).to_dict()
+            conn = sqlite3.connect(path)
+            conn.execute(
+                "CREATE TABLE registry (id TEXT PRIMARY KEY, namespace TEXT NOT NULL, "
+                "name TEXT NOT NULL, type TEXT NOT NULL, version TEXT NOT NULL, "
+                "status TEXT NOT NULL, created_at TEXT NOT NULL, updated_at TEXT NOT NULL, "
+                "data TEXT NOT NULL, UNIQUE(namespace, name, version))"
+            )
+            conn.execute(
+                "INSERT INTO registry VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (data["id"], data["namespace"], data["name"], data["type"], data["version"],
+                 data["status"], data["created_at"], data["updated_at"], json.dumps(data)),
+            )
+            conn.commit()
+            conn.close()
+
+            storage = StorageBackend(path)
+            try:
+                self.assertEqual(storage.load("service-7")["name"], "Service 7")
+                self.assertEqual(storage.count(namespace="storage.ns"), 1)
+            finally:
+                storage.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
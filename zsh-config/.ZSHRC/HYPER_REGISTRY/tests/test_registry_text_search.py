@@ -0,0 +1,61 @@
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT))
+
+from src.core.registry_engine import EntryStatus, EntryType, HyperRegistry, RegistryEntry
+
+
+class TextSearchTests(unittest.TestCase):
+    def setUp(self):
+        self.registry = HyperRegistry()
+        self.registry.register(RegistryEntry(
+            id="plugin-theme", name="Visual Theme Plugin", type=EntryType.PLUGIN,
+            namespace="ui.ns", version="1.0.0", author="alice",
+            description="Color schemes and gradients for the terminal",
+            tags=["visual", "theme"],
+        ))
+        self.registry.register(RegistryEntry(
+            id="service-metrics", name="Metrics Service", type=EntryType.SERVICE,
+            namespace="ops.ns", version="1.0.0", author="bob",
+            description="Exports visual dashboards of terminal metrics",
+            tags=["monitoring"],
+        ))
+
+    def test_prefix_match_ranks_name_hits_first(self):
+        hits = self.registry.text_search("visu")
+
+        self.assertEqual([hit.entry.id for hit in hits], ["plugin-theme", "service-metrics"])
+        self.assertLess(hits[0].score, hits[1].score)
+        self.assertIn("[", hits[0].snippet)
+
+    def test_filters_and_tags_combine_with_text(self):
+        hits = self.registry.text_search("terminal", namespace="ops.ns")
+        self.assertEqual([hit.entry.id for hit in hits], ["service-metrics"])
+
+        hits = self.registry.text_search("monitoring", type=EntryType.SERVICE)
+        self.assertEqual([hit.entry.id for hit in hits], ["service-metrics"])
+
+    def test_index_follows_updates_and_deletes(self):
+        entry = self.registry.get("plugin-theme")
+        entry.description = "Fonts only"
+        entry.status = EntryStatus.ACTIVE
+        self.registry.update(entry)
+        self.assertEqual([h.entry.id for h in self.registry.text_search("gradients")], [])
+
+        self.registry.delete("service-metrics")
+        self.assertEqual(self.registry.text_search("dashboards"), [])
+        self.assertEqual(len(self.registry.text_search("fonts")), 1)
+
+    def test_user_input_is_not_parsed_as_fts_syntax(self):
+        hits = self.registry.text_search('theme" (NOT')
+        self.assertEqual(hits, [])
+        hits = self.registry.text_search('"theme" -')
+        self.assertEqual([hit.entry.id for hit in hits], ["plugin-theme"])
+        self.assertEqual(self.registry.text_search("()"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+import sqlite3
+import unittest
+
+from registry_helpers import entry_factory
+from src.core.registry_engine import (
+    CHANGE_UPSERT,
+    EntryStatus,
+    EntryType,
+    HyperRegistry,
+)
+
+
+_make_plugin = entry_factory(EntryType.PLUGIN, "diff.ns")
+
+
+def make_entry(index, namespace="diff.ns"):
+    return _make_plugin(
+        index,
+        namespace,
+        dependencies=[f"plugin-{index - 1}"] if index else [],
+        metadata={"facets": {"layer": "core"}, "owner": "ops"},
+    )
+
+
+class StatementLog:
+    """Collect the SQL run on a connection through sqlite3's trace hook."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.statements = []
+        conn.set_trace_callback(self.statements.append)
+
+    def matching(self, prefix):
+        return [s for s in self.statements if s.lstrip().upper().startswith(prefix)]
+
+
+class UpdateDiffTests(unittest.TestCase):
+    def setUp(self):
+        self.registry = HyperRegistry()
+        self.registry.register_many([make_entry(i) for i in range(3)])
+        self.position = self.registry.storage.last_change_seq()
+
+    def test_unchanged_entry_writes_nothing(self):
+        entry = self.registry.get("plugin-1")
+        updated_at = entry.updated_at
+        version = self.registry.storage.version()
+
+        self.assertTrue(self.registry.update(entry))
+
+        self.assertEqual(self.registry.storage.version(), version)
+        self.assertEqual(self.registry.changes_since(self.position), [])
+        self.assertEqual(entry.updated_at, updated_at)
+
+    def test_status_change_updates_only_its_columns(self):
+        entry = self.registry.get("plugin-1")
+        entry.status = EntryStatus.ACTIVE
+        log = StatementLog(self.registry.storage.conn)
+        self.registry.update(entry)
+
+        updates = log.matching("UPDATE REGISTRY SET")
+        self.assertEqual(len(updates), 1)
+        self.assertRegex(updates[0], r"SET status = 'active', updated_at = \d+ WHERE")
+        self.assertEqual(log.matching("DELETE FROM REGISTRY_FACETS"), [])
+        self.assertEqual(log.matching("DELETE FROM REGISTRY_DEPENDENCIES"), [])
+
+        change, = self.registry.changes_since(self.position)
+        self.assertEqual(change.op, CHANGE_UPSERT)
+        self.assertEqual(change.diff, {"status": {"old": "registered", "new": "active"}})
+        self.assertEqual(change.entry["status"], "active")
+        self.registry.cache.clear()
+        self.assertEqual(self.registry.get("plugin-1").status, EntryStatus.ACTIVE)
+
+    def test_facet_rows_change_only_with_facets(self):
+        entry = self.registry.get("plugin-2")
+        entry.metadata["owner"] = "infra"
+        log = StatementLog(self.registry.storage.conn)
+        self.registry.update(entry)
+        self.assertEqual(log.matching("DELETE FROM REGISTRY_FACETS"), [])
+
+        entry.metadata["facets"]["layer"] = "edge"
+        self.registry.update(entry)
+        self.assertEqual(len(log.matching("DELETE FROM REGISTRY_FACETS")), 1)
+        self.assertEqual(self.registry.facet_counts()["layer"], {"core": 2, "edge": 1})
+
+        diffs = [c.diff for c in self.registry.changes_since(self.position)]
+        self.assertEqual(diffs[0]["metadata"]["new"]["owner"], "infra")
+        self.assertEqual(diffs[1]["metadata"]["old"]["facets"], {"layer": "core"})
+
+    def test_dependency_change_reindexes_graph(self):
+        entry = self.registry.get("plugin-2")
+        self.assertEqual([e.id for e in self.registry.resolve_dependencies(entry)], ["plugin-0", "plugin-1"])
+        entry.dependencies = ["plugin-0"]
+        self.registry.update(entry)
+        self.assertEqual([e.id for e in self.registry.resolve_dependencies(entry)], ["plugin-0"])
+        self.assertEqual(self.registry.storage.dependency_edges().count(("plugin-2", "plugin-0")), 1)
+
+    def test_missing_entry_raises(self):
+        with self.assertRaises(ValueError):
+            self.registry.update(make_entry(9))
+
+
+class ShardedUpdateDiffTests(unittest.TestCase):
+    def test_diff_logged_in_place_and_across_shards(self):
+        registry = HyperRegistry(shards=3)
+        registry.register_many([make_entry(i) for i in range(3)])
+        position = registry.storage.last_change_seq()
+        entry = registry.get("plugin-1")
+        entry.version = "1.1.0"
+        registry.update(entry)
+
+        ring = registry.storage.ring
+        entry.namespace = next(
+            ns for ns in (f"other{i}.ns" for i in range(50))
+            if ring.node_for(ns) != ring.node_for("diff.ns")
+        )
+        registry.update(entry)
+
+        diffs = [c.diff for c in registry.changes_since(position)]
+        self.assertEqual(diffs[0], {"version": {"old": "1.0.0", "new": "1.1.0"}})
+        self.assertEqual(diffs[1], {"namespace": {"old": "diff.ns", "new": entry.namespace}})
+        self.assertEqual(registry.storage.count(), 3)
+        registry.storage.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -368,6 +368,7 @@ class DynamicGrid:
         self.widgets: Dict[str, Dict] = {}
         self.layout_mode = "adaptive"  # adaptive, fixed, flow, masonry
         self.gap = 1  # cell gap
+        self._frame_buffer: List[List[str]] = []
         self.init_grid()
     
     def init_grid(self) -> None:
@@ -509,8 +510,14 @@ class DynamicGrid:
         """Render entire grid"""
         output = []
         
-        # Create frame buffer
-        frame_buffer = [[" " for _ in range(self.width)] for _ in range(self.height)]
+        # Reuse the frame buffer across frames, wiping it in place
+        frame_buffer = self._frame_buffer
+        if len(frame_buffer) != self.height or (frame_buffer and len(frame_buffer[0]) != self.width):
+            frame_buffer = self._frame_buffer = [[" "] * self.width for _ in range(self.height)]
+        else:
+            blank = [" "] * self.width
+            for row in frame_buffer:
+                row[:] = blank
         
         # Fill buffer with cell contents
         for y in range(self.height):